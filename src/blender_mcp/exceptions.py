@@ -92,3 +92,10 @@ class BlenderVSEError(BlenderMCPError):
     def __init__(self, operation: str, error: str):
         super().__init__(f"VSE operation '{operation}' failed: {error}", "VSE_ERROR")
         self.operation = operation
+
+
+class BlenderAtlasingError(BlenderMCPError):
+    """Raised when material or texture atlasing operations fail."""
+
+    def __init__(self, error: str):
+        super().__init__(error, "ATLASING_ERROR")
@@ -5,17 +5,27 @@ This module provides tools for downloading and importing assets from free Blende
 Supports multiple repositories including BlenderKit, Kenney Assets, Quaternius, Open Game Art, and more.
 """
 
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
 import logging
+import mmap
 import os
+import shutil
 import tarfile
 import tempfile
 import urllib.parse
-import urllib.request
 import zipfile
+from collections import defaultdict
+from collections.abc import Iterator
 from enum import StrEnum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import httpx
 from fastmcp import FastMCP
 
 from ..compat import *
@@ -67,149 +77,534 @@ class AssetFormat(StrEnum):
     ZIP = "zip"
 
 
+# Candidate main-file formats for Kenney kits, in order of preference
+_SUPPORTED_3D_FORMATS = (".blend", ".fbx", ".obj", ".gltf", ".glb")
+
+# Map file extensions to import_file formats
+_FORMAT_MAPPING = MappingProxyType(
+    {
+        "fbx": "FBX",
+        "obj": "OBJ",
+        "gltf": "GLTF",
+        "glb": "GLTF",
+        "dae": "COLLADA",
+        "abc": "ABC",
+        "ply": "PLY",
+        "stl": "STL",
+        "x3d": "X3D",
+    }
+)
+
+HTTP_HEADERS = {
+    "User-Agent": "blender-mcp-fleet/1.0 (+https://github.com/sandraschi/blender-mcp)",
+}
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Cap on concurrent GETs against a single host, shared by all downloads
+MAX_DOWNLOADS_PER_HOST = int(os.getenv("BLENDER_MCP_MAX_PER_HOST", "4"))
+
+# Files at least this large are fetched as concurrent byte ranges when the server allows it
+PARALLEL_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+PARALLEL_DOWNLOAD_PARTS = 4
+
+# Zip archives at least this large are memory-mapped before reading their central directory
+MMAP_MIN_ARCHIVE_SIZE = 32 * 1024 * 1024
+
+
+class _MappedFile(io.RawIOBase):
+    """Seekable read-only file object over an mmap (mmap.seekable() is 3.13+ only)."""
+
+    def __init__(self, mapping: mmap.mmap):
+        super().__init__()
+        self._mapping = mapping
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._mapping.tell()
+        elif whence == io.SEEK_END:
+            offset += len(self._mapping)
+        self._mapping.seek(offset)
+        return self._mapping.tell()
+
+    def tell(self) -> int:
+        return self._mapping.tell()
+
+    def read(self, size: int | None = -1) -> bytes:
+        return self._mapping.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._mapping.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+@contextlib.contextmanager
+def _open_zip(archive_path: Path) -> Iterator[zipfile.ZipFile]:
+    """Open a zip archive, memory-mapping it first when it is large."""
+    if archive_path.stat().st_size < MMAP_MIN_ARCHIVE_SIZE:
+        with zipfile.ZipFile(archive_path, "r") as zip_ref:
+            yield zip_ref
+        return
+
+    with (
+        open(archive_path, "rb") as fh,
+        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapping,
+        zipfile.ZipFile(_MappedFile(mapping), "r") as zip_ref,
+    ):
+        yield zip_ref
+
+
+def _sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, read in download-sized chunks."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _extract_archive_sync(archive_path: Path, extract_to: Path) -> list[str]:
+    """Extract a zip or tar archive and return the extracted paths.
+
+    Runs in a worker thread: zlib, bz2 and lzma release the GIL while they
+    decompress, so the event loop keeps serving requests.
+    """
+    extracted_files = []
+    extract_root = os.fspath(extract_to)
+
+    if archive_path.suffix == ".zip":
+        with _open_zip(archive_path) as zip_ref:
+            infos = zip_ref.infolist()
+            extracted_files = [os.path.join(extract_root, i.filename) for i in infos]
+
+            # Create every destination directory once up front so per-member
+            # extraction does not repeat the mkdir checks for large kits.
+            # Names escaping the root are left to ZipFile.extract to sanitize;
+            # commonpath compares whole components, so "root_evil" is not under "root".
+            root = os.path.normpath(extract_root)
+            parent_dirs = {
+                os.path.dirname(path)
+                for info, path in zip(infos, extracted_files, strict=True)
+                if not info.is_dir() and os.path.commonpath([root, os.path.normpath(path)]) == root
+            }
+            for directory in parent_dirs:
+                os.makedirs(directory, exist_ok=True)
+
+            for info in infos:
+                zip_ref.extract(info, extract_root)
+
+    elif archive_path.suffixes[-2:] in ([".tar", ".gz"], [".tar", ".bz2"], [".tar", ".xz"]):
+        with tarfile.open(archive_path, "r:*") as tar_ref:
+            # Read the member index once and reuse it for extraction and the result list
+            members = tar_ref.getmembers()
+            tar_ref.extractall(extract_to, members=members)
+            extracted_files = [os.path.join(extract_root, m.name) for m in members]
+
+    return extracted_files
+
+
+class _RangeMismatchError(Exception):
+    """A byte-range response did not carry exactly the requested range."""
+
+
+def _group_by_suffix(files: list[str]) -> dict[str, list[str]]:
+    """Bucket file paths by lower-cased extension in a single pass."""
+    by_ext: defaultdict[str, list[str]] = defaultdict(list)
+    for f in files:
+        by_ext[os.path.splitext(f)[1].lower()].append(f)
+    return by_ext
+
+
 class RepositoryManager:
     """Manages asset downloads from various repositories."""
 
+    MANIFEST_FILENAME = "manifest.json"
+
     def __init__(self):
         self.temp_dir = Path(tempfile.gettempdir()) / "blender_mcp_assets"
         self.temp_dir.mkdir(exist_ok=True)
+        self.manifest_path = self.temp_dir / self.MANIFEST_FILENAME
+        self._manifest = self._load_manifest()
+        self._host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(MAX_DOWNLOADS_PER_HOST)
+        )
 
-    def _download_file(self, url: str, filename: str) -> str:
-        """Download a file from URL and return the local path."""
+    def _load_manifest(self) -> dict[str, Any]:
+        """Load the persisted asset manifest, falling back to an empty one."""
+        manifest: dict[str, Any] = {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                manifest = data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable asset manifest %s: %s", self.manifest_path, e)
+
+        for section in ("assets", "downloads", "hashes"):
+            if not isinstance(manifest.get(section), dict):
+                manifest[section] = {}
+        return manifest
+
+    def _save_manifest(self) -> None:
+        """Atomically rewrite the manifest so a crash never leaves it half-written."""
+        tmp_path = self.manifest_path.with_name(self.MANIFEST_FILENAME + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning("Failed to write asset manifest %s: %s", self.manifest_path, e)
+
+    @staticmethod
+    def _manifest_key(repository: str, asset_name: str, variant: str = "") -> str:
+        """Build the manifest key for a (repository, asset, type) triple."""
+        return f"{repository}:{asset_name}:{variant}"
+
+    def _get_cached_asset(self, key: str) -> tuple[str, list[str]] | None:
+        """Return a previously extracted asset if all of its files are still on disk."""
+        entry = self._manifest["assets"].get(key)
+        if not entry:
+            return None
+
+        main_file = entry.get("main")
+        files = entry.get("files", [])
+        if main_file and os.path.exists(main_file) and all(os.path.exists(f) for f in files):
+            logger.info("Asset cache hit for %s", key)
+            return main_file, files
+
+        # Stale entry - files were cleaned up since the last run
+        del self._manifest["assets"][key]
+        return None
+
+    def _remember_asset(self, key: str, main_file: str | os.PathLike, files: list[str]) -> tuple[str, list[str]]:
+        """Record a successfully fetched asset in the manifest and return it."""
+        main_file = os.fspath(main_file)
+        self._manifest["assets"][key] = {"main": main_file, "files": files}
+        self._save_manifest()
+        return main_file, files
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to the host of *url*."""
+        return self._host_semaphores[urllib.parse.urlsplit(url).netloc]
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Create the async HTTP client used for a single asset download."""
+        return httpx.AsyncClient(timeout=120.0, headers=HTTP_HEADERS, follow_redirects=True)
+
+    def _forget_hashes_for(self, path: Path) -> None:
+        """Drop every manifest hash entry pointing at *path* before its contents change."""
+        hashes = self._manifest["hashes"]
+        for digest in [digest for digest, known in hashes.items() if known == str(path)]:
+            del hashes[digest]
+
+    async def _link_known_file(self, sha256: str, local_path: Path) -> bool:
+        """Hard-link (or copy) an already downloaded file with the same hash into place.
+
+        The known file is re-hashed first, so one modified on disk since it was
+        recorded is never passed off as a verified download.
+        """
+        known = self._manifest["hashes"].get(sha256)
+        if not known or not os.path.exists(known):
+            return False
+        if await asyncio.to_thread(_sha256_file, Path(known)) != sha256:
+            logger.warning("%s no longer matches sha256 %s, downloading again", known, sha256)
+            del self._manifest["hashes"][sha256]
+            return False
+        if local_path.exists() and os.path.samefile(known, local_path):
+            return True
+
+        local_path.unlink(missing_ok=True)
+        try:
+            os.link(known, local_path)
+        except OSError:
+            # Cross-device or no hard-link support on this filesystem
+            shutil.copyfile(known, local_path)
+        logger.info("Reused %s for %s (sha256 %s)", known, local_path, sha256)
+        return True
+
+    async def _download_file(self, url: str, filename: str, expected_sha256: str | None = None) -> Path:
+        """Download a file from URL and return the local path.
+
+        Validators (ETag / Last-Modified) from the previous download of the same
+        URL are sent as a conditional request, so an unchanged file costs a
+        304 round-trip instead of a full re-download.
+
+        The body is SHA-256 hashed while it streams to disk. When *expected_sha256*
+        is given, a mismatch raises, and a file already downloaded with that hash
+        is linked into place instead of being fetched again.
+        """
         local_path = self.temp_dir / filename
+        if expected_sha256:
+            expected_sha256 = expected_sha256.lower()
+            if await self._link_known_file(expected_sha256, local_path):
+                return local_path
+
+        cached = self._manifest["downloads"].get(url)
+        # The hash entry is dropped whenever the file is rewritten, so a file since
+        # overwritten by another download is never revalidated as this URL's body
+        conditional = bool(
+            cached
+            and (cached.get("etag") or cached.get("last_modified"))
+            and cached.get("path") == str(local_path)
+            and self._manifest["hashes"].get(cached.get("sha256")) == str(local_path)
+            and local_path.exists()
+        )
+
+        request_headers = {}
+        if conditional:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
 
         try:
-            logger.info(f"Downloading from {url} to {local_path}")
-            with urllib.request.urlopen(url) as response:
-                with open(local_path, "wb") as f:
-                    f.write(response.read())
+            logger.info("Downloading from %s to %s", url, local_path)
+            async with self._http_client() as client:
+                # Revalidating is cheaper than any transfer, so only fresh downloads go parallel
+                headers = None if conditional else await self._download_file_parallel(client, url, local_path)
+                if headers is not None:
+                    # Ranges arrive out of order, so hash the assembled file in one sequential read
+                    digest = await asyncio.to_thread(_sha256_file, local_path)
+                else:
+                    sha = hashlib.sha256()
+                    async with (
+                        self._host_semaphore(url),
+                        client.stream("GET", url, headers=request_headers) as response,
+                    ):
+                        if response.status_code == 304:
+                            if expected_sha256 and await asyncio.to_thread(_sha256_file, local_path) != expected_sha256:
+                                raise Exception(f"Checksum mismatch for unchanged {filename}")
+                            logger.info("%s not modified since last download, reusing %s", filename, local_path)
+                            return local_path
+                        response.raise_for_status()
+                        # Unlink first so a hard-linked copy elsewhere is never truncated in place
+                        self._forget_hashes_for(local_path)
+                        local_path.unlink(missing_ok=True)
+                        with open(local_path, "wb") as f:
+                            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                                sha.update(chunk)
+                        headers = response.headers
+                    digest = sha.hexdigest()
+
+            if expected_sha256 and digest != expected_sha256:
+                local_path.unlink(missing_ok=True)
+                raise Exception(f"Checksum mismatch for {filename}: expected {expected_sha256}, got {digest}")
+
+            self._manifest["downloads"][url] = {
+                "path": str(local_path),
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "sha256": digest,
+            }
+            self._manifest["hashes"][digest] = str(local_path)
+            self._save_manifest()
 
-            logger.info(f"Successfully downloaded {filename}")
-            return str(local_path)
+            logger.info("Successfully downloaded %s", filename)
+            return local_path
 
         except Exception as e:
-            logger.error(f"Failed to download {url}: {e!s}")
+            logger.error("Failed to download %s: %s", url, e)
             raise Exception(f"Download failed: {e!s}") from e
 
-    def _extract_archive(self, archive_path: str, extract_to: str) -> list[str]:
-        """Extract archive and return list of extracted files."""
-        extracted_files = []
-
+    async def _download_file_parallel(
+        self, client: httpx.AsyncClient, url: str, local_path: Path, parts: int = PARALLEL_DOWNLOAD_PARTS
+    ) -> httpx.Headers | None:
+        """Download a large file as concurrent byte-range requests.
+
+        Returns the response headers of the HEAD probe on success, or None when the
+        file is too small, the server does not support ranges, or any range fails or
+        comes back different from the one requested - the caller then falls back to a
+        single-stream download.
+        """
+        host_semaphore = self._host_semaphore(url)
         try:
-            if archive_path.endswith(".zip"):
-                with zipfile.ZipFile(archive_path, "r") as zip_ref:
-                    zip_ref.extractall(extract_to)
-                    extracted_files = [os.path.join(extract_to, f) for f in zip_ref.namelist()]
-
-            elif archive_path.endswith((".tar.gz", ".tar.bz2", ".tar.xz")):
-                with tarfile.open(archive_path, "r:*") as tar_ref:
-                    tar_ref.extractall(extract_to)
-                    extracted_files = [os.path.join(extract_to, m.name) for m in tar_ref.getmembers()]
-
-            logger.info(f"Extracted {len(extracted_files)} files from {archive_path}")
+            async with host_semaphore:
+                head = await client.head(url)
+            head.raise_for_status()
+        except httpx.HTTPError:
+            return None
+
+        headers = head.headers
+        size = int(headers.get("Content-Length") or 0)
+        if headers.get("Accept-Ranges", "").lower() != "bytes" or size < PARALLEL_DOWNLOAD_MIN_SIZE:
+            return None
+
+        part_size = -(-size // parts)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        # Preallocate so each range can be written in place
+        self._forget_hashes_for(local_path)
+        local_path.unlink(missing_ok=True)
+        with open(local_path, "wb") as f:
+            f.truncate(size)
+
+        async def fetch_range(start: int, end: int) -> None:
+            async with (
+                host_semaphore,
+                client.stream("GET", url, headers={"Range": f"bytes={start}-{end}"}) as response,
+            ):
+                content_range = response.headers.get("Content-Range", "")
+                if response.status_code != 206 or content_range != f"bytes {start}-{end}/{size}":
+                    raise _RangeMismatchError(f"expected bytes {start}-{end}/{size}, got {content_range!r}")
+                written = 0
+                with open(local_path, "r+b") as f:
+                    f.seek(start)
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > end - start + 1:
+                            raise _RangeMismatchError(f"range {start}-{end} returned too many bytes")
+                        f.write(chunk)
+                if written != end - start + 1:
+                    raise _RangeMismatchError(f"range {start}-{end} returned {written} bytes")
+
+        # A TaskGroup cancels the sibling ranges as soon as one fails
+        failed = False
+        try:
+            async with asyncio.TaskGroup() as group:
+                for start, end in ranges:
+                    group.create_task(fetch_range(start, end))
+        except* (httpx.HTTPError, _RangeMismatchError) as errors:
+            logger.info("Ranged download of %s failed (%s), using a single stream", url, errors.exceptions[0])
+            failed = True
+        if failed:
+            local_path.unlink(missing_ok=True)
+            return None
+
+        logger.info("Downloaded %s bytes from %s in %s parallel parts", size, url, len(ranges))
+        return headers
+
+    async def _extract_archive(self, archive_path: Path, extract_to: Path) -> list[str]:
+        """Extract archive in a worker thread and return list of extracted files."""
+        try:
+            extracted_files = await asyncio.to_thread(_extract_archive_sync, archive_path, extract_to)
+            logger.info("Extracted %s files from %s", len(extracted_files), archive_path)
             return extracted_files
 
         except Exception as e:
-            logger.error(f"Failed to extract {archive_path}: {e!s}")
+            logger.error("Failed to extract %s: %s", archive_path, e)
             raise Exception(f"Extraction failed: {e!s}") from e
 
-    def get_kenney_asset(self, asset_name: str, asset_type: str = "3d") -> tuple[str, list[str]]:
+    async def get_kenney_asset(self, asset_name: str, asset_type: str = "3d") -> tuple[str, list[str]]:
         """Download an asset from Kenney.nl."""
+        key = self._manifest_key(AssetRepository.KENNEY, asset_name, asset_type)
+        cached = self._get_cached_asset(key)
+        if cached:
+            return cached
+
         # Kenney assets follow a predictable URL pattern
         base_url = f"https://kenney.nl/assets/{asset_name}"
         zip_url = f"{base_url}/{asset_name}.zip"
 
         try:
             # Download the zip file
-            local_zip = self._download_file(zip_url, f"{asset_name}.zip")
+            local_zip = await self._download_file(zip_url, f"{asset_name}.zip")
 
             # Extract it
-            extract_dir = str(self.temp_dir / asset_name)
-            extracted_files = self._extract_archive(local_zip, extract_dir)
+            extracted_files = await self._extract_archive(local_zip, self.temp_dir / asset_name)
 
-            # Find Blender files (.blend)
-            blend_files = [f for f in extracted_files if f.endswith(".blend")]
+            by_ext = _group_by_suffix(extracted_files)
 
-            if blend_files:
-                return blend_files[0], extracted_files
-            else:
-                # Look for other 3D formats
-                supported_formats = [".fbx", ".obj", ".gltf", ".glb"]
-                for fmt in supported_formats:
-                    model_files = [f for f in extracted_files if f.endswith(fmt)]
-                    if model_files:
-                        return model_files[0], extracted_files
+            # Prefer Blender files (.blend), then other 3D formats
+            for fmt in _SUPPORTED_3D_FORMATS:
+                model_files = by_ext.get(fmt)
+                if model_files:
+                    return self._remember_asset(key, model_files[0], extracted_files)
 
-                raise Exception(f"No supported 3D files found in {asset_name}")
+            raise Exception(f"No supported 3D files found in {asset_name}")
 
         except Exception as e:
             raise Exception(f"Failed to get Kenney asset {asset_name}: {e!s}") from e
 
-    def get_quaternius_asset(self, asset_name: str) -> tuple[str, list[str]]:
+    async def get_quaternius_asset(self, asset_name: str) -> tuple[str, list[str]]:
         """Download an asset from Quaternius.com."""
+        key = self._manifest_key(AssetRepository.QUATERNIUS, asset_name)
+        cached = self._get_cached_asset(key)
+        if cached:
+            return cached
+
         # Quaternius assets are typically in zip files
         base_url = f"https://quaternius.com/packs/{asset_name}"
         zip_url = f"{base_url}.zip"
 
         try:
-            local_zip = self._download_file(zip_url, f"{asset_name}.zip")
-            extract_dir = str(self.temp_dir / asset_name)
-            extracted_files = self._extract_archive(local_zip, extract_dir)
+            local_zip = await self._download_file(zip_url, f"{asset_name}.zip")
+            extracted_files = await self._extract_archive(local_zip, self.temp_dir / asset_name)
+
+            by_ext = _group_by_suffix(extracted_files)
 
             # Find Blender files
-            blend_files = [f for f in extracted_files if f.endswith(".blend")]
+            blend_files = by_ext.get(".blend")
             if blend_files:
-                return blend_files[0], extracted_files
+                return self._remember_asset(key, blend_files[0], extracted_files)
 
             # Look for FBX files (common format for Quaternius)
-            fbx_files = [f for f in extracted_files if f.endswith(".fbx")]
+            fbx_files = by_ext.get(".fbx")
             if fbx_files:
-                return fbx_files[0], extracted_files
+                return self._remember_asset(key, fbx_files[0], extracted_files)
 
             raise Exception(f"No supported files found in {asset_name}")
 
         except Exception as e:
             raise Exception(f"Failed to get Quaternius asset {asset_name}: {e!s}") from e
 
-    def get_opengameart_asset(self, asset_url: str) -> tuple[str, list[str]]:
-        """Download an asset from OpenGameArt.org."""
+    async def get_opengameart_asset(self, asset_url: str, sha256: str | None = None) -> tuple[str, list[str]]:
+        """Download an asset from OpenGameArt.org, optionally verifying its SHA-256."""
+        key = self._manifest_key(AssetRepository.OPEN_GAME_ART, asset_url)
+        cached = self._get_cached_asset(key)
+        if cached:
+            return cached
+
         try:
             # Extract filename from URL
             filename = asset_url.split("/")[-1]
             if not filename:
                 filename = "opengameart_asset.zip"
 
-            local_file = self._download_file(asset_url, filename)
+            local_file = await self._download_file(asset_url, filename, expected_sha256=sha256)
 
             # If it's an archive, extract it
-            if filename.endswith((".zip", ".tar.gz", ".tar.bz2")):
-                extract_dir = str(self.temp_dir / filename.replace(".", "_"))
-                extracted_files = self._extract_archive(local_file, extract_dir)
-                return extracted_files[0] if extracted_files else local_file, extracted_files
+            if local_file.suffix == ".zip" or local_file.suffixes[-2:] in ([".tar", ".gz"], [".tar", ".bz2"]):
+                extract_dir = self.temp_dir / filename.replace(".", "_")
+                extracted_files = await self._extract_archive(local_file, extract_dir)
+                return self._remember_asset(key, extracted_files[0] if extracted_files else local_file, extracted_files)
             else:
-                return local_file, [local_file]
+                return self._remember_asset(key, local_file, [os.fspath(local_file)])
 
         except Exception as e:
             raise Exception(f"Failed to get OpenGameArt asset from {asset_url}: {e!s}") from e
 
-    def get_polyhaven_asset(self, asset_name: str, asset_type: str = "hdris") -> tuple[str, list[str]]:
+    async def get_polyhaven_asset(self, asset_name: str, asset_type: str = "hdris") -> tuple[str, list[str]]:
         """Download an asset from Poly Haven."""
+        key = self._manifest_key(AssetRepository.POLY_HAVEN, asset_name, asset_type)
+        cached = self._get_cached_asset(key)
+        if cached:
+            return cached
+
         base_url = f"https://dl.polyhaven.org/file/ph-assets/{asset_type}/{asset_name}"
 
         try:
             if asset_type == "hdris":
                 # HDRIs are typically in HDR format
                 hdr_url = f"{base_url}/hdri/4k/{asset_name}_4k.hdr"
-                local_file = self._download_file(hdr_url, f"{asset_name}_4k.hdr")
-                return local_file, [local_file]
+                local_file = await self._download_file(hdr_url, f"{asset_name}_4k.hdr")
+                return self._remember_asset(key, local_file, [os.fspath(local_file)])
 
             elif asset_type == "textures":
                 # Textures are usually in ZIP format
                 zip_url = f"{base_url}/blender/{asset_name}_blender.zip"
-                local_zip = self._download_file(zip_url, f"{asset_name}_blender.zip")
-                extract_dir = str(self.temp_dir / asset_name)
-                extracted_files = self._extract_archive(local_zip, extract_dir)
-                return extracted_files[0], extracted_files
+                local_zip = await self._download_file(zip_url, f"{asset_name}_blender.zip")
+                extracted_files = await self._extract_archive(local_zip, self.temp_dir / asset_name)
+                return self._remember_asset(key, extracted_files[0], extracted_files)
 
             else:
                 raise Exception(f"Unsupported Poly Haven asset type: {asset_type}")
@@ -238,7 +633,7 @@ async def download_and_import_asset(
         repository_specific_params: Additional parameters for specific repositories
             - For Kenney: {"type": "3d|2d|music|sound"}
             - For Poly Haven: {"type": "hdris|textures|models"}
-            - For OpenGameArt: {"url": "full_download_url"}
+            - For OpenGameArt: {"url": "full_download_url", "sha256": "optional_checksum"}
         import_options: Options for importing the downloaded asset
             - format: File format (blend, fbx, obj, gltf, etc.)
             - scale: Import scale factor
@@ -254,15 +649,15 @@ async def download_and_import_asset(
         repository_specific_params = repository_specific_params or {}
         import_options = import_options or {}
 
-        logger.info(f"Downloading asset '{asset_name}' from {repository.value}")
+        logger.info("Downloading asset '%s' from %s", asset_name, repository.value)
 
         # Download the asset based on repository
         if repository == AssetRepository.KENNEY:
             asset_type = repository_specific_params.get("type", "3d")
-            asset_file, all_files = repo_manager.get_kenney_asset(asset_name, asset_type)
+            asset_file, all_files = await repo_manager.get_kenney_asset(asset_name, asset_type)
 
         elif repository == AssetRepository.QUATERNIUS:
-            asset_file, all_files = repo_manager.get_quaternius_asset(asset_name)
+            asset_file, all_files = await repo_manager.get_quaternius_asset(asset_name)
 
         elif repository == AssetRepository.OPEN_GAME_ART:
             asset_url = repository_specific_params.get("url")
@@ -271,11 +666,13 @@ async def download_and_import_asset(
                     "status": "ERROR",
                     "error": "OpenGameArt requires 'url' parameter with download link",
                 }
-            asset_file, all_files = repo_manager.get_opengameart_asset(asset_url)
+            asset_file, all_files = await repo_manager.get_opengameart_asset(
+                asset_url, repository_specific_params.get("sha256")
+            )
 
         elif repository == AssetRepository.POLY_HAVEN:
             asset_type = repository_specific_params.get("type", "hdris")
-            asset_file, all_files = repo_manager.get_polyhaven_asset(asset_name, asset_type)
+            asset_file, all_files = await repo_manager.get_polyhaven_asset(asset_name, asset_type)
 
         elif repository == AssetRepository.BLENDERKIT:
             return {
@@ -292,7 +689,7 @@ async def download_and_import_asset(
         else:
             return {"status": "ERROR", "error": f"Unsupported repository: {repository}"}
 
-        logger.info(f"Downloaded asset to: {asset_file}")
+        logger.info("Downloaded asset to: %s", asset_file)
 
         # Determine file format for import
         file_ext = Path(asset_file).suffix.lower().lstrip(".")
@@ -319,7 +716,7 @@ async def download_and_import_asset(
         return import_result
 
     except Exception as e:
-        logger.error(f"Failed to download and import asset: {e!s}")
+        logger.error("Failed to download and import asset: %s", e)
         return {
             "status": "ERROR",
             "error": str(e),
@@ -349,20 +746,7 @@ async def import_scene_asset(asset_file: str, file_format: str, import_options:
     """Import a scene asset using import_scene operators."""
     from .import_handler import import_file
 
-    # Map file extensions to import formats
-    format_mapping = {
-        "fbx": "FBX",
-        "obj": "OBJ",
-        "gltf": "GLTF",
-        "glb": "GLTF",
-        "dae": "COLLADA",
-        "abc": "ABC",
-        "ply": "PLY",
-        "stl": "STL",
-        "x3d": "X3D",
-    }
-
-    import_format = format_mapping.get(file_format.lower())
+    import_format = _FORMAT_MAPPING.get(file_format.lower())
     if not import_format:
         return {"status": "ERROR", "error": f"Unsupported file format: {file_format}"}
 
@@ -4,125 +4,304 @@ Provides tools for merging multiple materials and textures into atlas textures
 to reduce draw calls and optimize performance for VR platforms.
 """
 
+import asyncio
+import contextlib
 import logging
-from typing import Any
+import os
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
+from typing import Any, Literal, cast, overload
 
 from ..decorators import blender_operation
 
 logger = logging.getLogger(__name__)
 from ..exceptions import BlenderAtlasingError
-from ..utils.blender_executor import get_blender_executor
+from ..utils.blender_executor import bind_script, get_blender_executor
 
-# Initialize the executor with default Blender executable
-_executor = get_blender_executor()
+try:
+    import numpy as np
 
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-@blender_operation("create_material_atlas")
-async def create_material_atlas(
-    target_mesh: str | None = None,
-    atlas_size: int = 2048,
-    padding: int = 4,
-    output_path: str = "//material_atlas.png",
-    combine_similar: bool = True,
-) -> dict[str, Any]:
-    """
-    Create a material atlas by combining multiple materials into a single texture.
+try:
+    from PIL import Image
 
-    This reduces draw calls by merging material textures into atlas maps,
-    critical for mobile VR performance optimization.
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
 
-    Args:
-        target_mesh: Target mesh object (defaults to active)
-        atlas_size: Size of the atlas texture (512, 1024, 2048, 4096)
-        padding: Padding between atlas regions in pixels
-        output_path: Path to save the atlas texture
-        combine_similar: Whether to merge materials with similar properties
+_loads: Callable[[str | bytes], Any]
+try:
+    # orjson decodes RESULT_JSON payloads several times faster than the stdlib
+    import orjson
 
-    Returns:
-        Atlas creation result with texture mapping information
+    _loads = orjson.loads
+except ImportError:
+    import json
 
-    Raises:
-        BlenderAtlasingError: If atlas creation fails
-    """
-    logger.info(f"Creating material atlas (size: {atlas_size}, padding: {padding})")
+    _loads = json.loads
 
-    try:
-        script = f"""
+# Initialize the executor with default Blender executable
+_executor = get_blender_executor()
+
+
+# Blender scripts are constant text built once at import; arguments travel separately as
+# JSON (see bind_script), so user strings cannot break out of the script.
+# Every script reports back through a single RESULT_JSON line (see _run_script).
+_CREATE_MATERIAL_ATLAS_SCRIPT = Template(
+    """
 import bpy
+import json
 import math
 
+P = json.loads($params)
+
 # Get target mesh
-mesh_name = {target_mesh!r}
+mesh_name = P["target_mesh"]
 if mesh_name:
     mesh = bpy.data.objects.get(mesh_name)
 else:
     mesh = bpy.context.active_object
 
 if not mesh or mesh.type != 'MESH':
-    print("ERROR: No valid mesh object selected")
-    exit(1)
-
-print(f"MESH: {{mesh.name}}")
+    print("RESULT_JSON:" + json.dumps({"error": "No valid mesh object selected"}))
+    exit(0)
 
 # Analyze materials
 materials = mesh.data.materials
 material_count = len(materials)
-print(f"MATERIALS: {{material_count}}")
 
 if material_count <= 1:
-    print("INFO: Mesh already has minimal materials")
-    print("ATLAS_CREATED: false")
+    print("RESULT_JSON:" + json.dumps({"mesh": mesh.name, "materials": material_count, "atlas_created": False}))
     exit(0)
 
 # Calculate atlas layout (simple grid)
 cols = math.ceil(math.sqrt(material_count))
 rows = math.ceil(material_count / cols)
 
-region_size = ({atlas_size} - {padding} * (cols + 1)) // cols
-print(f"ATLAS_LAYOUT: {{cols}}x{{rows}}, region_size={{region_size}}")
+region_size = (P["atlas_size"] - P["padding"] * (cols + 1)) // cols
 
 # Create atlas image
-atlas_name = f"{{mesh.name}}_MaterialAtlas"
-atlas_image = bpy.data.images.new(atlas_name, width={atlas_size}, height={atlas_size})
+atlas_name = f"{mesh.name}_MaterialAtlas"
+atlas_image = bpy.data.images.new(atlas_name, width=P["atlas_size"], height=P["atlas_size"])
 
 # Store atlas info on mesh
-atlas_info = {{
-    "atlas_size": {atlas_size},
-    "padding": {padding},
+atlas_info = {
+    "atlas_size": P["atlas_size"],
+    "padding": P["padding"],
     "cols": cols,
     "rows": rows,
     "region_size": region_size,
     "material_count": material_count,
     "materials": [mat.name for mat in materials if mat]
-}}
+}
+
+mesh["material_atlas"] = json.dumps(atlas_info)
+
+print("RESULT_JSON:" + json.dumps({
+    "mesh": mesh.name,
+    "materials": material_count,
+    "atlas_created": True,
+    "atlas_layout": f"{cols}x{rows}, region_size={region_size}",
+    "atlas_info": atlas_info,
+}))
+"""
+)
+
+
+_MERGE_TEXTURE_ATLAS_SCRIPT = Template(
+    """
+import bpy
+import json
+import os
+
+P = json.loads($params)
+texture_list = P["texture_paths"]
+
+if not texture_list:
+    print("RESULT_JSON:" + json.dumps({"error": "No texture paths provided"}))
+    exit(0)
 
-mesh["material_atlas"] = str(atlas_info)
+# Load and validate textures
+loaded_images = []
+loaded = []
+for index, tex_path in enumerate(texture_list):
+    try:
+        # Reuse an image already loaded from the same file rather than decoding it again
+        img = bpy.data.images.load(tex_path, check_existing=True)
+        loaded_images.append(img)
+        loaded.append({
+            "index": index,
+            "name": os.path.basename(tex_path),
+            "size": list(img.size),
+            "path": bpy.path.abspath(img.filepath),
+        })
+    except Exception as e:
+        print(f"WARNING: Failed to load {tex_path}: {e}")
+
+if not loaded_images:
+    print("RESULT_JSON:" + json.dumps({"error": "No textures could be loaded"}))
+    exit(0)
 
-print(f"ATLAS_INFO: {{atlas_info}}")
-print("SUCCESS: Material atlas prepared")
+# Only the sizes are reported: regions are packed, and the atlas written, on the host
+print("RESULT_JSON:" + json.dumps({"loaded": loaded, "textures": [img.name for img in loaded_images]}))
 """
+)
+
+
+_OPTIMIZE_DRAW_CALLS_SCRIPT = Template(
+    """
+import bpy
+import json
+
+P = json.loads($params)
+max_materials = P["max_materials"]
+
+# Get target mesh
+mesh_name = P["target_mesh"]
+if mesh_name:
+    mesh = bpy.data.objects.get(mesh_name)
+else:
+    mesh = bpy.context.active_object
+
+if not mesh or mesh.type != 'MESH':
+    print("RESULT_JSON:" + json.dumps({"error": "No valid mesh object selected"}))
+    exit(0)
+
+# Analyze current material usage
+materials = mesh.data.materials
+initial_count = len(materials)
+
+if initial_count <= max_materials:
+    print("RESULT_JSON:" + json.dumps({"mesh": mesh.name, "initial_materials": initial_count, "optimized": False}))
+    exit(0)
+
+# Report each material's base colour; grouping them is done on the host
+colors = []
+for mat in materials:
+    principled = (
+        next((n for n in mat.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        if mat and mat.node_tree
+        else None
+    )
+    try:
+        colors.append(list(principled.inputs['Base Color'].default_value[:3]))
+    except (AttributeError, KeyError):
+        # Unreadable colours are left out of the grouping
+        colors.append(None)
+
+# Store optimization info
+opt_info = {
+    "initial_materials": initial_count,
+    "max_materials": max_materials,
+    "combine_by_color": P["combine_by_color"],
+    "preserve_normals": P["preserve_normals"]
+}
+
+mesh["draw_call_optimization"] = json.dumps(opt_info)
+
+print("RESULT_JSON:" + json.dumps({
+    "mesh": mesh.name,
+    "optimized": True,
+    "colors": colors,
+    **opt_info,
+}))
+"""
+)
+
+
+_ATLAS_UV_LAYOUT_SCRIPT = """
+import ast
+import bpy
+import json
+
+# Get target mesh
+mesh = bpy.context.active_object
+if not mesh or mesh.type != 'MESH':
+    print("RESULT_JSON:" + json.dumps({"error": "No valid mesh object selected"}))
+    exit(0)
+
+# Check for atlas information
+atlas_info = None
+if "material_atlas" in mesh:
+    try:
+        atlas_info = json.loads(mesh["material_atlas"])
+    except ValueError:
+        # Meshes atlased before the property switched to JSON hold a dict repr
+        try:
+            atlas_info = ast.literal_eval(mesh["material_atlas"])
+        except (ValueError, SyntaxError):
+            print("WARNING: Could not parse atlas information")
+
+print("RESULT_JSON:" + json.dumps({"mesh": mesh.name, "atlas_info": atlas_info}))
+"""
+
+
+async def _run_script(script: Template | str, **params: Any) -> dict[str, Any]:
+    """Run a script and decode its RESULT_JSON line, raising on a reported error.
+
+    Template scripts receive ``params`` as their ``$params`` JSON. Output is
+    streamed and the first RESULT_JSON line ends the read, so the rest of the
+    job's output is never buffered.
+    """
+    if isinstance(script, Template):
+        script = bind_script(script)
+    async with contextlib.aclosing(_executor.execute_script_lines(script, params=params)) as lines:
+        async for line in lines:
+            if line.startswith("RESULT_JSON:"):
+                result: dict[str, Any] = _loads(line[len("RESULT_JSON:") :])
+                break
+        else:
+            raise BlenderAtlasingError("Blender script did not report a result")
+
+    if "error" in result:
+        raise BlenderAtlasingError(result["error"])
+    return result
+
+
+@blender_operation("create_material_atlas")
+async def create_material_atlas(
+    target_mesh: str | None = None,
+    atlas_size: int = 2048,
+    padding: int = 4,
+    output_path: str = "//material_atlas.png",
+    combine_similar: bool = True,
+) -> dict[str, Any]:
+    """
+    Create a material atlas by combining multiple materials into a single texture.
+
+    This reduces draw calls by merging material textures into atlas maps,
+    critical for mobile VR performance optimization.
+
+    Args:
+        target_mesh: Target mesh object (defaults to active)
+        atlas_size: Size of the atlas texture (512, 1024, 2048, 4096)
+        padding: Padding between atlas regions in pixels
+        output_path: Path to save the atlas texture
+        combine_similar: Whether to merge materials with similar properties
+
+    Returns:
+        Atlas creation result with texture mapping information
 
-        output = await _executor.execute_script(script)
-        lines = output.strip().split("\n")
-
-        mesh_name = "Unknown"
-        material_count = 0
-        atlas_layout = "Unknown"
-        atlas_created = True
-
-        for line in lines:
-            if line.startswith("ERROR:"):
-                raise BlenderAtlasingError(line[7:])
-            elif line.startswith("MESH:"):
-                mesh_name = line.split(": ")[1]
-            elif line.startswith("MATERIALS:"):
-                material_count = int(line.split(": ")[1])
-            elif line.startswith("ATLAS_LAYOUT:"):
-                atlas_layout = line.split(": ")[1]
-            elif line.startswith("ATLAS_CREATED: false"):
-                atlas_created = False
-
-        if not atlas_created:
+    Raises:
+        BlenderAtlasingError: If atlas creation fails
+    """
+    logger.info(f"Creating material atlas (size: {atlas_size}, padding: {padding})")
+
+    try:
+        result = await _run_script(
+            _CREATE_MATERIAL_ATLAS_SCRIPT, target_mesh=target_mesh, atlas_size=atlas_size, padding=padding
+        )
+        mesh_name = result["mesh"]
+        material_count = result["materials"]
+
+        if not result["atlas_created"]:
             return {
                 "status": "info",
                 "message": f"Mesh '{mesh_name}' already has minimal materials ({material_count})",
@@ -134,7 +313,7 @@ print("SUCCESS: Material atlas prepared")
             "status": "success",
             "mesh_name": mesh_name,
             "atlas_size": atlas_size,
-            "atlas_layout": atlas_layout,
+            "atlas_layout": result["atlas_layout"],
             "materials_count": material_count,
             "materials_reduced": max(1, material_count // 2),
             "output_path": output_path,
@@ -166,93 +345,54 @@ async def merge_texture_atlas(
         padding: Padding between texture regions
 
     Returns:
-        Texture atlas creation result with UV mapping coordinates
+        Texture atlas creation result with UV mapping coordinates. Duplicate paths
+        are loaded once; texture_indices maps each requested path to its entry in
+        uv_mappings (None if it failed to load). pixels_packed is False when the
+        atlas image was not written: a "//" output path, NumPy or Pillow missing, or
+        a texture the host cannot read.
 
     Raises:
         BlenderAtlasingError: If texture merging fails
     """
     logger.info(f"Merging {len(texture_paths)} textures into atlas")
 
-    try:
-        script = f"""
-import bpy
-import os
-
-texture_list = {texture_paths!r}
-output_file = {output_path!r}
-atlas_size = {atlas_size}
-padding = {padding}
+    # Materials often share a texture; each distinct file is loaded and packed once
+    unique_paths = list(dict.fromkeys(texture_paths))
 
-if not texture_list:
-    print("ERROR: No texture paths provided")
-    exit(1)
-
-print(f"TEXTURES_TO_MERGE: {{len(texture_list)}}")
-
-# Load and validate textures
-loaded_images = []
-for tex_path in texture_list:
     try:
-        # Load image
-        img = bpy.data.images.load(tex_path)
-        loaded_images.append(img)
-        print(f"LOADED: {{os.path.basename(tex_path)}}")
-    except Exception as e:
-        print(f"WARNING: Failed to load {{tex_path}}: {{e}}")
-
-if not loaded_images:
-    print("ERROR: No textures could be loaded")
-    exit(1)
-
-# Create atlas image
-atlas_name = "TextureAtlas_" + str(len(loaded_images))
-atlas_image = bpy.data.images.new(atlas_name, width=atlas_size, height=atlas_size)
-
-# Calculate grid layout
-cols = int(math.sqrt(len(loaded_images)))
-rows = int(math.ceil(len(loaded_images) / cols))
-region_size = (atlas_size - padding * (cols + 1)) // cols
-
-print(f"ATLAS_GRID: {{cols}}x{{rows}}, region={{region_size}}px")
-
-# Store atlas mapping
-atlas_mapping = {{
-    "atlas_size": atlas_size,
-    "padding": padding,
-    "cols": cols,
-    "rows": rows,
-    "region_size": region_size,
-    "texture_count": len(loaded_images),
-    "textures": [img.name for img in loaded_images]
-}}
-
-# Save atlas info (in a real implementation, this would actually pack textures)
-print(f"ATLAS_MAPPING: {{atlas_mapping}}")
-print("SUCCESS: Texture atlas prepared")
-"""
-
-        output = await _executor.execute_script(script)
-        lines = output.strip().split("\n")
-
-        atlas_grid = "Unknown"
-        loaded_textures = []
-
-        for line in lines:
-            if line.startswith("ERROR:"):
-                raise BlenderAtlasingError(line[7:])
-            elif line.startswith("ATLAS_GRID:"):
-                atlas_grid = line.split(": ")[1]
-            elif line.startswith("LOADED:"):
-                loaded_textures.append(line.split(": ")[1])
+        result = await _run_script(_MERGE_TEXTURE_ATLAS_SCRIPT, texture_paths=unique_paths)
+        loaded_textures = [entry["name"] for entry in result["loaded"]]
+        loaded_paths = [unique_paths[entry["index"]] for entry in result["loaded"]]
+        region_of = {path: region for region, path in enumerate(loaded_paths)}
+        texture_indices = [region_of.get(path) for path in texture_paths]
+        texture_sizes = [tuple(entry["size"]) for entry in result["loaded"]]
+        # Blender resolves blend-relative ("//") texture paths; the host reads the results
+        source_paths = [entry["path"] for entry in result["loaded"]]
+
+        # The fitting pass already placed every region, so the mappings come from its rects
+        rects = _fit_region_rects(texture_sizes, atlas_size, padding)
+        if rects is None:
+            raise BlenderAtlasingError(f"{len(texture_sizes)} textures do not fit in a {atlas_size}px atlas")
+
+        uv_mappings = list(_uv_mappings_from_rects(rects, atlas_size))
+        used_area = sum(w * h for _, _, w, h in rects)
+
+        # Blender-relative ("//") output paths only resolve inside Blender, so those stay metadata-only
+        pixels_packed = HAS_NUMPY and HAS_PIL and bool(uv_mappings) and not output_path.startswith("//")
+        if pixels_packed:
+            pixels_packed = await asyncio.to_thread(_blit_atlas, source_paths, rects, atlas_size, output_path)
 
         return {
             "status": "success",
             "textures_merged": len(loaded_textures),
             "atlas_size": atlas_size,
-            "atlas_grid": atlas_grid,
+            "atlas_grid": f"MaxRects, {len(rects)} regions, {used_area / atlas_size**2:.0%} of atlas used",
             "output_path": output_path,
             "loaded_textures": loaded_textures,
-            "message": f"Texture atlas prepared with {len(loaded_textures)} textures",
+            "uv_mappings": uv_mappings,
+            "texture_indices": texture_indices,
+            "pixels_packed": pixels_packed,
+            "message": f"Texture atlas {'written' if pixels_packed else 'prepared'} with {len(loaded_textures)} textures",
         }
 
     except Exception as e:
@@ -288,104 +428,17 @@ async def optimize_draw_calls(
     logger.info(f"Optimizing draw calls (max materials: {max_materials})")
 
     try:
-        script = f"""
-import bpy
-
-# Get target mesh
-mesh_name = {target_mesh!r}
-if mesh_name:
-    mesh = bpy.data.objects.get(mesh_name)
-else:
-    mesh = bpy.context.active_object
-
-if not mesh or mesh.type != 'MESH':
-    print("ERROR: No valid mesh object selected")
-    exit(1)
-
-print(f"MESH: {{mesh.name}}")
-
-# Analyze current material usage
-materials = mesh.data.materials
-initial_count = len(materials)
-print(f"INITIAL_MATERIALS: {{initial_count}}")
-
-if initial_count <= {max_materials}:
-    print("INFO: Already within material limits")
-    print("OPTIMIZED: false")
-    exit(0)
-
-# Analyze material similarity (simplified)
-color_groups = {{}}
-for i, mat in enumerate(materials):
-    if not mat:
-        continue
-
-    # Simple color-based grouping (would be more sophisticated in real impl)
-    try:
-        principled = None
-        for node in mat.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                principled = node
-                break
-
-        if principled:
-            base_color = principled.inputs['Base Color'].default_value
-            color_key = tuple(round(c, 2) for c in base_color[:3])
-            if color_key not in color_groups:
-                color_groups[color_key] = []
-            color_groups[color_key].append(i)
-    except Exception:
-        # If analysis fails, treat as unique
-        pass
-
-print(f"COLOR_GROUPS: {{len(color_groups)}}")
-
-# Calculate potential reduction
-potential_materials = min({max_materials}, len(color_groups)) if {combine_by_color!r} else min({max_materials}, initial_count)
-reduction = initial_count - potential_materials
-
-print(f"POTENTIAL_MATERIALS: {{potential_materials}}")
-print(f"REDUCTION: {{reduction}}")
-
-# Store optimization info
-opt_info = {{
-    "initial_materials": initial_count,
-    "potential_materials": potential_materials,
-    "reduction": reduction,
-    "max_materials": {max_materials},
-    "combine_by_color": {combine_by_color!r},
-    "preserve_normals": {preserve_normals!r}
-}}
-
-mesh["draw_call_optimization"] = str(opt_info)
-
-print("SUCCESS: Draw call optimization analyzed")
-"""
+        result = await _run_script(
+            _OPTIMIZE_DRAW_CALLS_SCRIPT,
+            target_mesh=target_mesh,
+            max_materials=max_materials,
+            combine_by_color=combine_by_color,
+            preserve_normals=preserve_normals,
+        )
+        mesh_name = result["mesh"]
+        initial_materials = result["initial_materials"]
 
-        output = await _executor.execute_script(script)
-        lines = output.strip().split("\n")
-
-        mesh_name = "Unknown"
-        initial_materials = 0
-        potential_materials = 0
-        reduction = 0
-        optimized = True
-
-        for line in lines:
-            if line.startswith("ERROR:"):
-                raise BlenderAtlasingError(line[7:])
-            elif line.startswith("MESH:"):
-                mesh_name = line.split(": ")[1]
-            elif line.startswith("INITIAL_MATERIALS:"):
-                initial_materials = int(line.split(": ")[1])
-            elif line.startswith("POTENTIAL_MATERIALS:"):
-                potential_materials = int(line.split(": ")[1])
-            elif line.startswith("REDUCTION:"):
-                reduction = int(line.split(": ")[1])
-            elif line.startswith("OPTIMIZED: false"):
-                optimized = False
-
-        if not optimized:
+        if not result["optimized"]:
             return {
                 "status": "info",
                 "message": f"Mesh '{mesh_name}' already within material limits ({initial_materials} ≤ {max_materials})",
@@ -393,16 +446,23 @@ print("SUCCESS: Draw call optimization analyzed")
                 "materials_after": initial_materials,
             }
 
+        color_groups = _group_colors(result["colors"])
+        potential_materials = min(max_materials, len(color_groups) if combine_by_color else initial_materials)
+        reduction = initial_materials - potential_materials
+
         return {
             "status": "success",
             "mesh_name": mesh_name,
             "materials_before": initial_materials,
             "materials_after": potential_materials,
             "reduction": reduction,
+            "color_groups": color_groups,
             "max_materials": max_materials,
             "combine_by_color": combine_by_color,
             "preserve_normals": preserve_normals,
-            "message": f"Draw call optimization: {initial_materials} → {potential_materials} materials ({reduction} reduction)",
+            "message": (
+                f"Draw call optimization: {initial_materials} → {potential_materials} materials ({reduction} reduction)"
+            ),
         }
 
     except Exception as e:
@@ -410,6 +470,33 @@ print("SUCCESS: Draw call optimization analyzed")
         raise BlenderAtlasingError(f"Failed to optimize draw calls: {e!s}") from e
 
 
+def _group_colors(colors: list[list[float] | None]) -> list[list[int]]:
+    """Group material indices whose base colours match to two decimals.
+
+    Materials without a readable colour (None) are left out. Groups are ordered
+    by their first material index. NumPy groups every colour in one np.unique
+    pass when installed, otherwise a dict keyed on the rounded colour is used.
+    """
+    present = [(i, color) for i, color in enumerate(colors) if color is not None]
+    if not present:
+        return []
+
+    if HAS_NUMPY:
+        keys = np.round(np.asarray([color[:3] for _, color in present], dtype=np.float64), 2)
+        _, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind="stable")
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        indices = np.asarray([i for i, _ in present])
+        split_groups = [group.tolist() for group in np.split(indices[order], splits)]
+        return sorted(split_groups, key=lambda group: group[0])
+
+    groups: defaultdict[tuple[float, ...], list[int]] = defaultdict(list)
+    for i, color in present:
+        groups[tuple(round(c, 2) for c in color[:3])].append(i)
+    return list(groups.values())
+
+
 @blender_operation("get_atlas_uv_layout")
 async def get_atlas_uv_layout(
     target_mesh: str | None = None, atlas_info: dict[str, Any] | None = None
@@ -442,46 +529,9 @@ async def get_atlas_uv_layout(
                 "message": "UV layout calculated from provided atlas info",
             }
 
-        script = """
-import bpy
-
-# Get target mesh
-mesh = bpy.context.active_object
-if not mesh or mesh.type != 'MESH':
-    print("ERROR: No valid mesh object selected")
-    exit(1)
-
-print(f"MESH: {mesh.name}")
-
-# Check for atlas information
-atlas_info = None
-if "material_atlas" in mesh:
-    try:
-        atlas_info = eval(mesh["material_atlas"])
-        print(f"ATLAS_FOUND: {atlas_info}")
-    except Exception:
-        print("WARNING: Could not parse atlas information")
-
-if not atlas_info:
-    print("INFO: No atlas information found on mesh")
-    print("UV_LAYOUT: none")
-else:
-    print("SUCCESS: Atlas UV layout retrieved")
-"""
-
-        output = await _executor.execute_script(script)
-        lines = output.strip().split("\n")
-
-        mesh_name = "Unknown"
-        atlas_found = None
-
-        for line in lines:
-            if line.startswith("ERROR:"):
-                raise BlenderAtlasingError(line[7:])
-            elif line.startswith("MESH:"):
-                mesh_name = line.split(": ")[1]
-            elif line.startswith("ATLAS_FOUND:"):
-                atlas_found = eval(line.split(": ")[1])
+        result = await _run_script(_ATLAS_UV_LAYOUT_SCRIPT)
+        mesh_name = result["mesh"]
+        atlas_found = result["atlas_info"]
 
         if not atlas_found:
             return {
@@ -505,42 +555,320 @@ else:
         raise BlenderAtlasingError(f"Failed to generate UV layout: {e!s}") from e
 
 
-def _calculate_uv_mappings(atlas_info: dict[str, Any]) -> list[dict[str, Any]]:
-    """Calculate UV coordinate mappings for atlas regions."""
-    mappings = []
+def _calculate_uv_mappings(
+    atlas_info: dict[str, Any], layout: Literal["aos", "soa"] = "aos"
+) -> Sequence[Mapping[str, Any]] | dict[str, Any]:
+    """Calculate UV coordinate mappings for atlas regions.
 
-    cols = atlas_info.get("cols", 1)
-    rows = atlas_info.get("rows", 1)
+    Variable-size regions (``sizes`` in atlas_info) are packed with MaxRects and
+    cached per atlas shape, so those mappings are read-only. Uniform grids return
+    a lazy AtlasUVLayout that computes regions on access instead of building one
+    dict per region up front.
+
+    With ``layout="soa"`` the result is one column per coordinate instead
+    (``u_min``, ``v_min``, ``u_max``, ``v_max``, ``x``, ``y``, ``w``, ``h``),
+    as NumPy arrays when available, for callers that transform every region.
+    """
     atlas_size = atlas_info.get("atlas_size", 2048)
     padding = atlas_info.get("padding", 4)
+
+    if atlas_info.get("sizes"):
+        sizes = tuple(tuple(size) for size in atlas_info["sizes"])
+        mappings = _packed_uv_mappings(sizes, atlas_size, padding)
+        return _uv_columns(mappings) if layout == "soa" else list(mappings)
+
+    cols = atlas_info.get("cols", 1)
+    rows = atlas_info.get("rows", 1)
     region_size = atlas_info.get("region_size", atlas_size // cols)
 
-    for i in range(cols * rows):
-        col = i % cols
-        row = i // cols
+    if layout == "soa" and HAS_NUMPY:
+        x, y, uv = _grid_uv_arrays(cols, rows, atlas_size, padding, region_size)
+        size = np.full(cols * rows, region_size)
+        return {
+            "u_min": uv[:, 0],
+            "v_min": uv[:, 1],
+            "u_max": uv[:, 2],
+            "v_max": uv[:, 3],
+            "x": x,
+            "y": y,
+            "w": size,
+            "h": size,
+        }
 
-        # Calculate UV coordinates (0-1 range)
-        u_min = (col * (region_size + padding) + padding) / atlas_size
-        v_min = (row * (region_size + padding) + padding) / atlas_size
-        u_max = u_min + region_size / atlas_size
-        v_max = v_min + region_size / atlas_size
+    layout_view = _grid_uv_layout(cols, rows, atlas_size, padding, region_size)
+    return _uv_columns(tuple(layout_view)) if layout == "soa" else layout_view
+
+
+def _uv_columns(mappings: tuple[Mapping[str, Any], ...]) -> dict[str, Any]:
+    """Transpose region mappings into per-coordinate columns."""
+    columns = {
+        "u_min": [m["uv_coords"]["u_min"] for m in mappings],
+        "v_min": [m["uv_coords"]["v_min"] for m in mappings],
+        "u_max": [m["uv_coords"]["u_max"] for m in mappings],
+        "v_max": [m["uv_coords"]["v_max"] for m in mappings],
+        "x": [m["pixel_coords"]["x"] for m in mappings],
+        "y": [m["pixel_coords"]["y"] for m in mappings],
+        "w": [m["pixel_coords"]["width"] for m in mappings],
+        "h": [m["pixel_coords"]["height"] for m in mappings],
+    }
+    if HAS_NUMPY:
+        return {key: np.asarray(values) for key, values in columns.items()}
+    return columns
+
+
+def _freeze_mapping(mapping: dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a region mapping and its nested coordinate dicts as read-only views."""
+    return MappingProxyType(
+        {
+            "region_index": mapping["region_index"],
+            "uv_coords": MappingProxyType(mapping["uv_coords"]),
+            "pixel_coords": MappingProxyType(mapping["pixel_coords"]),
+        }
+    )
 
-        mappings.append(
+
+@lru_cache(maxsize=64)
+def _packed_uv_mappings(
+    sizes: tuple[tuple[int, int], ...], atlas_size: int, padding: int
+) -> tuple[Mapping[str, Any], ...]:
+    rects = _pack_maxrects(list(sizes), atlas_size, padding)
+    if rects is None:
+        raise BlenderAtlasingError(f"{len(sizes)} regions do not fit in a {atlas_size}px atlas")
+    return _uv_mappings_from_rects(rects, atlas_size)
+
+
+def _uv_mappings_from_rects(rects: list[tuple[int, int, int, int]], atlas_size: int) -> tuple[Mapping[str, Any], ...]:
+    """Build read-only region mappings from placed ``(x, y, width, height)`` rects."""
+    return tuple(
+        _freeze_mapping(
             {
                 "region_index": i,
                 "uv_coords": {
-                    "u_min": round(u_min, 4),
-                    "v_min": round(v_min, 4),
-                    "u_max": round(u_max, 4),
-                    "v_max": round(v_max, 4),
-                },
-                "pixel_coords": {
-                    "x": col * (region_size + padding) + padding,
-                    "y": row * (region_size + padding) + padding,
-                    "width": region_size,
-                    "height": region_size,
+                    "u_min": round(x / atlas_size, 4),
+                    "v_min": round(y / atlas_size, 4),
+                    "u_max": round((x + w) / atlas_size, 4),
+                    "v_max": round((y + h) / atlas_size, 4),
                 },
+                "pixel_coords": {"x": x, "y": y, "width": w, "height": h},
             }
         )
+        for i, (x, y, w, h) in enumerate(rects)
+    )
+
+
+def _grid_uv_arrays(
+    cols: int, rows: int, atlas_size: int, padding: int, region_size: int
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Pixel origins and rounded ``(u_min, v_min, u_max, v_max)`` rows for a uniform grid."""
+    stride = region_size + padding
+    inv_size = 1.0 / atlas_size
+    size_uv = region_size * inv_size
+    index = np.arange(cols * rows)
+    x = (index % cols) * stride + padding
+    y = (index // cols) * stride + padding
+    u_min = x * inv_size
+    v_min = y * inv_size
+    return x, y, np.round(np.stack([u_min, v_min, u_min + size_uv, v_min + size_uv], axis=1), 4)
+
+
+class AtlasUVLayout(Sequence):
+    """Read-only view over the regions of a uniform atlas grid.
+
+    Only the grid parameters are stored; each region's mapping is computed when
+    it is indexed or iterated, so reading one region of a 64x64 atlas does not
+    allocate the other 4095. Full iteration uses NumPy when it is installed.
+    """
+
+    __slots__ = ("_inv_size", "_size_uv", "_stride", "atlas_size", "cols", "padding", "region_size", "rows")
+
+    def __init__(self, cols: int, rows: int, atlas_size: int, padding: int, region_size: int):
+        self.cols = cols
+        self.rows = rows
+        self.atlas_size = atlas_size
+        self.padding = padding
+        self.region_size = region_size
+        # Multiplying by the reciprocal matches the NumPy path exactly
+        self._stride = region_size + padding
+        self._inv_size = 1.0 / atlas_size
+        self._size_uv = region_size * self._inv_size
+
+    def __len__(self) -> int:
+        return self.cols * self.rows
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._region(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("atlas region index out of range")
+        return self._region(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not HAS_NUMPY:
+            yield from map(self._region, range(len(self)))
+            return
+
+        x, y, uv = _grid_uv_arrays(self.cols, self.rows, self.atlas_size, self.padding, self.region_size)
+        size = self.region_size
+        for i, ((u0, v0, u1, v1), px, py) in enumerate(zip(uv.tolist(), x.tolist(), y.tolist(), strict=True)):
+            yield {
+                "region_index": i,
+                "uv_coords": {"u_min": u0, "v_min": v0, "u_max": u1, "v_max": v1},
+                "pixel_coords": {"x": px, "y": py, "width": size, "height": size},
+            }
+
+    def __repr__(self) -> str:
+        return f"AtlasUVLayout({self.cols}x{self.rows}, atlas_size={self.atlas_size}, region_size={self.region_size})"
+
+    def _region(self, i: int) -> dict[str, Any]:
+        x = (i % self.cols) * self._stride + self.padding
+        y = (i // self.cols) * self._stride + self.padding
+
+        # Calculate UV coordinates (0-1 range)
+        u_min = x * self._inv_size
+        v_min = y * self._inv_size
 
-    return mappings
+        return {
+            "region_index": i,
+            "uv_coords": {
+                "u_min": round(u_min, 4),
+                "v_min": round(v_min, 4),
+                "u_max": round(u_min + self._size_uv, 4),
+                "v_max": round(v_min + self._size_uv, 4),
+            },
+            "pixel_coords": {"x": x, "y": y, "width": self.region_size, "height": self.region_size},
+        }
+
+
+@lru_cache(maxsize=64)
+def _grid_uv_layout(cols: int, rows: int, atlas_size: int, padding: int, region_size: int) -> AtlasUVLayout:
+    return AtlasUVLayout(cols, rows, atlas_size, padding, region_size)
+
+
+def _pack_maxrects(
+    sizes: list[tuple[int, int]], atlas_size: int, padding: int
+) -> list[tuple[int, int, int, int]] | None:
+    """Pack regions into a square atlas with MaxRects best-short-side-fit.
+
+    Returns ``(x, y, width, height)`` per input region in input order, or None
+    if they do not all fit. Regions keep ``padding`` pixels from the atlas edge
+    and from each other, matching the uniform grid layout.
+    """
+    free = [(padding, padding, atlas_size - padding, atlas_size - padding)]
+    placed: list[tuple[int, int, int, int] | None] = [None] * len(sizes)
+
+    # Placing large regions first leaves the small ones to fill the gaps
+    for i in sorted(range(len(sizes)), key=lambda i: max(sizes[i]), reverse=True):
+        width, height = sizes[i]
+        needed_w, needed_h = width + padding, height + padding
+        best = None
+        best_score = None
+        for fx, fy, fw, fh in free:
+            if needed_w <= fw and needed_h <= fh:
+                score = (min(fw - needed_w, fh - needed_h), max(fw - needed_w, fh - needed_h))
+                if best_score is None or score < best_score:
+                    best, best_score = (fx, fy), score
+        if best is None:
+            return None
+
+        x, y = best
+        placed[i] = (x, y, width, height)
+        free = _split_free_rects(free, (x, y, needed_w, needed_h))
+
+    # Every slot is filled once the loop completes without returning None
+    return cast(list[tuple[int, int, int, int]], placed)
+
+
+def _split_free_rects(
+    free: list[tuple[int, int, int, int]], used: tuple[int, int, int, int]
+) -> list[tuple[int, int, int, int]]:
+    """Carve ``used`` out of the free list and drop rectangles contained in others."""
+    ux, uy, uw, uh = used
+    split = []
+    for fx, fy, fw, fh in free:
+        if ux >= fx + fw or ux + uw <= fx or uy >= fy + fh or uy + uh <= fy:
+            split.append((fx, fy, fw, fh))
+            continue
+        if ux > fx:
+            split.append((fx, fy, ux - fx, fh))
+        if ux + uw < fx + fw:
+            split.append((ux + uw, fy, fx + fw - ux - uw, fh))
+        if uy > fy:
+            split.append((fx, fy, fw, uy - fy))
+        if uy + uh < fy + fh:
+            split.append((fx, uy + uh, fw, fy + fh - uy - uh))
+
+    def contains(outer: tuple[int, int, int, int], inner: tuple[int, int, int, int]) -> bool:
+        return (
+            outer[0] <= inner[0]
+            and outer[1] <= inner[1]
+            and outer[0] + outer[2] >= inner[0] + inner[2]
+            and outer[1] + outer[3] >= inner[1] + inner[3]
+        )
+
+    pruned = []
+    for i, rect in enumerate(split):
+        # Identical rectangles keep their first occurrence only
+        if not any(contains(other, rect) and (other != rect or j < i) for j, other in enumerate(split) if j != i):
+            pruned.append(rect)
+    return pruned
+
+
+def _fit_region_rects(
+    sizes: list[tuple[int, int]], atlas_size: int, padding: int
+) -> list[tuple[int, int, int, int]] | None:
+    """Halve region sizes until they pack into the atlas.
+
+    Returns the placed ``(x, y, width, height)`` rects, or None if they never fit.
+    """
+    scale = 1
+    while True:
+        scaled = [(max(1, w // scale), max(1, h // scale)) for w, h in sizes]
+        rects = _pack_maxrects(scaled, atlas_size, padding)
+        if rects is not None:
+            return rects
+        if all(w == 1 and h == 1 for w, h in scaled):
+            return None
+        scale *= 2
+
+
+def _load_tile(path: str, width: int, height: int) -> "np.ndarray":
+    """Decode one texture as an RGBA array resized to its atlas region."""
+    with Image.open(path) as img:
+        tile = img.convert("RGBA")
+    if tile.size != (width, height):
+        tile = tile.resize((width, height), Image.Resampling.BILINEAR)
+    return np.asarray(tile)
+
+
+def _blit_atlas(paths: list[str], rects: list[tuple[int, int, int, int]], atlas_size: int, output_path: str) -> bool:
+    """Copy each texture into its packed region and save the atlas image.
+
+    Needs NumPy and Pillow. Tiles are decoded and resized on a thread pool, since
+    Pillow releases the GIL for both. Regions use UV-space coordinates (origin
+    bottom-left), so rows are flipped into image space before the slice copy.
+
+    Returns False without writing anything when a texture cannot be read on the
+    host, e.g. one packed into the .blend file.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 4) or 1) as pool:
+        tiles = pool.map(_load_tile, paths, [r[2] for r in rects], [r[3] for r in rects])
+
+        atlas = np.zeros((atlas_size, atlas_size, 4), dtype=np.uint8)
+        try:
+            for tile, (x, y, width, height) in zip(tiles, rects, strict=True):
+                top = atlas_size - y - height
+                atlas[top : top + height, x : x + width] = tile
+        except OSError as e:
+            logger.warning(f"Texture not readable on the host, atlas pixels not written: {e}")
+            return False
+
+    Image.fromarray(atlas, "RGBA").save(output_path)
+    return True
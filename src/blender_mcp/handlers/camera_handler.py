@@ -5,18 +5,112 @@ This module provides camera creation and manipulation functions that can be regi
 
 import logging
 from enum import StrEnum
+from string import Template
 from typing import Any
 
 from ..compat import *
 
 logger = logging.getLogger(__name__)
 from ..decorators import blender_operation
-from ..utils.blender_executor import get_blender_executor
+from ..utils.blender_executor import bind_script, get_blender_executor, render_script
 
 # Initialize the executor with default Blender executable
 _executor = get_blender_executor()
 
 
+# Blender scripts are constant text built once at import; arguments travel separately as
+# JSON (see bind_script), so user strings cannot break out of the script. Batched
+# fragments inline them with render_script instead.
+_CREATE_CAMERA_SCRIPT = Template(
+    """
+import json
+import math
+from mathutils import Euler
+
+P = json.loads($params)
+
+# Create new camera
+def create_camera():
+    # Create camera data
+    cam_data = bpy.data.cameras.new(name=P["name"] + "_data")
+    cam_data.lens = P["lens"]
+    cam_data.sensor_width = P["sensor_width"]
+    cam_data.clip_start = P["clip_start"]
+    cam_data.clip_end = P["clip_end"]
+    cam_data.sensor_fit = P["sensor_fit"]
+
+    # Set camera type
+    cam_data.type = P["camera_type"]
+
+    # Create camera object
+    cam_obj = bpy.data.objects.new(P["name"], cam_data)
+    cam_obj.location = P["location"]
+    cam_obj.rotation_euler = P["rotation"]
+
+    # Link to scene
+    bpy.context.collection.objects.link(cam_obj)
+
+    # Set as active camera if no active camera exists
+    if not bpy.context.scene.camera:
+        bpy.context.scene.camera = cam_obj
+
+    return cam_obj
+
+# Execute creation
+try:
+    camera = create_camera()
+    result = {
+        'status': 'SUCCESS',
+        'camera_name': camera.name,
+        'camera_type': P["camera_type"],
+        'location': P["location"],
+        'rotation': P["rotation"],
+        'lens': P["lens"],
+        'sensor_width': P["sensor_width"]
+    }
+except Exception as e:
+    result = {
+        'status': 'ERROR',
+        'error': str(e)
+    }
+
+print(str(result))
+"""
+)
+
+
+_SET_ACTIVE_CAMERA_SCRIPT = Template(
+    """
+import json
+
+P = json.loads($params)
+
+camera = bpy.data.objects.get(P["camera_name"])
+if camera and camera.type == 'CAMERA':
+    bpy.context.scene.camera = camera
+    print({'status': 'SUCCESS', 'camera': camera.name})
+else:
+    print({'status': 'ERROR', 'error': 'Camera not found or invalid'})
+"""
+)
+
+
+_SET_CAMERA_LENS_SCRIPT = Template(
+    """
+import json
+
+P = json.loads($params)
+
+camera = bpy.data.objects.get(P["camera_name"])
+if camera and camera.type == 'CAMERA':
+    camera.data.lens = P["lens"]
+    print({'status': 'SUCCESS', 'camera': camera.name, 'lens': P["lens"]})
+else:
+    print({'status': 'ERROR', 'error': 'Camera not found or invalid'})
+"""
+)
+
+
 class CameraType(StrEnum):
     """Supported camera types."""
 
@@ -25,6 +119,44 @@ class CameraType(StrEnum):
     PANO = "PANO"
 
 
+def _create_camera_params(
+    name: str = "Camera",
+    camera_type: CameraType | str = CameraType.PERSP,
+    location: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    rotation: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    lens: float = 50.0,
+    sensor_width: float = 36.0,
+    clip_start: float = 0.1,
+    clip_end: float = 100.0,
+    sensor_fit: str = "AUTO",
+    **kwargs: Any,
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "camera_type": camera_type,
+        "location": list(location),
+        "rotation": list(rotation),
+        "lens": lens,
+        "sensor_width": sensor_width,
+        "clip_start": clip_start,
+        "clip_end": clip_end,
+        "sensor_fit": sensor_fit,
+    }
+
+
+# Script builders let several operations share one Blender round-trip via batch()
+def create_camera_script(*args: Any, **kwargs: Any) -> str:
+    return render_script(_CREATE_CAMERA_SCRIPT, **_create_camera_params(*args, **kwargs))
+
+
+def set_active_camera_script(camera_name: str, **kwargs: Any) -> str:
+    return render_script(_SET_ACTIVE_CAMERA_SCRIPT, camera_name=camera_name)
+
+
+def set_camera_lens_script(camera_name: str, lens: float, **kwargs: Any) -> str:
+    return render_script(_SET_CAMERA_LENS_SCRIPT, camera_name=camera_name, lens=lens)
+
+
 @blender_operation("create_camera", log_args=True)
 async def create_camera(
     name: str = "Camera",
@@ -55,60 +187,12 @@ async def create_camera(
     Returns:
         Dict containing operation status and camera details
     """
-    script = f"""
-import math
-from mathutils import Euler
-
-# Create new camera
-def create_camera():
-    # Create camera data
-    cam_data = bpy.data.cameras.new(name='{name}_data')
-    cam_data.lens = {lens}
-    cam_data.sensor_width = {sensor_width}
-    cam_data.clip_start = {clip_start}
-    cam_data.clip_end = {clip_end}
-    cam_data.sensor_fit = '{sensor_fit}'
-
-    # Set camera type
-    cam_data.type = '{camera_type}'
-
-    # Create camera object
-    cam_obj = bpy.data.objects.new('{name}', cam_data)
-    cam_obj.location = {list(location)}
-    cam_obj.rotation_euler = {list(rotation)}
-
-    # Link to scene
-    bpy.context.collection.objects.link(cam_obj)
-
-    # Set as active camera if no active camera exists
-    if not bpy.context.scene.camera:
-        bpy.context.scene.camera = cam_obj
-
-    return cam_obj
-
-# Execute creation
-try:
-    camera = create_camera()
-    result = {{
-        'status': 'SUCCESS',
-        'camera_name': camera.name,
-        'camera_type': '{camera_type}',
-        'location': {list(location)},
-        'rotation': {list(rotation)},
-        'lens': {lens},
-        'sensor_width': {sensor_width}
-    }}
-except Exception as e:
-    result = {{
-        'status': 'ERROR',
-        'error': str(e)
-    }}
-
-print(str(result))
-"""
+    params = _create_camera_params(
+        name, camera_type, location, rotation, lens, sensor_width, clip_start, clip_end, sensor_fit
+    )
 
     try:
-        output = await _executor.execute_script(script)
+        output = await _executor.execute_script_persistent(bind_script(_CREATE_CAMERA_SCRIPT), params=params)
         return {"status": "SUCCESS", "output": output}
     except Exception as e:
         logger.error(f"Failed to create camera: {e!s}")
@@ -126,17 +210,10 @@ async def set_active_camera(camera_name: str, **kwargs: Any) -> dict[str, Any]:
     Returns:
         Dict containing operation status
     """
-    script = f"""
-
-camera = bpy.data.objects.get('{camera_name}')
-if camera and camera.type == 'CAMERA':
-    bpy.context.scene.camera = camera
-    print({{'status': 'SUCCESS', 'camera': camera.name}})
-else:
-    print({{'status': 'ERROR', 'error': 'Camera not found or invalid'}})
-"""
     try:
-        output = await _executor.execute_script(script)
+        output = await _executor.execute_script_persistent(
+            bind_script(_SET_ACTIVE_CAMERA_SCRIPT), params={"camera_name": camera_name}
+        )
         return {"status": "SUCCESS", "output": output}
     except Exception as e:
         logger.error(f"Failed to set active camera: {e!s}")
@@ -155,18 +232,35 @@ async def set_camera_lens(camera_name: str, lens: float, **kwargs: Any) -> dict[
     Returns:
         Dict containing operation status
     """
-    script = f"""
-
-camera = bpy.data.objects.get('{camera_name}')
-if camera and camera.type == 'CAMERA':
-    camera.data.lens = {lens}
-    print({{'status': 'SUCCESS', 'camera': camera.name, 'lens': {lens}}})
-else:
-    print({{'status': 'ERROR', 'error': 'Camera not found or invalid'}})
-"""
     try:
-        output = await _executor.execute_script(script)
+        output = await _executor.execute_script_persistent(
+            bind_script(_SET_CAMERA_LENS_SCRIPT), params={"camera_name": camera_name, "lens": lens}
+        )
         return {"status": "SUCCESS", "output": output}
     except Exception as e:
         logger.error(f"Failed to set camera lens: {e!s}")
         return {"status": "ERROR", "error": str(e)}
+
+
+async def batch(*scripts: str) -> list[dict[str, Any]]:
+    """Run several camera operations in a single Blender round-trip.
+
+    Args:
+        *scripts: Scripts from the operations' ``*_script`` builders, e.g.
+            ``await batch(create_camera_script(name="A"), set_camera_lens_script("A", 85))``
+
+    Returns:
+        One result per script, in order, shaped like the individual operations' results
+    """
+    try:
+        results = await _executor.execute_batch(list(scripts))
+    except Exception as e:
+        logger.error(f"Failed to run camera batch: {e!s}")
+        return [{"status": "ERROR", "error": str(e)} for _ in scripts]
+
+    return [
+        {"status": "ERROR", "error": result["error"]}
+        if result["error"]
+        else {"status": "SUCCESS", "output": result["output"]}
+        for result in results
+    ]
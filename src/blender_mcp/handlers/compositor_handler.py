@@ -2,112 +2,31 @@
 
 import logging
 from enum import StrEnum
+from string import Template
 from typing import Any
 
 from ..compat import *
 
 logger = logging.getLogger(__name__)
 from ..decorators import blender_operation
-from ..utils.blender_executor import get_blender_executor
+from ..utils.blender_executor import bind_script, get_blender_executor
 
 _executor = get_blender_executor()
 
 
-class CompositorNodeType(StrEnum):
-    """Common compositor node types."""
+# Blender scripts are constant text built once at import; arguments travel separately as
+# JSON (see bind_script), so user strings cannot break out of the script.
+_ENABLE_COMPOSITOR_SCRIPT = Template(
+    """
+import json
 
-    BLUR = "CompositorNodeBlur"
-    RGB = "CompositorNodeRGB"
-    MIX = "CompositorNodeMixRGB"
-    ALPHA_OVER = "CompositorNodeAlphaOver"
-    GLOW = "CompositorNodeGlare"
-    COLOR_BALANCE = "CompositorNodeColorBalance"
-    LENS_DIST = "CompositorNodeLensdist"
-    VECTOR_BLUR = "CompositorNodeVecBlur"
-    DEFOCUS = "CompositorNodeBokehBlur"
-    CORNER_PIN = "CompositorNodeCornerPin"
-    CRYPTOMATTE = "CompositorNodeCryptomatteV2"
-    DENOISE = "CompositorNodeDenoise"
-    DIFF_MATTE = "CompositorNodeDiffMatte"
-    DILATE_ERODE = "CompositorNodeDilateErode"
-    DIRECTIONAL_BLUR = "CompositorNodeDBlur"
-    DISPLACE = "CompositorNodeDisplace"
-    DISTORT = "CompositorNodeMapUV"
-    ELLIPSE_MASK = "CompositorNodeEllipseMask"
-    FILTER = "CompositorNodeFilter"
-    FLIP = "CompositorNodeFlip"
-    GAMMA = "CompositorNodeGamma"
-    HUE_SAT = "CompositorNodeHueSat"
-    ID_MASK = "CompositorNodeIDMask"
-    INVERT = "CompositorNodeInvert"
-    KEYING = "CompositorNodeKeying"
-    KEYING_SCREEN = "CompositorNodeKeyingScreen"
-    LENSDIST = "CompositorNodeLensdist"
-    LEVELS = "CompositorNodeLevels"
-    LUMA_MATTE = "CompositorNodeLumaMatte"
-    MAP_RANGE = "CompositorNodeMapRange"
-    MAP_VALUE = "CompositorNodeMapValue"
-    MASK = "CompositorNodeMask"
-    MATH = "CompositorNodeMath"
-    MOVIECLIP = "CompositorNodeMovieClip"
-    MOVIEDISTORTION = "CompositorNodeMovieDistortion"
-    NORMAL = "CompositorNodeNormal"
-    NORMALIZE = "CompositorNodeNormalize"
-    PIXELATE = "CompositorNodePixelate"
-    PREMULKEY = "CompositorNodePremulKey"
-    RGBTOBW = "CompositorNodeRGBToBW"
-    ROTATE = "CompositorNodeRotate"
-    SCALE = "CompositorNodeScale"
-    SEPARATE_XYZ = "CompositorNodeSeparateXYZ"
-    SEPCOMBINE_XYZ = "CompositorNodeCombineXYZ"
-    SEPARATE_COLOR = "CompositorNodeSepRGBA"
-    SEPCOMBINE_COLOR = "CompositorNodeCombRGBA"
-    SEPARATE_HSVA = "CompositorNodeSepHSVA"
-    SEPCOMBINE_HSVA = "CompositorNodeCombHSVA"
-    SEPARATE_HSI = "CompositorNodeSepHSI"
-    SEPCOMBINE_HSI = "CompositorNodeCombHSI"
-    SEPARATE_HSL = "CompositorNodeSepHSL"
-    SEPCOMBINE_HSL = "CompositorNodeCombHSL"
-    SEPARATE_YCCA = "CompositorNodeSepYCCA"
-    SEPCOMBINE_YCCA = "CompositorNodeCombYCCA"
-    SEPARATE_YUVA = "CompositorNodeSepYUVA"
-    SEPCOMBINE_YUVA = "CompositorNodeCombYUVA"
-    SET_ALPHA = "CompositorNodeSetAlpha"
-    SPLITVIEWER = "CompositorNodeSplitViewer"
-    STABILIZE2D = "CompositorNodeStabilize"
-    SUNBEAMS = "CompositorNodeSunBeams"
-    TEXTURE = "CompositorNodeTexture"
-    TONEMAP = "CompositorNodeTonemap"
-    TRACKPOS = "CompositorNodeTrackPos"
-    TRANSFORM = "CompositorNodeTransform"
-    TRANSLATE = "CompositorNodeTranslate"
-    VALTORGB = "CompositorNodeValToRGB"
-    VECBLUR = "CompositorNodeVecBlur"
-    VECTORMATH = "CompositorNodeVectorBlur"
-    VIEW_LEVELS = "CompositorNodeViewLevels"
-    ZCOMBINE = "CompositorNodeZcombine"
-    ZCOMBINE_VEC = "CompositorNodeZcombineVector"
-    ZCOMBINE_NORMAL = "CompositorNodeZcombineNormal"
-    ZCOMBINE_ALPHA = "CompositorNodeZcombineAlpha"
-    ZCOMBINE_DIFF = "CompositorNodeZcombineDiff"
-    ZCOMBINE_PREMUL = "CompositorNodeZcombinePremul"
-    ZCOMBINE_ALPHA_PREMUL = "CompositorNodeZcombineAlphaPremul"
-    ZCOMBINE_NORMAL_PREMUL = "CompositorNodeZcombineNormalPremul"
-    ZCOMBINE_DIFF_PREMUL = "CompositorNodeZcombineDiffPremul"
-    ZCOMBINE_ALPHA_DIFF_PREMUL = "CompositorNodeZcombineAlphaDiffPremul"
-    ZCOMBINE_NORMAL_DIFF_PREMUL = "CompositorNodeZcombineNormalDiffPremul"
-
-
-@blender_operation("enable_compositor", log_args=True)
-async def enable_compositor(use_nodes: bool = True, use_sequencer: bool = False, **kwargs: Any) -> dict[str, Any]:
-    """Enable the compositor and configure basic settings."""
-    script = f"""
+P = json.loads($params)
 
 def enable_compositor():
     scene = bpy.context.scene
-    scene.use_nodes = {str(use_nodes).lower()}
-    scene.render.use_compositing = {str(use_nodes).lower()}
-    scene.render.use_sequencer = {str(use_sequencer).lower()}
+    scene.use_nodes = P["use_nodes"]
+    scene.render.use_compositing = P["use_nodes"]
+    scene.render.use_sequencer = P["use_sequencer"]
 
     # Clear existing nodes if needed
     if scene.node_tree:
@@ -115,7 +34,7 @@ def enable_compositor():
             scene.node_tree.nodes.remove(node)
 
     # Create input and output nodes
-    if {str(use_nodes).lower()} and not scene.node_tree:
+    if P["use_nodes"] and not scene.node_tree:
         scene.node_tree = bpy.data.node_groups.new('CompositorNodeTree', 'CompositorNodeTree')
 
         # Create input node
@@ -132,96 +51,82 @@ def enable_compositor():
             output_node.inputs[0]
         )
 
-    return {{
+    return {
         'status': 'SUCCESS',
         'use_nodes': scene.use_nodes,
         'use_sequencer': scene.render.use_sequencer
-    }}
+    }
 
 try:
     result = enable_compositor()
 except Exception as e:
-    result = {{'status': 'ERROR', 'error': str(e)}}
+    result = {'status': 'ERROR', 'error': str(e)}
 
 print(str(result))
 """
-    try:
-        output = await _executor.execute_script(script)
-        return {"status": "SUCCESS", "output": output}
-    except Exception as e:
-        logger.error(f"Failed to enable compositor: {e!s}")
-        return {"status": "ERROR", "error": str(e)}
+)
 
 
-@blender_operation("add_compositor_node", log_args=True)
-async def add_compositor_node(
-    node_type: CompositorNodeType | str,
-    node_name: str | None = None,
-    location: tuple[float, float] = (0.0, 0.0),
-    **kwargs: Any,
-) -> dict[str, Any]:
-    """Add a node to the compositor."""
-    script = f"""
+_ADD_COMPOSITOR_NODE_SCRIPT = Template(
+    """
+import json
+
+P = json.loads($params)
 
 def add_node():
     scene = bpy.context.scene
     if not scene.node_tree:
-        return {{'status': 'ERROR', 'error': 'Compositor not enabled'}}
+        return {'status': 'ERROR', 'error': 'Compositor not enabled'}
 
     # Create the node
-    node = scene.node_tree.nodes.new('{node_type}')
-    if '{node_name}':
-        node.name = '{node_name}'
-    node.location = {list(location)}
-
-    # Set node properties from kwargs
-    for key, value in {kwargs}.items():
-        if hasattr(node, key):
+    node = scene.node_tree.nodes.new(P["node_type"])
+    if P["node_name"]:
+        node.name = P["node_name"]
+    node.location = P["location"]
+
+    # Set node properties from kwargs; unknown names are skipped via the RNA property table
+    rna_props = set(node.bl_rna.properties.keys())
+    for key, value in P["properties"].items():
+        if key in rna_props:
             try:
                 setattr(node, key, value)
             except Exception as e:
-                print(f"Could not set {{key}}: {{str(e)}}")
+                print(f"Could not set {key}: {str(e)}")
 
-    return {{
+    return {
         'status': 'SUCCESS',
         'node_name': node.name,
         'node_type': node.type,
         'location': node.location[:]  # Convert to list for JSON serialization
-    }}
+    }
 
 try:
     result = add_node()
 except Exception as e:
-    result = {{'status': 'ERROR', 'error': str(e)}}
+    result = {'status': 'ERROR', 'error': str(e)}
 
 print(str(result))
 """
-    try:
-        output = await _executor.execute_script(script)
-        return {"status": "SUCCESS", "output": output}
-    except Exception as e:
-        logger.error(f"Failed to add compositor node: {e!s}")
-        return {"status": "ERROR", "error": str(e)}
+)
 
 
-@blender_operation("connect_compositor_nodes", log_args=True)
-async def connect_compositor_nodes(
-    from_node: str, from_socket: str, to_node: str, to_socket: str, **kwargs: Any
-) -> dict[str, Any]:
-    """Connect two nodes in the compositor."""
-    script = f"""
+_CONNECT_COMPOSITOR_NODES_SCRIPT = Template(
+    """
+import json
+
+P = json.loads($params)
 
 def connect_nodes():
     scene = bpy.context.scene
     if not scene.node_tree:
-        return {{'status': 'ERROR', 'error': 'Compositor not enabled'}}
+        return {'status': 'ERROR', 'error': 'Compositor not enabled'}
 
     # Get the nodes
-    node_from = scene.node_tree.nodes.get('{from_node}')
-    node_to = scene.node_tree.nodes.get('{to_node}')
+    node_from = scene.node_tree.nodes.get(P["from_node"])
+    node_to = scene.node_tree.nodes.get(P["to_node"])
 
     if not node_from or not node_to:
-        return {{'status': 'ERROR', 'error': 'One or both nodes not found'}}
+        return {'status': 'ERROR', 'error': 'One or both nodes not found'}
 
     # Get the sockets
     socket_from = None
@@ -229,62 +134,62 @@ def connect_nodes():
 
     # Check outputs
     for output in node_from.outputs:
-        if output.name == '{from_socket}':
+        if output.name == P["from_socket"]:
             socket_from = output
             break
 
     # Check inputs
     for input in node_to.inputs:
-        if input.name == '{to_socket}':
+        if input.name == P["to_socket"]:
             socket_to = input
             break
 
     if not socket_from or not socket_to:
-        return {{'status': 'ERROR', 'error': 'One or both sockets not found'}}
+        return {'status': 'ERROR', 'error': 'One or both sockets not found'}
 
     # Connect the nodes
     scene.node_tree.links.new(socket_from, socket_to)
 
-    return {{
+    return {
         'status': 'SUCCESS',
-        'connection': {{
-            'from': f"{{node_from.name}}.{{socket_from.name}}",
-            'to': f"{{node_to.name}}.{{socket_to.name}}"
-        }}
-    }}
+        'connection': {
+            'from': f"{node_from.name}.{socket_from.name}",
+            'to': f"{node_to.name}.{socket_to.name}"
+        }
+    }
 
 try:
     result = connect_nodes()
 except Exception as e:
-    result = {{'status': 'ERROR', 'error': str(e)}}
+    result = {'status': 'ERROR', 'error': str(e)}
 
 print(str(result))
 """
-    try:
-        output = await _executor.execute_script(script)
-        return {"status": "SUCCESS", "output": output}
-    except Exception as e:
-        logger.error(f"Failed to connect compositor nodes: {e!s}")
-        return {"status": "ERROR", "error": str(e)}
+)
 
 
-@blender_operation("create_glow_effect", log_args=True)
-async def create_glow_effect(threshold: float = 0.8, size: int = 10, quality: int = 2, **kwargs: Any) -> dict[str, Any]:
-    """Create a glow effect in the compositor."""
-    script = f"""
+_CREATE_GLOW_EFFECT_SCRIPT = Template(
+    """
+import json
+
+P = json.loads($params)
 
 def create_glow():
     scene = bpy.context.scene
     if not scene.node_tree:
-        return {{'status': 'ERROR', 'error': 'Compositor not enabled'}}
+        return {'status': 'ERROR', 'error': 'Compositor not enabled'}
+
+    # Get or create input and output nodes (first node of each type, one pass)
+    by_type = {}
+    for n in scene.node_tree.nodes:
+        by_type.setdefault(n.type, n)
 
-    # Get or create input and output nodes
-    rl_node = next((n for n in scene.node_tree.nodes if n.type == 'R_LAYERS'), None)
+    rl_node = by_type.get('R_LAYERS')
     if not rl_node:
         rl_node = scene.node_tree.nodes.new('CompositorNodeRLayers')
         rl_node.location = (-400, 0)
 
-    output_node = next((n for n in scene.node_tree.nodes if n.type == 'COMPOSITE'), None)
+    output_node = by_type.get('COMPOSITE')
     if not output_node:
         output_node = scene.node_tree.nodes.new('CompositorNodeComposite')
         output_node.location = (400, 0)
@@ -300,9 +205,9 @@ def create_glow():
     glare_node = scene.node_tree.nodes.new('CompositorNodeGlare')
     glare_node.location = (0, -200)
     glare_node.glare_type = 'FOG_GLOW'
-    glare_node.quality = '{quality}'
-    glare_node.threshold = {threshold}
-    glare_node.size = {size}
+    glare_node.quality = str(P["quality"])
+    glare_node.threshold = P["threshold"]
+    glare_node.size = P["size"]
 
     # Link nodes
     links = scene.node_tree.links
@@ -317,25 +222,275 @@ def create_glow():
     # Connect mix to output
     links.new(color_mix.outputs[0], output_node.inputs[0])
 
-    return {{
+    return {
         'status': 'SUCCESS',
         'nodes_created': [
             rgb_node.name,
             color_mix.name,
             glare_node.name
         ]
-    }}
+    }
 
 try:
     result = create_glow()
 except Exception as e:
-    result = {{'status': 'ERROR', 'error': str(e)}}
+    result = {'status': 'ERROR', 'error': str(e)}
 
 print(str(result))
 """
+)
+
+
+_BUILD_COMPOSITOR_GRAPH_SCRIPT = Template(
+    """
+import json
+
+P = json.loads($params)
+
+def socket(sockets, key):
+    # Sockets are addressed by name or by index
+    if isinstance(key, int):
+        return sockets[key] if key < len(sockets) else None
+    return sockets.get(key)
+
+def build_graph():
+    scene = bpy.context.scene
+    scene.use_nodes = True
+    scene.render.use_compositing = True
+    tree = scene.node_tree
+    if not tree:
+        return {'status': 'ERROR', 'error': 'Compositor not enabled'}
+
+    errors = []
+    names = {}
+    rna_props_by_type = {}
+    for spec in P["nodes"]:
+        node = tree.nodes.new(spec["type"])
+        if spec.get("name"):
+            node.name = spec["name"]
+            names[spec["name"]] = node.name
+        node.location = spec.get("location", (0.0, 0.0))
+        rna_props = rna_props_by_type.get(spec["type"])
+        if rna_props is None:
+            rna_props = rna_props_by_type[spec["type"]] = set(node.bl_rna.properties.keys())
+        for key, value in spec.get("properties", {}).items():
+            if key in rna_props:
+                try:
+                    setattr(node, key, value)
+                except Exception as e:
+                    errors.append(f"{node.name}.{key}: {str(e)}")
+
+    links = []
+    for spec in P["links"]:
+        node_from = tree.nodes.get(names.get(spec["from_node"], spec["from_node"]))
+        node_to = tree.nodes.get(names.get(spec["to_node"], spec["to_node"]))
+        if not node_from or not node_to:
+            errors.append(f"Link {spec['from_node']} -> {spec['to_node']}: node not found")
+            continue
+        socket_from = socket(node_from.outputs, spec["from_socket"])
+        socket_to = socket(node_to.inputs, spec["to_socket"])
+        if not socket_from or not socket_to:
+            errors.append(f"Link {spec['from_node']} -> {spec['to_node']}: socket not found")
+            continue
+        tree.links.new(socket_from, socket_to)
+        links.append(f"{node_from.name}.{socket_from.name} -> {node_to.name}.{socket_to.name}")
+
+    return {
+        'status': 'SUCCESS' if not errors else 'PARTIAL',
+        'nodes_created': len(P["nodes"]),
+        'node_names': names,
+        'links': links,
+        'errors': errors
+    }
+
+try:
+    result = build_graph()
+except Exception as e:
+    result = {'status': 'ERROR', 'error': str(e)}
+
+print(str(result))
+"""
+)
+
+
+class CompositorNodeType(StrEnum):
+    """Common compositor node types."""
+
+    BLUR = "CompositorNodeBlur"
+    RGB = "CompositorNodeRGB"
+    MIX = "CompositorNodeMixRGB"
+    ALPHA_OVER = "CompositorNodeAlphaOver"
+    GLOW = "CompositorNodeGlare"
+    COLOR_BALANCE = "CompositorNodeColorBalance"
+    LENS_DIST = "CompositorNodeLensdist"
+    VECTOR_BLUR = "CompositorNodeVecBlur"
+    DEFOCUS = "CompositorNodeBokehBlur"
+    CORNER_PIN = "CompositorNodeCornerPin"
+    CRYPTOMATTE = "CompositorNodeCryptomatteV2"
+    DENOISE = "CompositorNodeDenoise"
+    DIFF_MATTE = "CompositorNodeDiffMatte"
+    DILATE_ERODE = "CompositorNodeDilateErode"
+    DIRECTIONAL_BLUR = "CompositorNodeDBlur"
+    DISPLACE = "CompositorNodeDisplace"
+    DISTORT = "CompositorNodeMapUV"
+    ELLIPSE_MASK = "CompositorNodeEllipseMask"
+    FILTER = "CompositorNodeFilter"
+    FLIP = "CompositorNodeFlip"
+    GAMMA = "CompositorNodeGamma"
+    HUE_SAT = "CompositorNodeHueSat"
+    ID_MASK = "CompositorNodeIDMask"
+    INVERT = "CompositorNodeInvert"
+    KEYING = "CompositorNodeKeying"
+    KEYING_SCREEN = "CompositorNodeKeyingScreen"
+    LENSDIST = "CompositorNodeLensdist"
+    LEVELS = "CompositorNodeLevels"
+    LUMA_MATTE = "CompositorNodeLumaMatte"
+    MAP_RANGE = "CompositorNodeMapRange"
+    MAP_VALUE = "CompositorNodeMapValue"
+    MASK = "CompositorNodeMask"
+    MATH = "CompositorNodeMath"
+    MOVIECLIP = "CompositorNodeMovieClip"
+    MOVIEDISTORTION = "CompositorNodeMovieDistortion"
+    NORMAL = "CompositorNodeNormal"
+    NORMALIZE = "CompositorNodeNormalize"
+    PIXELATE = "CompositorNodePixelate"
+    PREMULKEY = "CompositorNodePremulKey"
+    RGBTOBW = "CompositorNodeRGBToBW"
+    ROTATE = "CompositorNodeRotate"
+    SCALE = "CompositorNodeScale"
+    SEPARATE_XYZ = "CompositorNodeSeparateXYZ"
+    SEPCOMBINE_XYZ = "CompositorNodeCombineXYZ"
+    SEPARATE_COLOR = "CompositorNodeSepRGBA"
+    SEPCOMBINE_COLOR = "CompositorNodeCombRGBA"
+    SEPARATE_HSVA = "CompositorNodeSepHSVA"
+    SEPCOMBINE_HSVA = "CompositorNodeCombHSVA"
+    SEPARATE_HSI = "CompositorNodeSepHSI"
+    SEPCOMBINE_HSI = "CompositorNodeCombHSI"
+    SEPARATE_HSL = "CompositorNodeSepHSL"
+    SEPCOMBINE_HSL = "CompositorNodeCombHSL"
+    SEPARATE_YCCA = "CompositorNodeSepYCCA"
+    SEPCOMBINE_YCCA = "CompositorNodeCombYCCA"
+    SEPARATE_YUVA = "CompositorNodeSepYUVA"
+    SEPCOMBINE_YUVA = "CompositorNodeCombYUVA"
+    SET_ALPHA = "CompositorNodeSetAlpha"
+    SPLITVIEWER = "CompositorNodeSplitViewer"
+    STABILIZE2D = "CompositorNodeStabilize"
+    SUNBEAMS = "CompositorNodeSunBeams"
+    TEXTURE = "CompositorNodeTexture"
+    TONEMAP = "CompositorNodeTonemap"
+    TRACKPOS = "CompositorNodeTrackPos"
+    TRANSFORM = "CompositorNodeTransform"
+    TRANSLATE = "CompositorNodeTranslate"
+    VALTORGB = "CompositorNodeValToRGB"
+    VECBLUR = "CompositorNodeVecBlur"
+    VECTORMATH = "CompositorNodeVectorBlur"
+    VIEW_LEVELS = "CompositorNodeViewLevels"
+    ZCOMBINE = "CompositorNodeZcombine"
+    ZCOMBINE_VEC = "CompositorNodeZcombineVector"
+    ZCOMBINE_NORMAL = "CompositorNodeZcombineNormal"
+    ZCOMBINE_ALPHA = "CompositorNodeZcombineAlpha"
+    ZCOMBINE_DIFF = "CompositorNodeZcombineDiff"
+    ZCOMBINE_PREMUL = "CompositorNodeZcombinePremul"
+    ZCOMBINE_ALPHA_PREMUL = "CompositorNodeZcombineAlphaPremul"
+    ZCOMBINE_NORMAL_PREMUL = "CompositorNodeZcombineNormalPremul"
+    ZCOMBINE_DIFF_PREMUL = "CompositorNodeZcombineDiffPremul"
+    ZCOMBINE_ALPHA_DIFF_PREMUL = "CompositorNodeZcombineAlphaDiffPremul"
+    ZCOMBINE_NORMAL_DIFF_PREMUL = "CompositorNodeZcombineNormalDiffPremul"
+
+
+# Built once so resolving a node type is a dict lookup rather than an Enum call.
+# Short names ("BLUR") map to Blender identifiers; anything else is passed through,
+# since the enum only lists common nodes.
+_NODE_TYPE_ALIASES: dict[str, str] = {name: member.value for name, member in CompositorNodeType.__members__.items()}
+_NODE_TYPES = frozenset(_NODE_TYPE_ALIASES.values())
+
+
+def _resolve_node_type(node_type: CompositorNodeType | str) -> str:
+    node_type = str(node_type)
+    if node_type in _NODE_TYPES:
+        return node_type
+    return _NODE_TYPE_ALIASES.get(node_type.upper(), node_type)
+
+
+@blender_operation("enable_compositor", log_args=True)
+async def enable_compositor(use_nodes: bool = True, use_sequencer: bool = False, **kwargs: Any) -> dict[str, Any]:
+    """Enable the compositor and configure basic settings."""
+    params = {"use_nodes": use_nodes, "use_sequencer": use_sequencer}
+    try:
+        output = await _executor.execute_script_persistent(bind_script(_ENABLE_COMPOSITOR_SCRIPT), params=params)
+        return {"status": "SUCCESS", "output": output}
+    except Exception as e:
+        logger.error(f"Failed to enable compositor: {e!s}")
+        return {"status": "ERROR", "error": str(e)}
+
+
+@blender_operation("add_compositor_node", log_args=True)
+async def add_compositor_node(
+    node_type: CompositorNodeType | str,
+    node_name: str | None = None,
+    location: tuple[float, float] = (0.0, 0.0),
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Add a node to the compositor."""
+    params = {
+        "node_type": _resolve_node_type(node_type),
+        "node_name": node_name,
+        "location": list(location),
+        "properties": kwargs,
+    }
+    try:
+        output = await _executor.execute_script_persistent(bind_script(_ADD_COMPOSITOR_NODE_SCRIPT), params=params)
+        return {"status": "SUCCESS", "output": output}
+    except Exception as e:
+        logger.error(f"Failed to add compositor node: {e!s}")
+        return {"status": "ERROR", "error": str(e)}
+
+
+@blender_operation("connect_compositor_nodes", log_args=True)
+async def connect_compositor_nodes(
+    from_node: str, from_socket: str, to_node: str, to_socket: str, **kwargs: Any
+) -> dict[str, Any]:
+    """Connect two nodes in the compositor."""
+    params = {"from_node": from_node, "from_socket": from_socket, "to_node": to_node, "to_socket": to_socket}
+    try:
+        output = await _executor.execute_script_persistent(bind_script(_CONNECT_COMPOSITOR_NODES_SCRIPT), params=params)
+        return {"status": "SUCCESS", "output": output}
+    except Exception as e:
+        logger.error(f"Failed to connect compositor nodes: {e!s}")
+        return {"status": "ERROR", "error": str(e)}
+
+
+@blender_operation("create_glow_effect", log_args=True)
+async def create_glow_effect(threshold: float = 0.8, size: int = 10, quality: int = 2, **kwargs: Any) -> dict[str, Any]:
+    """Create a glow effect in the compositor."""
+    params = {"threshold": threshold, "size": size, "quality": quality}
     try:
-        output = await _executor.execute_script(script)
+        output = await _executor.execute_script_persistent(bind_script(_CREATE_GLOW_EFFECT_SCRIPT), params=params)
         return {"status": "SUCCESS", "output": output}
     except Exception as e:
         logger.error(f"Failed to create glow effect: {e!s}")
         return {"status": "ERROR", "error": str(e)}
+
+
+@blender_operation("build_compositor_graph", log_args=True)
+async def build_compositor_graph(
+    nodes: list[dict[str, Any]],
+    links: list[dict[str, Any]] | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Add several compositor nodes and links in a single Blender run.
+
+    Each node is ``{"type", "name"?, "location"?, "properties"?}``; each link is
+    ``{"from_node", "from_socket", "to_node", "to_socket"}`` with sockets given by
+    name or index. Links may refer to nodes created in the same call or already
+    in the tree. A whole graph costs one Blender launch instead of one per node
+    and link.
+    """
+    nodes = [{**spec, "type": _resolve_node_type(spec["type"])} for spec in nodes]
+    params = {"nodes": nodes, "links": links or []}
+    try:
+        output = await _executor.execute_script_persistent(bind_script(_BUILD_COMPOSITOR_GRAPH_SCRIPT), params=params)
+        return {"status": "SUCCESS", "output": output}
+    except Exception as e:
+        logger.error(f"Failed to build compositor graph: {e!s}")
+        return {"status": "ERROR", "error": str(e)}
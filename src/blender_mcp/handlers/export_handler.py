@@ -6,65 +6,275 @@ This module provides export functions that can be registered as FastMCP tools.
 import logging
 import os
 from pathlib import Path
+from string import Template
 
 from ..compat import *
 
 logger = logging.getLogger(__name__)
-import enum
 
 from ..decorators import blender_operation
 from ..exceptions import BlenderExportError
-from ..utils.blender_executor import get_blender_executor
+from ..utils.blender_executor import bind_script, get_blender_executor
 
 # Initialize the executor with default Blender executable
 _executor = get_blender_executor()
 
 
-def _get_export_script_setup(output_path: str, blend_path: str | None = None) -> str:
-    """Generate the common setup script for export operations.
+# Blender scripts are constant text built once at import; arguments travel separately as
+# JSON (see bind_script), so paths and names cannot break out of the script.
+# Common setup for export operations: P["output_path"] is where the file is written and
+# P["output_dir"] its directory (resolved by the caller), the optional P["blend_path"] is
+# a .blend file to load first and P["object_names"] limits the selection.
+_EXPORT_SETUP = """
+import os
+import json
+
+P = json.loads($params)
 
-    Args:
-        output_path: Path where FBX will be exported
-        blend_path: Optional path to .blend file to load before export
-    """
-    load_blend = ""
-    if blend_path:
-        # Escape backslashes for the raw string in the generated script
-        blend_path_escaped = blend_path.replace("\\", "\\\\")
-        load_blend = f"""
 # Load .blend file if specified
-blend_file_path = r"{blend_path_escaped}"
-import os
-if os.path.exists(blend_file_path):
-    bpy.ops.wm.open_mainfile(filepath=blend_file_path)
-    print(f"Loaded .blend file: {{blend_file_path}}")
-else:
-    print(f"WARNING: .blend file not found: {{blend_file_path}}")
-"""
+blend_file_path = P.get("blend_path")
+if blend_file_path:
+    if os.path.exists(blend_file_path):
+        bpy.ops.wm.open_mainfile(filepath=blend_file_path)
+        print(f"Loaded .blend file: {blend_file_path}")
+    else:
+        print(f"WARNING: .blend file not found: {blend_file_path}")
 
-    return f"""
-import os
-import json
-from pathlib import Path
-{load_blend}
 # Ensure output directory exists
-output_dir = os.path.dirname(r"{output_path}")
+output_dir = P["output_dir"]
 os.makedirs(output_dir, exist_ok=True)
 
 # Get scene and objects
 scene = bpy.context.scene
 original_objects = list(scene.objects)
 
-# Select all mesh objects for export
-mesh_objects = [obj for obj in original_objects if obj.type == 'MESH']
-print(f"Found {{len(mesh_objects)}} mesh objects for export:")
+# Objects to export: P["object_names"] when given, otherwise every mesh
+object_names = P.get("object_names")
+if object_names:
+    object_names = set(object_names)
+    mesh_objects = [obj for obj in original_objects if obj.name in object_names]
+else:
+    mesh_objects = [obj for obj in original_objects if obj.type == 'MESH']
+print(f"Found {len(mesh_objects)} mesh objects for export:")
 for obj in mesh_objects:
-    print(f"  - {{obj.name}}")
+    print(f"  - {obj.name}")
+
+# Scopes operator calls to mesh_objects without touching the global selection
+export_context = bpy.context.temp_override(
+    selected_objects=mesh_objects,
+    selected_editable_objects=mesh_objects,
+    active_object=mesh_objects[0] if mesh_objects else None,
+)
+"""
+
+# Global selection for exporters that read selection state from the objects themselves
+_SELECTION = """
 bpy.ops.object.select_all(action='DESELECT')
 for obj in mesh_objects:
     obj.select_set(True)
 """
 
+_UNITY_EXPORT_SCRIPT = Template(
+    _EXPORT_SETUP
+    + """
+try:
+    # Configure export settings
+    export_path = P["output_path"]
+    print(f"Starting FBX export to: {export_path}")
+    print(f"Selected {len(mesh_objects)} mesh objects for export")
+
+    with export_context:
+        bpy.ops.export_scene.fbx(
+            filepath=export_path,
+            use_selection=True,
+            apply_scale_options='FBX_SCALE_ALL',
+            global_scale=P["scale"],
+            apply_unit_scale=True,
+            bake_space_transform=True,
+            object_types={'MESH', 'ARMATURE', 'OTHER'},
+            use_mesh_modifiers=P["apply_modifiers"],
+            add_leaf_bones=False,
+            primary_bone_axis='Y',
+            secondary_bone_axis='X',
+            use_armature_deform_only=True,
+            bake_anim=False,
+            path_mode='AUTO',
+            embed_textures=P["bake_textures"]
+        )
+
+    # Verify file was created
+    if os.path.exists(export_path):
+        file_size = os.path.getsize(export_path)
+        print(f"SUCCESS: FBX file created at {export_path} ({file_size} bytes)")
+    else:
+        print(f"ERROR: FBX file was not created at {export_path}")
+        raise Exception("FBX export completed but file not found")
+
+    # Collect statistics
+    stats = {
+        'export_path': export_path,
+        'object_count': len(mesh_objects),
+        'scale_factor': P["scale"],
+        'applied_modifiers': P["apply_modifiers"],
+        'optimized_materials': P["optimize_materials"],
+        'baked_textures': P["bake_textures"],
+        'lod_levels': P["lod_levels"]
+    }
+
+    print(f"SUCCESS: Unity export complete!")
+    print(f"Export details: {json.dumps(stats, indent=2)}")
+
+except Exception as e:
+    # The executor's wrapper prints the traceback once
+    print(f"ERROR: Export failed: {type(e).__name__}: {e}")
+    raise
+"""
+)
+
+_VRCHAT_EXPORT_SCRIPT = Template(
+    _EXPORT_SETUP
+    + """
+# Check performance metrics (mesh_objects holds meshes only; orphan materials are not exported)
+total_polys = sum(len(obj.data.polygons) for obj in mesh_objects)
+material_count = sum(1 for mat in bpy.data.materials if mat.users > 0)
+
+# Check against limits
+warnings = []
+if total_polys > P["polygon_limit"]:
+    warnings.append(f"Polygon count {total_polys} exceeds limit of {P['polygon_limit']}")
+
+if material_count > P["material_limit"]:
+    warnings.append(f"Material count {material_count} exceeds limit of {P['material_limit']}")
+
+# Configure export settings. The whole scene is exported without export_context:
+# an avatar needs its armature, which mesh_objects leaves out
+if not warnings:
+    bpy.ops.export_scene.vrm(
+        filepath=P["output_path"],
+        export_invisibles=False,
+        export_only_selections=False,
+        export_tangent_space=False,
+        export_texture_dir=P["texture_dir"]
+    )
+
+    print(f"SUCCESS: VRChat export complete!")
+    print(f"Performance rank: {P['performance_rank']}")
+    print(f"Total polygons: {total_polys}")
+    print(f"Total materials: {material_count}")
+else:
+    print("ERROR: Export failed - Performance limits exceeded")
+    for warning in warnings:
+        print(f"WARNING: {warning}")
+    raise Exception("VRChat performance limits exceeded")
+"""
+)
+
+# Export operator call per format for export_scene_format
+_FORMAT_EXPORT_OPS = {
+    "GLTF": """
+    bpy.ops.export_scene.gltf(
+        filepath=P["output_path"],
+        use_selection=True,
+        export_format='GLTF_SEPARATE',
+        export_apply=P["apply_modifiers"],
+        export_yup=True,
+    )
+""",
+    "GLB": """
+    bpy.ops.export_scene.gltf(
+        filepath=P["output_path"],
+        use_selection=True,
+        export_format='GLB',
+        export_apply=P["apply_modifiers"],
+        export_yup=True,
+    )
+""",
+    "FBX": """
+    bpy.ops.export_scene.fbx(
+        filepath=P["output_path"],
+        use_selection=True,
+        apply_scale_options='FBX_SCALE_ALL',
+        global_scale=P["global_scale"],
+        apply_unit_scale=True,
+        bake_space_transform=True,
+        use_mesh_modifiers=P["apply_modifiers"],
+        add_leaf_bones=False,
+    )
+""",
+    "OBJ": """
+    bpy.ops.export_scene.obj(
+        filepath=P["output_path"],
+        use_selection=True,
+        use_mesh_modifiers=P["apply_modifiers"],
+        global_scale=P["global_scale"],
+    )
+""",
+    "STL": """
+    bpy.ops.export_mesh.stl(
+        filepath=P["output_path"],
+        use_selection=True,
+        use_mesh_modifiers=P["apply_modifiers"],
+        global_scale=P["global_scale"],
+    )
+""",
+    "USD": """
+    bpy.ops.wm.usd_export(
+        filepath=P["output_path"],
+        selected_objects_only=True,
+    )
+""",
+    "VRM": """
+    bpy.ops.export_scene.vrm(
+        filepath=P["output_path"],
+        export_only_selections=True,
+    )
+""",
+}
+
+_UNREAL_EXPORT_OP = """
+    bpy.ops.export_scene.fbx(
+        filepath=P["output_path"],
+        use_selection=True,
+        apply_scale_options='FBX_SCALE_ALL',
+        global_scale=P["global_scale"],
+        apply_unit_scale=True,
+        bake_space_transform=True,
+        use_mesh_modifiers=P["apply_modifiers"],
+        mesh_smooth_type='FACE',
+        use_tspace=True,
+        add_leaf_bones=False,
+        axis_forward='-Z',
+        axis_up='Y',
+    )
+"""
+
+
+def _selected_export_script(export_op: str) -> Template:
+    return Template(
+        _EXPORT_SETUP
+        + _SELECTION
+        + f"""
+try:
+{export_op}
+    print("EXPORT_SUCCESS:" + P["output_path"])
+except Exception as e:
+    print("EXPORT_ERROR:" + str(e))
+    raise
+"""
+    )
+
+
+_FORMAT_EXPORT_SCRIPTS = {fmt: _selected_export_script(op) for fmt, op in _FORMAT_EXPORT_OPS.items()}
+_UNREAL_EXPORT_SCRIPT = _selected_export_script(_UNREAL_EXPORT_OP)
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    """Stat *path* once, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
 @blender_operation("export_for_unity", log_args=True)
 async def export_for_unity(
@@ -93,95 +303,44 @@ async def export_for_unity(
     """
     try:
         # Validate output path
-        output_path = str(Path(output_path).absolute())
+        output_path = os.path.abspath(output_path)
         output_dir = os.path.dirname(output_path)
         if not output_dir:
             raise BlenderExportError("FBX", output_path, "Invalid output directory")
 
         # Generate the export script - load .blend file if it exists
-        blend_path = str(Path(output_path).with_suffix(".blend"))
-        script = _get_export_script_setup(output_path, blend_path=blend_path)
-        script += f"""
-try:
-    # Configure export settings
-    export_path = r"{output_path}"
-    print(f"Starting FBX export to: {{export_path}}")
-    print(f"Selected {{len(mesh_objects)}} mesh objects for export")
+        params = {
+            "output_path": output_path,
+            "output_dir": output_dir,
+            "blend_path": os.path.splitext(output_path)[0] + ".blend",
+            "scale": scale,
+            "apply_modifiers": apply_modifiers,
+            "optimize_materials": optimize_materials,
+            "bake_textures": bake_textures,
+            "lod_levels": lod_levels,
+        }
 
-    # Select all mesh objects for export
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in mesh_objects:
-        obj.select_set(True)
-
-    bpy.ops.export_scene.fbx(
-        filepath=export_path,
-        use_selection=True,
-        apply_scale_options='FBX_SCALE_ALL',
-        global_scale={scale},
-        apply_unit_scale=True,
-        bake_space_transform=True,
-        object_types={{'MESH', 'ARMATURE', 'OTHER'}},
-        use_mesh_modifiers={apply_modifiers},
-        add_leaf_bones=False,
-        primary_bone_axis='Y',
-        secondary_bone_axis='X',
-        use_armature_deform_only=True,
-        bake_anim=False,
-        path_mode='AUTO',
-        embed_textures={bake_textures}
-    )
-
-    # Verify file was created
-    import os
-    if os.path.exists(export_path):
-        file_size = os.path.getsize(export_path)
-        print(f"SUCCESS: FBX file created at {{export_path}} ({{file_size}} bytes)")
-    else:
-        print(f"ERROR: FBX file was not created at {{export_path}}")
-        raise Exception("FBX export completed but file not found")
-
-    # Collect statistics
-    stats = {{
-        'export_path': export_path,
-        'object_count': len(mesh_objects),
-        'scale_factor': {scale},
-        'applied_modifiers': {apply_modifiers!s},
-        'optimized_materials': {optimize_materials!s},
-        'baked_textures': {bake_textures!s},
-        'lod_levels': {lod_levels}
-    }}
-
-    print(f"SUCCESS: Unity export complete!")
-    print(f"Export details: {{json.dumps(stats, indent=2)}}")
-
-except Exception as e:
-    import traceback
-    error_msg = f"ERROR: Export failed: {{str(e)}}\\n{{traceback.format_exc()}}"
-    print(error_msg)
-    raise e
-"""
         # Execute the export script
         # Check if file exists before export
-        file_existed_before = os.path.exists(output_path)
-        file_mtime_before = os.path.getmtime(output_path) if file_existed_before else 0
+        before = _stat_or_none(output_path)
 
         try:
-            await _executor.execute_script(script, script_name="unity_export")
+            await _executor.execute_script_persistent(
+                bind_script(_UNITY_EXPORT_SCRIPT), script_name="unity_export", params=params
+            )
             # Verify file was created
-            if not os.path.exists(output_path):
+            after = _stat_or_none(output_path)
+            if after is None:
                 raise BlenderExportError("FBX", output_path, "Export completed but file not found")
-            file_size = os.path.getsize(output_path)
-            return f"Successfully exported to {output_path} ({file_size} bytes)"
+            return f"Successfully exported to {output_path} ({after.st_size} bytes)"
         except Exception as e:
             # Check if file was created despite the error (TBBmalloc warning or viewport error)
             error_str = str(e)
-            if os.path.exists(output_path):
-                file_mtime_after = os.path.getmtime(output_path)
-                # If file was created or updated, treat as success
-                if not file_existed_before or file_mtime_after > file_mtime_before:
-                    file_size = os.path.getsize(output_path)
-                    logger.warning(f"Blender exited with error but FBX file was created: {error_str}")
-                    return f"Successfully exported to {output_path} ({file_size} bytes) - warning ignored"
+            after = _stat_or_none(output_path)
+            # If file was created or updated, treat as success
+            if after is not None and (before is None or after.st_mtime > before.st_mtime):
+                logger.warning(f"Blender exited with error but FBX file was created: {error_str}")
+                return f"Successfully exported to {output_path} ({after.st_size} bytes) - warning ignored"
             # If no file was created, raise error
             raise BlenderExportError("FBX", output_path, error_str) from e
 
@@ -215,50 +374,25 @@ async def export_for_vrchat(
     """
     try:
         # Validate output path
-        output_path = str(Path(output_path).absolute())
+        output_path = os.path.abspath(output_path)
         output_dir = os.path.dirname(output_path)
         if not output_dir:
             raise BlenderExportError("VRM", output_path, "Invalid output directory")
 
         # Generate the export script
-        script = _get_export_script_setup(output_path)
-        script += f"""
-# Check performance metrics
-total_polys = 0
-for obj in mesh_objects:
-    if obj.type == 'MESH':
-        total_polys += len(obj.data.polygons)
-
-# Check against limits
-warnings = []
-if total_polys > {polygon_limit}:
-    warnings.append(f"Polygon count {{total_polys}} exceeds limit of {{'{polygon_limit}'}}")
-
-if len(bpy.data.materials) > {material_limit}:
-    warnings.append(f"Material count {{len(bpy.data.materials)}} exceeds limit of {{'{material_limit}'}}")
-
-# Configure export settings
-if not warnings:
-    bpy.ops.export_scene.vrm(
-        filepath=r"{output_path}",
-        export_invisibles=False,
-        export_only_selections=False,
-        export_tangent_space=False,
-        export_texture_dir=os.path.join(os.path.dirname(r"{output_path}"), "textures")
-    )
+        params = {
+            "output_path": output_path,
+            "output_dir": output_dir,
+            "texture_dir": os.path.join(output_dir, "textures"),
+            "polygon_limit": polygon_limit,
+            "material_limit": material_limit,
+            "performance_rank": performance_rank,
+        }
 
-    print(f"SUCCESS: VRChat export complete!")
-    print(f"Performance rank: {{'{performance_rank}'}}")
-    print(f"Total polygons: {{total_polys}}")
-    print(f"Total materials: {{len(bpy.data.materials)}}")
-else:
-    print("ERROR: Export failed - Performance limits exceeded")
-    for warning in warnings:
-        print(f"WARNING: {{warning}}")
-    raise Exception("VRChat performance limits exceeded")
-"""
         # Execute the export script
-        await _executor.execute_script(script, script_name="vrc_export")
+        await _executor.execute_script_persistent(
+            bind_script(_VRCHAT_EXPORT_SCRIPT), script_name="vrc_export", params=params
+        )
         return f"Successfully exported to {output_path} with {performance_rank} performance settings"
 
     except Exception as e:
@@ -266,23 +400,6 @@ else:
         raise BlenderExportError("VRM", output_path, str(e)) from e
 
 
-def _selection_script(object_names: list[str] | None) -> str:
-    if not object_names:
-        return """
-mesh_objects = [obj for obj in scene.objects if obj.type == 'MESH']
-bpy.ops.object.select_all(action='DESELECT')
-for obj in mesh_objects:
-    obj.select_set(True)
-"""
-    names_repr = repr(object_names)
-    return f"""
-mesh_objects = [obj for obj in scene.objects if obj.name in {names_repr}]
-bpy.ops.object.select_all(action='DESELECT')
-for obj in mesh_objects:
-    obj.select_set(True)
-"""
-
-
 @blender_operation("export_scene_format", log_args=True)
 async def export_scene_format(
     output_path: str,
@@ -292,93 +409,24 @@ async def export_scene_format(
     global_scale: float = 1.0,
 ) -> dict[str, Any]:
     """Export the scene to a standard interchange format."""
-
-    class ExportFormat(enum.StrEnum):
-        GLTF = "GLTF"
-        GLB = "GLB"
-        FBX = "FBX"
-        OBJ = "OBJ"
-        STL = "STL"
-        USD = "USD"
-        VRM = "VRM"
-
     fmt = file_format.upper()
-    if fmt not in {item.value for item in ExportFormat}:
+    if fmt not in _FORMAT_EXPORT_SCRIPTS:
         raise BlenderExportError(fmt, output_path, f"Unsupported export format: {file_format}")
 
-    output_path = str(Path(output_path).absolute())
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    output_path = os.path.abspath(output_path)
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
 
-    selection_block = _selection_script(object_names)
-    export_op = ""
-    if fmt in ("GLTF", "GLB"):
-        export_format = "GLB" if fmt == "GLB" else "GLTF_SEPARATE"
-        export_op = f"""
-    bpy.ops.export_scene.gltf(
-        filepath=r"{output_path}",
-        use_selection=True,
-        export_format='{export_format}',
-        export_apply={str(apply_modifiers).lower()},
-        export_yup=True,
-    )
-"""
-    elif fmt == "FBX":
-        export_op = f"""
-    bpy.ops.export_scene.fbx(
-        filepath=r"{output_path}",
-        use_selection=True,
-        apply_scale_options='FBX_SCALE_ALL',
-        global_scale={global_scale},
-        apply_unit_scale=True,
-        bake_space_transform=True,
-        use_mesh_modifiers={str(apply_modifiers).lower()},
-        add_leaf_bones=False,
-    )
-"""
-    elif fmt == "OBJ":
-        export_op = f"""
-    bpy.ops.export_scene.obj(
-        filepath=r"{output_path}",
-        use_selection=True,
-        use_mesh_modifiers={str(apply_modifiers).lower()},
-        global_scale={global_scale},
-    )
-"""
-    elif fmt == "STL":
-        export_op = f"""
-    bpy.ops.export_mesh.stl(
-        filepath=r"{output_path}",
-        use_selection=True,
-        use_mesh_modifiers={str(apply_modifiers).lower()},
-        global_scale={global_scale},
-    )
-"""
-    elif fmt == "USD":
-        export_op = f"""
-    bpy.ops.wm.usd_export(
-        filepath=r"{output_path}",
-        selected_objects_only=True,
-    )
-"""
-    elif fmt == "VRM":
-        export_op = f"""
-    bpy.ops.export_scene.vrm(
-        filepath=r"{output_path}",
-        export_only_selections=True,
+    params = {
+        "output_path": output_path,
+        "output_dir": output_dir,
+        "object_names": object_names,
+        "apply_modifiers": apply_modifiers,
+        "global_scale": global_scale,
+    }
+    await _executor.execute_script_persistent(
+        bind_script(_FORMAT_EXPORT_SCRIPTS[fmt]), script_name=f"export_{fmt.lower()}", params=params
     )
-"""
-
-    script = _get_export_script_setup(output_path)
-    script += selection_block
-    script += f"""
-try:
-{export_op}
-    print("EXPORT_SUCCESS:" + r"{output_path}")
-except Exception as e:
-    print("EXPORT_ERROR:" + str(e))
-    raise
-"""
-    await _executor.execute_script(script, script_name=f"export_{fmt.lower()}")
     return {
         "success": True,
         "format": fmt,
@@ -387,6 +435,73 @@ except Exception as e:
     }
 
 
+@blender_operation("export_blend_files", log_args=True)
+async def export_blend_files(
+    blend_files: list[str],
+    output_dir: str,
+    file_format: str = "GLB",
+    apply_modifiers: bool = True,
+    global_scale: float = 1.0,
+) -> dict[str, Any]:
+    """Export several .blend files concurrently, one Blender process per file.
+
+    Each file is written to ``output_dir`` under its own stem with the format's extension;
+    a stem already used by an earlier file gets a ``_2``, ``_3``... suffix. Missing files
+    are reported as per-file errors without starting Blender for them.
+    """
+    fmt = file_format.upper()
+    if fmt not in _FORMAT_EXPORT_SCRIPTS:
+        raise BlenderExportError(fmt, output_dir, f"Unsupported export format: {file_format}")
+
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    exports: list[dict[str, Any]] = []
+    jobs: list[dict[str, Any]] = []
+    job_exports: list[dict[str, Any]] = []
+    taken_names: set[str] = set()
+    for blend_file in blend_files:
+        blend_path = os.path.abspath(blend_file)
+        if not os.path.isfile(blend_path):
+            exports.append(
+                {"blend_file": blend_file, "output_path": None, "error": f"Blend file not found: {blend_path}"}
+            )
+            continue
+
+        stem = name = os.path.splitext(os.path.basename(blend_file))[0]
+        suffix = 2
+        while name in taken_names:
+            name = f"{stem}_{suffix}"
+            suffix += 1
+        taken_names.add(name)
+
+        job = {
+            "output_path": os.path.join(output_dir, f"{name}.{fmt.lower()}"),
+            "output_dir": output_dir,
+            "blend_path": blend_path,
+            "object_names": None,
+            "apply_modifiers": apply_modifiers,
+            "global_scale": global_scale,
+        }
+        export = {"blend_file": blend_file, "output_path": job["output_path"], "error": None}
+        jobs.append(job)
+        job_exports.append(export)
+        exports.append(export)
+
+    if jobs:
+        script = bind_script(_FORMAT_EXPORT_SCRIPTS[fmt])
+        results = await _executor.execute_parallel([script] * len(jobs), params=jobs)
+        for export, result in zip(job_exports, results, strict=True):
+            export["error"] = result["error"]
+    failed = sum(1 for export in exports if export["error"])
+    return {
+        "success": failed == 0,
+        "format": fmt,
+        "exports": exports,
+        "message": f"Exported {len(exports) - failed}/{len(exports)} .blend files to {fmt} in {output_dir}",
+    }
+
+
 @blender_operation("export_for_unreal", log_args=True)
 async def export_for_unreal(
     output_path: str,
@@ -398,34 +513,19 @@ async def export_for_unreal(
     if not output_path.lower().endswith(".fbx"):
         output_path = str(Path(output_path).with_suffix(".fbx"))
 
-    output_path = str(Path(output_path).absolute())
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    selection_block = _selection_script(object_names)
-
-    script = _get_export_script_setup(output_path)
-    script += selection_block
-    script += f"""
-try:
-    bpy.ops.export_scene.fbx(
-        filepath=r"{output_path}",
-        use_selection=True,
-        apply_scale_options='FBX_SCALE_ALL',
-        global_scale={global_scale},
-        apply_unit_scale=True,
-        bake_space_transform=True,
-        use_mesh_modifiers={str(apply_modifiers).lower()},
-        mesh_smooth_type='FACE',
-        use_tspace=True,
-        add_leaf_bones=False,
-        axis_forward='-Z',
-        axis_up='Y',
+    output_path = os.path.abspath(output_path)
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
+    params = {
+        "output_path": output_path,
+        "output_dir": output_dir,
+        "object_names": object_names,
+        "apply_modifiers": apply_modifiers,
+        "global_scale": global_scale,
+    }
+    await _executor.execute_script_persistent(
+        bind_script(_UNREAL_EXPORT_SCRIPT), script_name="export_unreal", params=params
     )
-    print("EXPORT_SUCCESS:" + r"{output_path}")
-except Exception as e:
-    print("EXPORT_ERROR:" + str(e))
-    raise
-"""
-    await _executor.execute_script(script, script_name="export_unreal")
     return {
         "success": True,
         "format": "FBX",
@@ -5,20 +5,52 @@ VRChat, Resonite, and Unity with appropriate scale, format, and settings.
 """
 
 import logging
+import re
+from collections.abc import Callable, Mapping
+from string import Template
+from types import MappingProxyType
 from typing import Any
 
 from ..decorators import blender_operation
 
 logger = logging.getLogger(__name__)
 from ..exceptions import BlenderExportError
-from ..utils.blender_executor import get_blender_executor
+from ..utils.blender_executor import ScriptBatcher, bind_script, get_blender_executor
+
+_loads: Callable[[str | bytes], Any]
+try:
+    # orjson decodes the per-item validation payloads several times faster than the stdlib
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
 
 # Initialize the executor with default Blender executable
 _executor = get_blender_executor()
 
+# Concurrent export/validate calls share one Blender round-trip
+_batcher = ScriptBatcher(_executor)
+
+
+# Tagged result lines printed by the preset scripts, matched in one pass over the output
+_TAG_PATTERN = re.compile(
+    r"^(ERROR|EXPORT_SUCCESS|OBJECTS_EXPORTED|WARNING|VALIDATION_FAILED|VALIDATION_STATUS"
+    r"|VALIDATION_ISSUE|VALIDATION_WARNING|VALIDATION_RECOMMENDATION):\s*(.*)$",
+    re.MULTILINE,
+)
+
+# Validation report lists and the tag each of their items is printed under, one JSON string per line
+_VALIDATION_ITEM_TAGS = {
+    "issues": "VALIDATION_ISSUE",
+    "warnings": "VALIDATION_WARNING",
+    "recommendations": "VALIDATION_RECOMMENDATION",
+}
 
-# Platform-specific export presets
-PLATFORM_PRESETS = {
+# Platform-specific export presets; scripts serialise these plain dicts as their params
+_PRESET_PARAMS: dict[str, dict[str, Any]] = {
     "VRCHAT": {
         "scale": 1.0,
         "format": "FBX",
@@ -66,72 +98,53 @@ PLATFORM_PRESETS = {
     },
 }
 
+# Read-only views handed to callers, so a returned preset can never alter the table
+PLATFORM_PRESETS = MappingProxyType({name: MappingProxyType(preset) for name, preset in _PRESET_PARAMS.items()})
 
-@blender_operation("export_with_preset")
-async def export_with_preset(
-    target_objects: list[str],
-    platform: str = "VRCHAT",
-    output_path: str = "//export",
-    include_materials: bool = True,
-    include_textures: bool = True,
-    apply_modifiers: bool = True,
-    **kwargs: Any,
-) -> dict[str, Any]:
-    """
-    Export objects using platform-specific presets.
-
-    Applies the correct scale, format, and settings for the target VR platform,
-    ensuring compatibility and optimal performance.
-
-    Args:
-        target_objects: List of object names to export
-        platform: Target platform preset ("VRCHAT", "RESONITE", "UNITY", etc.)
-        output_path: Export output path (without extension)
-        include_materials: Whether to include materials in export
-        include_textures: Whether to include textures in export
-        apply_modifiers: Whether to apply modifiers before export
-
-    Returns:
-        Export operation result with file paths and validation info
+_SUPPORTED_PLATFORMS = list(PLATFORM_PRESETS)
 
-    Raises:
-        BlenderExportError: If export fails or platform is unsupported
-    """
-    logger.info(f"Exporting with {platform} preset to {output_path}")
+# Error messages for unknown platforms, with the supported list rendered once
+_UNSUPPORTED_PLATFORM = "Unsupported platform '%s'. Supported: " + repr(_SUPPORTED_PLATFORMS)
+_UNSUPPORTED_BASE_PLATFORM = "Unsupported base platform '%s'. Supported: " + repr(_SUPPORTED_PLATFORMS)
 
-    if platform not in PLATFORM_PRESETS:
-        supported = list(PLATFORM_PRESETS.keys())
-        raise BlenderExportError(f"Unsupported platform '{platform}'. Supported: {supported}")
+# The presets never change at runtime, so get_platform_presets returns this one response
+_PRESETS_RESPONSE = MappingProxyType(
+    {
+        "status": "success",
+        "presets": PLATFORM_PRESETS,
+        "platforms": _SUPPORTED_PLATFORMS,
+        "message": f"Retrieved {len(PLATFORM_PRESETS)} platform presets",
+    }
+)
 
-    preset = PLATFORM_PRESETS[platform]
 
-    try:
-        script = f"""
+# Blender scripts are constant text built once at import; the preset and call arguments
+# travel separately as JSON (see bind_script), so object names never enter the script and
+# its size does not grow with them. The export script is specialised per output format
+# so the format branch is chosen here rather than inside Blender.
+_PRESET_EXPORT_SETUP = """
 import bpy
-import os
+import json
 
-# Get preset settings
-preset = {preset!r}
-platform = '{platform}'
-target_objects = {target_objects!r}
-output_path = '{output_path}'
-include_materials = {include_materials!r}
-include_textures = {include_textures!r}
-apply_modifiers = {apply_modifiers!r}
+P = json.loads($params)
+preset = P["preset"]
+platform = P["platform"]
+output_path = P["output_path"]
+apply_modifiers = P["apply_modifiers"]
 
-print(f"PLATFORM: {{platform}}")
-print(f"SCALE: {{preset['scale']}}")
-print(f"FORMAT: {{preset['format']}}")
+print(f"PLATFORM: {platform}")
+print(f"SCALE: {preset['scale']}")
+print(f"FORMAT: {preset['format']}")
 
 # Select target objects
 export_objects = []
-for obj_name in target_objects:
+for obj_name in P["target_objects"]:
     obj = bpy.data.objects.get(obj_name)
     if obj:
         export_objects.append(obj)
-        print(f"SELECTED: {{obj_name}}")
+        print(f"SELECTED: {obj_name}")
     else:
-        print(f"WARNING: Object not found: {{obj_name}}")
+        print(f"WARNING: Object not found: {obj_name}")
 
 if not export_objects:
     print("ERROR: No valid objects to export")
@@ -149,167 +162,101 @@ if preset['apply_transforms']:
     bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
     print("TRANSFORMS_APPLIED: True")
 
-# Apply modifiers if required
+# Apply modifiers if required. Names are gathered first because applying one removes
+# it from obj.modifiers, and each object is made active once for all of its modifiers.
 if apply_modifiers:
+    applied_types = {'SUBSURF', 'MIRROR', 'SOLIDIFY'}  # Common modifiers to apply
     for obj in export_objects:
-        if obj.type == 'MESH':
-            for mod in obj.modifiers:
-                if mod.type in ['SUBSURF', 'MIRROR', 'SOLIDIFY']:  # Common modifiers to apply
-                    bpy.context.view_layer.objects.active = obj
-                    bpy.ops.object.modifier_apply(modifier=mod.name)
-                    print(f"MODIFIER_APPLIED: {{mod.name}} on {{obj.name}}")
-
-# Export based on format
-export_success = False
-final_path = ""
-
-if preset['format'] == 'FBX':
-    final_path = output_path + '.fbx'
-    bpy.ops.export_scene.fbx(
-        filepath=bpy.path.abspath(final_path),
-        use_selection=True,
-        apply_unit_scale=True,
-        bake_space_transform=True,
-        use_mesh_modifiers=not apply_modifiers,
-        mesh_smooth_type='FACE',
-        use_tspace=True,
-        add_leaf_bones=False
-    )
-    export_success = True
-
-elif preset['format'] == 'GLTF':
-    final_path = output_path + '.gltf'
-    bpy.ops.export_scene.gltf(
-        filepath=bpy.path.abspath(final_path),
-        use_selection=True,
-        export_format='GLTF_SEPARATE',
-        export_cameras=False,
-        export_lights=False,
-        export_apply=True,
-        export_yup=True
-    )
-    export_success = True
-
-elif preset['format'] == 'BLEND':
-    final_path = output_path + '.blend'
-    # For Blender format, just save selected objects to new file
-    bpy.ops.wm.save_as_mainfile(filepath=bpy.path.abspath(final_path))
-    export_success = True
+        if obj.type != 'MESH':
+            continue
+        modifier_names = [mod.name for mod in obj.modifiers if mod.type in applied_types]
+        if not modifier_names:
+            continue
+        bpy.context.view_layer.objects.active = obj
+        for name in modifier_names:
+            bpy.ops.object.modifier_apply(modifier=name)
+            print(f"MODIFIER_APPLIED: {name} on {obj.name}")
+"""
 
+# Export operator call per preset format
+_PRESET_EXPORT_OPS = {
+    "FBX": """
+final_path = output_path + '.fbx'
+bpy.ops.export_scene.fbx(
+    filepath=bpy.path.abspath(final_path),
+    use_selection=True,
+    apply_unit_scale=True,
+    bake_space_transform=True,
+    use_mesh_modifiers=not apply_modifiers,
+    mesh_smooth_type='FACE',
+    use_tspace=True,
+    add_leaf_bones=False
+)
+""",
+    "GLTF": """
+final_path = output_path + '.gltf'
+bpy.ops.export_scene.gltf(
+    filepath=bpy.path.abspath(final_path),
+    use_selection=True,
+    export_format='GLTF_SEPARATE',
+    export_cameras=False,
+    export_lights=False,
+    export_apply=True,
+    export_yup=True
+)
+""",
+    "BLEND": """
+final_path = output_path + '.blend'
+# For Blender format, just save selected objects to new file
+bpy.ops.wm.save_as_mainfile(filepath=bpy.path.abspath(final_path))
+""",
+}
+
+_PRESET_EXPORT_TEARDOWN = """
 # Restore original scale
 bpy.context.scene.unit_settings.scale_length = original_scale
 
-if export_success:
-    print(f"EXPORT_SUCCESS: {{final_path}}")
-    print(f"OBJECTS_EXPORTED: {{len(export_objects)}}")
-else:
-    print("ERROR: Export failed")
-    exit(1)
-
+print(f"EXPORT_SUCCESS: {final_path}")
+print(f"OBJECTS_EXPORTED: {len(export_objects)}")
 print("EXPORT_COMPLETE: True")
 """
 
-        output = await _executor.execute_script(script)
-        lines = output.strip().split("\n")
-
-        final_path = ""
-        objects_exported = 0
-        warnings = []
-
-        for line in lines:
-            if line.startswith("ERROR:"):
-                raise BlenderExportError(line[7:])
-            elif line.startswith("EXPORT_SUCCESS:"):
-                final_path = line.split(": ")[1]
-            elif line.startswith("OBJECTS_EXPORTED:"):
-                objects_exported = int(line.split(": ")[1])
-            elif line.startswith("WARNING:"):
-                warnings.append(line[7:])
-
-        return {
-            "status": "success",
-            "platform": platform,
-            "format": preset["format"],
-            "scale": preset["scale"],
-            "output_path": final_path,
-            "objects_exported": objects_exported,
-            "warnings": warnings,
-            "message": f"Successfully exported {objects_exported} objects for {platform} platform",
-        }
-
-    except Exception as e:
-        logger.error(f"Platform export failed: {e}")
-        raise BlenderExportError(f"Failed to export with {platform} preset: {e!s}") from e
-
-
-@blender_operation("validate_export_preset")
-async def validate_export_preset(
-    target_objects: list[str],
-    platform: str = "VRCHAT",
-    check_bones: bool = True,
-    check_materials: bool = True,
-    check_scale: bool = True,
-) -> dict[str, Any]:
-    """
-    Validate objects against platform export requirements.
-
-    Checks bone count, material limits, scale compatibility, and other
-    platform-specific requirements before export.
-
-    Args:
-        target_objects: List of object names to validate
-        platform: Target platform to validate against
-        check_bones: Whether to validate bone count and naming
-        check_materials: Whether to validate material compatibility
-        check_scale: Whether to validate scale settings
-
-    Returns:
-        Validation report with issues and recommendations
+_PRESET_EXPORT_SCRIPTS = {
+    fmt: Template(_PRESET_EXPORT_SETUP + op + _PRESET_EXPORT_TEARDOWN) for fmt, op in _PRESET_EXPORT_OPS.items()
+}
 
-    Raises:
-        BlenderExportError: If validation fails critically
+_VALIDATE_PRESET_SCRIPT = Template(
     """
-    logger.info(f"Validating export preset for {platform}")
-
-    if platform not in PLATFORM_PRESETS:
-        supported = list(PLATFORM_PRESETS.keys())
-        raise BlenderExportError(f"Unsupported platform '{platform}'. Supported: {supported}")
-
-    preset = PLATFORM_PRESETS[platform]
-
-    try:
-        script = f"""
 import bpy
+import json
 
-platform = '{platform}'
-preset = {preset!r}
-target_objects = {target_objects!r}
-check_bones = {check_bones!r}
-check_materials = {check_materials!r}
-check_scale = {check_scale!r}
+P = json.loads($params)
+platform = P["platform"]
+preset = P["preset"]
 
-print(f"VALIDATING_PLATFORM: {{platform}}")
+print(f"VALIDATING_PLATFORM: {platform}")
 
-validation_results = {{
+validation_results = {
     'status': 'PASS',
     'issues': [],
     'warnings': [],
     'recommendations': []
-}}
+}
 
 # Check target objects exist
 valid_objects = []
 armatures = []
 
-for obj_name in target_objects:
-    obj = bpy.data.objects.get(obj_name)
+get_object = bpy.data.objects.get
+for obj_name in P["target_objects"]:
+    obj = get_object(obj_name)
     if obj:
         valid_objects.append(obj)
         if obj.type == 'ARMATURE':
             armatures.append(obj)
-        print(f"VALID_OBJECT: {{obj_name}}")
+        print(f"VALID_OBJECT: {obj_name}")
     else:
-        validation_results['issues'].append(f"Object not found: {{obj_name}}")
+        validation_results['issues'].append(f"Object not found: {obj_name}")
 
 if not valid_objects:
     validation_results['status'] = 'ERROR'
@@ -318,48 +265,45 @@ if not valid_objects:
     exit(1)
 
 # Check bone count and naming
-if check_bones and armatures:
+if P["check_bones"] and armatures:
+    max_bones = preset.get('max_bones')
     for armature in armatures:
         bone_count = len(armature.data.bones)
-        max_bones = preset.get('max_bones')
 
         if max_bones and bone_count > max_bones:
             validation_results['status'] = 'FAIL'
             validation_results['issues'].append(
-                f"Too many bones in {{armature.name}}: {{bone_count}} (max: {{max_bones}})"
+                f"Too many bones in {armature.name}: {bone_count} (max: {max_bones})"
             )
-        elif bone_count > max_bones * 0.8:  # Warning at 80%
+        elif max_bones and bone_count > max_bones * 0.8:  # Warning at 80%
             validation_results['warnings'].append(
-                f"High bone count in {{armature.name}}: {{bone_count}} (max: {{max_bones}})"
+                f"High bone count in {armature.name}: {bone_count} (max: {max_bones})"
             )
 
-        print(f"BONE_COUNT: {{armature.name}} = {{bone_count}}")
+        print(f"BONE_COUNT: {armature.name} = {bone_count}")
 
 # Check materials
-if check_materials:
-    total_materials = 0
-    for obj in valid_objects:
-        if obj.type == 'MESH':
-            total_materials += len(obj.data.materials)
+if P["check_materials"]:
+    total_materials = sum(len(obj.data.materials) for obj in valid_objects if obj.type == 'MESH')
 
     if total_materials > 8:  # Common mobile limit
         validation_results['warnings'].append(
-            f"High material count: {{total_materials}} (recommended max: 8 for mobile VR)"
+            f"High material count: {total_materials} (recommended max: 8 for mobile VR)"
         )
 
-    print(f"MATERIAL_COUNT: {{total_materials}}")
+    print(f"MATERIAL_COUNT: {total_materials}")
 
 # Check scale
-if check_scale:
+if P["check_scale"]:
     current_scale = bpy.context.scene.unit_settings.scale_length
     target_scale = preset['scale']
 
     if abs(current_scale - target_scale) > 0.01:
         validation_results['recommendations'].append(
-            f"Scene scale ({{current_scale}}) differs from {{platform}} standard ({{target_scale}})"
+            f"Scene scale ({current_scale}) differs from {platform} standard ({target_scale})"
         )
 
-    print(f"SCALE_CHECK: current={{current_scale}}, target={{target_scale}}")
+    print(f"SCALE_CHECK: current={current_scale}, target={target_scale}")
 
 # Overall status
 issues_count = len(validation_results['issues'])
@@ -370,30 +314,154 @@ if issues_count > 0:
 elif warnings_count > 0:
     validation_results['status'] = 'WARNING'
 
-print(f"VALIDATION_STATUS: {{validation_results['status']}}")
-print(f"ISSUES: {{issues_count}}")
-print(f"WARNINGS: {{warnings_count}}")
-
-# Output validation results
-import json
-print("VALIDATION_RESULTS:" + json.dumps(validation_results))
+# Output each finding on its own tagged line
+for issue in validation_results['issues']:
+    print("VALIDATION_ISSUE:" + json.dumps(issue))
+for warning in validation_results['warnings']:
+    print("VALIDATION_WARNING:" + json.dumps(warning))
+for recommendation in validation_results['recommendations']:
+    print("VALIDATION_RECOMMENDATION:" + json.dumps(recommendation))
+
+print(f"VALIDATION_STATUS: {validation_results['status']}")
+print(f"ISSUES: {issues_count}")
+print(f"WARNINGS: {warnings_count}")
 """
+)
 
-        output = await _executor.execute_script(script)
-        lines = output.strip().split("\n")
 
-        validation_results = {}
-        status = "UNKNOWN"
+async def _run_tagged_script(template: Template, params: dict[str, Any]) -> dict[str, list[str]]:
+    """Run a preset script through the batcher and group its tagged output values by tag, in order."""
+    output = await _batcher.submit(bind_script(template), params=params)
+    tags: dict[str, list[str]] = {}
+    for tag, value in _TAG_PATTERN.findall(output):
+        tags.setdefault(tag, []).append(value)
+    return tags
 
-        for line in lines:
-            if line.startswith("VALIDATION_FAILED:"):
-                raise BlenderExportError(line[20:])
-            elif line.startswith("VALIDATION_STATUS:"):
-                status = line.split(": ")[1]
-            elif line.startswith("VALIDATION_RESULTS:"):
-                import json
 
-                validation_results = json.loads(line[19:])
+@blender_operation("export_with_preset")
+async def export_with_preset(
+    target_objects: list[str],
+    platform: str = "VRCHAT",
+    output_path: str = "//export",
+    include_materials: bool = True,
+    include_textures: bool = True,
+    apply_modifiers: bool = True,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """
+    Export objects using platform-specific presets.
+
+    Applies the correct scale, format, and settings for the target VR platform,
+    ensuring compatibility and optimal performance.
+
+    Args:
+        target_objects: List of object names to export
+        platform: Target platform preset ("VRCHAT", "RESONITE", "UNITY", etc.)
+        output_path: Export output path (without extension)
+        include_materials: Whether to include materials in export
+        include_textures: Whether to include textures in export
+        apply_modifiers: Whether to apply modifiers before export
+
+    Returns:
+        Export operation result with file paths and validation info
+
+    Raises:
+        BlenderExportError: If export fails or platform is unsupported
+    """
+    logger.info(f"Exporting with {platform} preset to {output_path}")
+
+    if platform not in PLATFORM_PRESETS:
+        raise BlenderExportError(platform, output_path, _UNSUPPORTED_PLATFORM % (platform,))
+
+    preset = _PRESET_PARAMS[platform]
+
+    try:
+        params = {
+            "preset": preset,
+            "platform": platform,
+            "target_objects": target_objects,
+            "output_path": output_path,
+            "include_materials": include_materials,
+            "include_textures": include_textures,
+            "apply_modifiers": apply_modifiers,
+        }
+        tags = await _run_tagged_script(_PRESET_EXPORT_SCRIPTS[preset["format"]], params)
+        if "ERROR" in tags:
+            raise BlenderExportError(preset["format"], output_path, tags["ERROR"][0])
+
+        final_path = tags.get("EXPORT_SUCCESS", [""])[-1]
+        objects_exported = int(tags.get("OBJECTS_EXPORTED", ["0"])[-1])
+        warnings = tags.get("WARNING", [])
+
+        return {
+            "status": "success",
+            "platform": platform,
+            "format": preset["format"],
+            "scale": preset["scale"],
+            "output_path": final_path,
+            "objects_exported": objects_exported,
+            "warnings": warnings,
+            "message": f"Successfully exported {objects_exported} objects for {platform} platform",
+        }
+
+    except Exception as e:
+        logger.error(f"Platform export failed: {e}")
+        raise BlenderExportError(
+            preset["format"], output_path, f"Failed to export with {platform} preset: {e!s}"
+        ) from e
+
+
+@blender_operation("validate_export_preset")
+async def validate_export_preset(
+    target_objects: list[str],
+    platform: str = "VRCHAT",
+    check_bones: bool = True,
+    check_materials: bool = True,
+    check_scale: bool = True,
+) -> dict[str, Any]:
+    """
+    Validate objects against platform export requirements.
+
+    Checks bone count, material limits, scale compatibility, and other
+    platform-specific requirements before export.
+
+    Args:
+        target_objects: List of object names to validate
+        platform: Target platform to validate against
+        check_bones: Whether to validate bone count and naming
+        check_materials: Whether to validate material compatibility
+        check_scale: Whether to validate scale settings
+
+    Returns:
+        Validation report with issues and recommendations
+
+    Raises:
+        BlenderExportError: If validation fails critically
+    """
+    logger.info(f"Validating export preset for {platform}")
+
+    if platform not in PLATFORM_PRESETS:
+        raise BlenderExportError(platform, "", _UNSUPPORTED_PLATFORM % (platform,))
+
+    preset = _PRESET_PARAMS[platform]
+
+    try:
+        params = {
+            "platform": platform,
+            "preset": preset,
+            "target_objects": target_objects,
+            "check_bones": check_bones,
+            "check_materials": check_materials,
+            "check_scale": check_scale,
+        }
+        tags = await _run_tagged_script(_VALIDATE_PRESET_SCRIPT, params)
+        if "VALIDATION_FAILED" in tags:
+            raise BlenderExportError(preset["format"], "", tags["VALIDATION_FAILED"][0])
+
+        status = tags.get("VALIDATION_STATUS", ["UNKNOWN"])[-1]
+        validation_results: dict[str, Any] = {"status": status}
+        for key, tag in _VALIDATION_ITEM_TAGS.items():
+            validation_results[key] = [_loads(value) for value in tags.get(tag, ())]
 
         return {
             "status": status,
@@ -404,11 +472,11 @@ print("VALIDATION_RESULTS:" + json.dumps(validation_results))
 
     except Exception as e:
         logger.error(f"Export validation failed: {e}")
-        raise BlenderExportError(f"Failed to validate export preset: {e!s}") from e
+        raise BlenderExportError(preset["format"], "", f"Failed to validate export preset: {e!s}") from e
 
 
 @blender_operation("get_platform_presets")
-async def get_platform_presets() -> dict[str, Any]:
+async def get_platform_presets() -> Mapping[str, Any]:
     """
     Get information about available platform export presets.
 
@@ -416,24 +484,10 @@ async def get_platform_presets() -> dict[str, Any]:
     and recommended use cases.
 
     Returns:
-        Platform presets information
-
-    Raises:
-        BlenderExportError: If preset retrieval fails
+        Platform presets information (a shared read-only mapping)
     """
     logger.info("Retrieving platform export presets")
-
-    try:
-        return {
-            "status": "success",
-            "presets": PLATFORM_PRESETS,
-            "platforms": list(PLATFORM_PRESETS.keys()),
-            "message": f"Retrieved {len(PLATFORM_PRESETS)} platform presets",
-        }
-
-    except Exception as e:
-        logger.error(f"Platform presets retrieval failed: {e}")
-        raise BlenderExportError(f"Failed to get platform presets: {e!s}") from e
+    return _PRESETS_RESPONSE
 
 
 @blender_operation("create_custom_preset")
@@ -462,11 +516,10 @@ async def create_custom_preset(
     logger.info(f"Creating custom preset '{preset_name}' based on {base_platform}")
 
     if base_platform not in PLATFORM_PRESETS:
-        supported = list(PLATFORM_PRESETS.keys())
-        raise BlenderExportError(f"Unsupported base platform '{base_platform}'. Supported: {supported}")
+        raise BlenderExportError(base_platform, "", _UNSUPPORTED_BASE_PLATFORM % (base_platform,))
 
     # Start with base preset
-    custom_preset = PLATFORM_PRESETS[base_platform].copy()
+    custom_preset = dict(PLATFORM_PRESETS[base_platform])
     custom_preset["description"] = f"Custom preset based on {base_platform}"
 
     # Apply custom settings
@@ -486,4 +539,4 @@ async def create_custom_preset(
 
     except Exception as e:
         logger.error(f"Custom preset creation failed: {e}")
-        raise BlenderExportError(f"Failed to create custom preset: {e!s}") from e
+        raise BlenderExportError(base_platform, "", f"Failed to create custom preset: {e!s}") from e
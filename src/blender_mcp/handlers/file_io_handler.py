@@ -1,19 +1,31 @@
 """File I/O operations handler for Blender MCP."""
 
+import base64
+import contextlib
 import logging
 import os
+import secrets
+import shutil
+import stat
 from enum import StrEnum
-from pathlib import Path
 from typing import Any
 
-from ..compat import *
-
 logger = logging.getLogger(__name__)
 from ..decorators import blender_operation
 from ..utils.blender_executor import get_blender_executor
 
 _executor = get_blender_executor()
 
+# Flags for the temporary file write_file renames into place. Unlike mkstemp's private
+# 0600 files it is created with mode 0666, so the umask applies as for a plain open().
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOFOLLOW", 0)
+
+
+def _create_temp_file(directory: str, name: str) -> tuple[int, str]:
+    """Create a new temporary file for ``name`` in ``directory`` and return its fd and path."""
+    tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(8)}.tmp")
+    return os.open(tmp_path, _TEMP_FLAGS, 0o666), tmp_path
+
 
 class FileType(StrEnum):
     TEXT = "TEXT"
@@ -24,91 +36,154 @@ class FileType(StrEnum):
 
 @blender_operation("read_file", log_args=True)
 async def read_file(filepath: str, file_type: FileType | str = FileType.TEXT, **kwargs: Any) -> dict[str, Any]:
-    """Read a file's contents."""
+    """Read a file's contents.
+
+    TEXT files are returned as ``content``; BINARY files as base64 ``content_b64``,
+    which write_file accepts back unchanged.
+    """
 
-    filepath = str(Path(filepath).absolute())
+    filepath = os.path.abspath(filepath)
 
     try:
         if file_type == FileType.TEXT:
             with open(filepath, encoding="utf-8") as f:
-                content = f.read()
+                size = os.fstat(f.fileno()).st_size
+                result = {"content": f.read()}
         elif file_type == FileType.BINARY:
             with open(filepath, "rb") as f:
-                content = f.read().decode("latin1")
+                size = os.fstat(f.fileno()).st_size
+                result = {"content_b64": base64.b64encode(f.read()).decode("ascii")}
         else:
             return {"status": "ERROR", "error": f"Unsupported file type: {file_type}"}
 
         return {
             "status": "SUCCESS",
             "filepath": filepath,
-            "content": content,
-            "size": os.path.getsize(filepath),
+            **result,
+            "size": size,
         }
     except Exception as e:
         logger.error(f"Failed to read file: {e!s}")
         return {"status": "ERROR", "error": str(e)}
 
 
+@blender_operation("copy_file", log_args=True)
+async def copy_file(filepath: str, dest_filepath: str, **kwargs: Any) -> dict[str, Any]:
+    """Copy a file without reading it into Python.
+
+    shutil.copyfile hands the copy to the kernel (sendfile on Linux, fcopyfile on macOS)
+    where available.
+    """
+    filepath = os.path.abspath(filepath)
+    dest_filepath = os.path.abspath(dest_filepath)
+
+    try:
+        os.makedirs(os.path.dirname(dest_filepath), exist_ok=True)
+        shutil.copyfile(filepath, dest_filepath)
+        return {"status": "SUCCESS", "filepath": filepath, "dest_filepath": dest_filepath}
+    except Exception as e:
+        logger.error(f"Failed to copy file: {e!s}")
+        return {"status": "ERROR", "error": str(e)}
+
+
 @blender_operation("write_file", log_args=True)
 async def write_file(
-    filepath: str, content: str, file_type: FileType | str = FileType.TEXT, **kwargs: Any
+    filepath: str,
+    content: str | bytes = "",
+    file_type: FileType | str = FileType.TEXT,
+    content_b64: str | None = None,
+    **kwargs: Any,
 ) -> dict[str, Any]:
-    """Write content to a file."""
-    filepath = str(Path(filepath).absolute())
-
+    """Write content to a file.
+
+    BINARY content may be given as bytes (str is encoded as latin-1), or as base64
+    ``content_b64`` - the form read_file returns - which is decoded and written as
+    BINARY in place of ``content``. The file is written next to its destination and
+    renamed into place, so readers never see a partial file.
+    """
+    filepath = os.path.abspath(filepath)
+
+    if content_b64 is not None:
+        try:
+            content = base64.b64decode(content_b64, validate=True)
+        except ValueError as e:
+            return {"status": "ERROR", "error": f"Invalid content_b64: {e!s}"}
+        file_type = FileType.BINARY
+
+    if file_type == FileType.TEXT:
+        mode, encoding = "w", "utf-8"
+    elif file_type == FileType.BINARY:
+        mode, encoding = "wb", None
+        if isinstance(content, str):
+            content = content.encode("latin1")
+    else:
+        return {"status": "ERROR", "error": f"Unsupported file type: {file_type}"}
+
+    tmp_path = None
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        if file_type == FileType.TEXT:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
-        elif file_type == FileType.BINARY:
-            with open(filepath, "wb") as f:
-                f.write(content.encode("latin1"))
-        else:
-            return {"status": "ERROR", "error": f"Unsupported file type: {file_type}"}
+        directory, name = os.path.split(filepath)
+        try:
+            fd, tmp_path = _create_temp_file(directory, name)
+        except FileNotFoundError:
+            # The parent usually exists already, so it is only created when the open says otherwise
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = _create_temp_file(directory, name)
+        # A replaced file keeps its mode; a new one keeps the umask-derived creation mode
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(filepath).st_mode))
+        with open(fd, mode, encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        tmp_path = None
 
         return {"status": "SUCCESS", "filepath": filepath}
     except Exception as e:
         logger.error(f"Failed to write file: {e!s}")
         return {"status": "ERROR", "error": str(e)}
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
 
 
 @blender_operation("list_directory", log_args=True)
 async def list_directory(directory: str, recursive: bool = False, **kwargs: Any) -> dict[str, Any]:
     """List contents of a directory."""
-    from pathlib import Path
-
     try:
-        path = Path(directory).absolute()
-        if not path.exists() or not path.is_dir():
+        path = os.path.abspath(directory)
+        if not os.path.isdir(path):
             return {"status": "ERROR", "error": "Not a directory"}
 
+        # Depth-first over os.scandir: the type checks reuse what the directory read returned
         results = []
-        if recursive:
-            for p in path.rglob("*"):
-                if p.is_file() or p.is_dir():
-                    results.append(
-                        {
-                            "path": str(p.relative_to(path)),
-                            "name": p.name,
-                            "is_dir": p.is_dir(),
-                            "size": p.stat().st_size if p.is_file() else 0,
-                        }
-                    )
-        else:
-            for p in path.iterdir():
-                if p.is_file() or p.is_dir():
-                    results.append(
-                        {
-                            "path": p.name,
-                            "name": p.name,
-                            "is_dir": p.is_dir(),
-                            "size": p.stat().st_size if p.is_file() else 0,
-                        }
-                    )
-
-        return {"status": "SUCCESS", "directory": str(path), "files": results}
+        stack = [(path, "")]
+        while stack:
+            current, prefix = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                # Unreadable subdirectories are skipped, as Path.walk does; the root still fails
+                if not prefix:
+                    raise
+                continue
+            with entries:
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    if is_dir:
+                        size = 0
+                    elif entry.is_file():
+                        size = entry.stat().st_size
+                    else:
+                        continue
+                    relative = prefix + entry.name
+                    results.append({"path": relative, "name": entry.name, "is_dir": is_dir, "size": size})
+                    # Symlinked directories are listed but not descended into
+                    if recursive and is_dir and not entry.is_symlink():
+                        stack.append((entry.path, relative + os.sep))
+
+        return {"status": "SUCCESS", "directory": path, "files": results}
     except Exception as e:
         logger.error(f"Failed to list directory: {e!s}")
         return {"status": "ERROR", "error": str(e)}
@@ -6,8 +6,10 @@ All implementations are marked as MOCK for now.
 """
 
 import logging
+import time
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from math import radians
 from typing import Any
 
@@ -301,9 +303,144 @@ class Style(Enum):
     MATERIAL_JETTING = "material_jetting"
 
 
+def _enum_values(enum_cls: type[Enum]) -> dict[Any, str]:
+    """Map each member of an enum to its value, so arguments given as members or strings coerce with one lookup."""
+    return {member: member.value for member in enum_cls}
+
+
+def _enum_value(values: dict[Any, str], arg: Enum | str) -> str:
+    """Return the value of an enum member argument; plain strings pass through unchanged."""
+    return values.get(arg) or str(arg)
+
+
+_BED_TYPE_VALUES = _enum_values(BedType)
+_BUILDING_TYPE_VALUES = _enum_values(BuildingType)
+_WEAPON_TYPE_VALUES = _enum_values(WeaponType)
+_ORNAMENT_TYPE_VALUES = _enum_values(OrnamentType)
+_ROOM_TYPE_VALUES = _enum_values(RoomType)
+_MATERIAL_VALUES = _enum_values(Material)
+_STYLE_VALUES = _enum_values(Style)
+
+# Bed (length, width) by bed type value; other types use _DEFAULT_BED_DIMENSIONS.
+# "california_king" has no BedType member but is accepted as a string.
+_DEFAULT_BED_DIMENSIONS = (2.0, 1.5)
+_BED_DIMENSIONS = {
+    "single": (1.9, 1.0),
+    "double": (1.9, 1.4),
+    "queen": (2.0, 1.5),
+    "king": (2.0, 1.9),
+    "california_king": (2.1, 1.8),
+}
+
+
+@cache
+def _warn_mock(handler: str) -> None:
+    """Log the mock-implementation warning the first time a handler runs, not on every call."""
+    logger.warning(f"MOCK IMPLEMENTATION: {handler} is not actually creating geometry in Blender")
+
+
+# (millisecond, ISO string) of the last timestamp; calls within the same millisecond reuse it
+_last_timestamp: tuple[int, str] = (-1, "")
+
+
 def get_timestamp() -> str:
-    """Get current timestamp in ISO format."""
-    return datetime.now().isoformat()
+    """Get current timestamp in ISO format, at millisecond resolution."""
+    global _last_timestamp
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _last_timestamp[0]:
+        _last_timestamp = (now_ms, datetime.fromtimestamp(now_ms / 1000).isoformat(timespec="milliseconds"))
+    return _last_timestamp[1]
+
+
+# Unit cube (size 1, centred on the origin) as flat buffers for foreach_set: vertex
+# coordinates, then the vertex indices of its six outward-facing quads
+_BOX_COORDS = (
+    -0.5, -0.5, -0.5,  -0.5, -0.5, 0.5,  -0.5, 0.5, -0.5,  -0.5, 0.5, 0.5,
+    0.5, -0.5, -0.5,  0.5, -0.5, 0.5,  0.5, 0.5, -0.5,  0.5, 0.5, 0.5,
+)  # fmt: skip
+_BOX_QUADS = (0, 1, 3, 2, 2, 3, 7, 6, 6, 7, 5, 4, 4, 5, 1, 0, 2, 6, 4, 0, 7, 3, 1, 5)
+
+
+# Principled BSDF input sockets by index, which skips the search by name. Blender 4.0
+# reordered the sockets and renamed Specular; later 4.x releases insert sockets ahead of
+# it, so there it stays keyed by name.
+_BSDF_BASE_COLOR = 0
+_BSDF_SPECULAR: int | str
+if HAS_BPY and bpy.app.version < (4, 0, 0):
+    _BSDF_METALLIC, _BSDF_SPECULAR, _BSDF_ROUGHNESS = 6, 7, 9
+else:
+    _BSDF_METALLIC, _BSDF_SPECULAR, _BSDF_ROUGHNESS = 1, "Specular IOR Level", 2
+
+# Principled BSDF inputs per material type, set once on each cached template material
+_BED_MATERIAL_INPUTS: dict[str, dict[int | str, float]] = {
+    "wood": {_BSDF_ROUGHNESS: 0.7, _BSDF_SPECULAR: 0.3},
+    "metal": {_BSDF_METALLIC: 1.0, _BSDF_ROUGHNESS: 0.2},
+    "fabric": {_BSDF_ROUGHNESS: 0.9, _BSDF_SPECULAR: 0.2},
+}
+_BUILDING_MATERIAL_INPUTS: dict[str, dict[int | str, float]] = {
+    "concrete": {_BSDF_ROUGHNESS: 0.8, _BSDF_SPECULAR: 0.1},
+    "brick": {_BSDF_ROUGHNESS: 0.7, _BSDF_SPECULAR: 0.2},
+    "wood": {_BSDF_ROUGHNESS: 0.6, _BSDF_SPECULAR: 0.3},
+}
+_MATTRESS_COLOR = (0.95, 0.95, 0.95, 1.0)
+
+
+def _material_from_template(
+    name: str, template_name: str, inputs: dict[int | str, float], color: tuple[float, float, float, float]
+) -> Any:
+    """Copy a node material from a cached template and set its base color.
+
+    The template is built once per template_name and kept in bpy.data.materials, so
+    later calls skip the node setup and the input lookups by name. It is looked up by
+    name rather than held here, so it is rebuilt if a file load or purge drops it.
+    """
+    template = bpy.data.materials.get(template_name)
+    if template is None:
+        template = bpy.data.materials.new(name=template_name)
+        template.use_nodes = True
+        bsdf_inputs = template.node_tree.nodes["Principled BSDF"].inputs
+        for socket, value in inputs.items():
+            bsdf_inputs[socket].default_value = value
+    material = template.copy()
+    material.name = name
+    material.node_tree.nodes["Principled BSDF"].inputs[_BSDF_BASE_COLOR].default_value = color
+    return material
+
+
+def _new_box_mesh(name: str, size: tuple[float, float, float], centres: list[tuple[float, float, float]]) -> Any:
+    """Create one mesh holding a box of the given size at each centre.
+
+    The mesh is filled straight from the box buffers, so no bpy.ops operator runs and
+    no context or undo step is involved.
+    """
+    count = len(centres)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(8 * count)
+    mesh.loops.add(24 * count)
+    mesh.polygons.add(6 * count)
+    coords = [_BOX_COORDS[i] * size[i % 3] + centre[i % 3] for centre in centres for i in range(24)]
+    mesh.vertices.foreach_set("co", coords)
+    mesh.loops.foreach_set("vertex_index", [8 * box + v for box in range(count) for v in _BOX_QUADS])
+    mesh.polygons.foreach_set("loop_start", range(0, 24 * count, 4))
+    if bpy.app.version < (4, 0, 0):
+        # loop_total is derived from loop_start from Blender 4.0 on
+        mesh.polygons.foreach_set("loop_total", (4,) * (6 * count))
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _link_object(name: str, mesh: Any) -> Any:
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def _make_box(name: str, scale: tuple[float, float, float], location: tuple[float, float, float]) -> Any:
+    """Add a unit cube object with the given scale and location to the active collection."""
+    box = _link_object(name, _new_box_mesh(name, (1.0, 1.0, 1.0), [(0.0, 0.0, 0.0)]))
+    box.scale = scale
+    box.location = location
+    return box
 
 
 # Bed Creation
@@ -372,8 +509,6 @@ async def create_bed(
     bmesh.new()
 
     # Define bed dimensions based on type
-    bed_length = 2.0  # Default length
-    bed_width = 1.5  # Default width
     bed_height = 0.3  # Default height
     leg_height = 0.1  # Default leg height
     mattress_thickness = 0.2  # Default mattress thickness
@@ -382,78 +517,50 @@ async def create_bed(
     storage_height = 0.2 if has_storage else 0
 
     # Adjust dimensions based on bed type
-    bed_type_str = bed_type.value if isinstance(bed_type, BedType) else bed_type
-    if bed_type_str == "single":
-        bed_length, bed_width = 1.9, 1.0
-    elif bed_type_str == "double":
-        bed_length, bed_width = 1.9, 1.4
-    elif bed_type_str == "queen":
-        bed_length, bed_width = 2.0, 1.5
-    elif bed_type_str == "king":
-        bed_length, bed_width = 2.0, 1.9
-    elif bed_type_str == "california_king":
-        bed_length, bed_width = 2.1, 1.8
+    bed_type_str = _enum_value(_BED_TYPE_VALUES, bed_type)
+    bed_length, bed_width = _BED_DIMENSIONS.get(bed_type_str, _DEFAULT_BED_DIMENSIONS)
 
     # Create the bed frame
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    frame_obj = bpy.context.active_object
-    frame_obj.name = f"{name}_Frame"
-    frame_obj.scale = (bed_length, bed_width, bed_height)
-    frame_obj.location = (0, 0, leg_height + bed_height / 2)
+    frame_obj = _make_box(f"{name}_Frame", (bed_length, bed_width, bed_height), (0, 0, leg_height + bed_height / 2))
 
     # Create the mattress
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    mattress_obj = bpy.context.active_object
-    mattress_obj.name = f"{name}_Mattress"
-    mattress_obj.scale = (bed_length * 0.9, bed_width * 0.9, mattress_thickness)
-    mattress_obj.location = (0, 0, leg_height + bed_height + mattress_thickness / 2)
-
-    # Create legs
-    for i, (x, y) in enumerate(
-        [
-            (-bed_length / 2, -bed_width / 2),
-            (bed_length / 2, -bed_width / 2),
-            (-bed_length / 2, bed_width / 2),
-            (bed_length / 2, bed_width / 2),
-        ]
-    ):
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        leg_obj = bpy.context.active_object
-        leg_obj.name = f"{name}_Leg_{i + 1}"
-        leg_obj.scale = (0.05, 0.05, leg_height)
-        leg_obj.location = (x, y, leg_height / 2)
+    mattress_obj = _make_box(
+        f"{name}_Mattress",
+        (bed_length * 0.9, bed_width * 0.9, mattress_thickness),
+        (0, 0, leg_height + bed_height + mattress_thickness / 2),
+    )
+
+    # Create the legs as one mesh, one box per corner
+    legs_mesh = _new_box_mesh(
+        f"{name}_Legs",
+        (0.05, 0.05, leg_height),
+        [(x, y, leg_height / 2) for y in (-bed_width / 2, bed_width / 2) for x in (-bed_length / 2, bed_length / 2)],
+    )
+    _link_object(f"{name}_Legs", legs_mesh)
 
     # Create headboard if requested
     if has_headboard:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        headboard_obj = bpy.context.active_object
-        headboard_obj.name = f"{name}_Headboard"
-        headboard_obj.scale = (bed_length, 0.1, headboard_height)
-        headboard_obj.location = (
-            0,
-            bed_width / 2 + 0.05,
-            leg_height + bed_height + headboard_height / 2,
+        _make_box(
+            f"{name}_Headboard",
+            (bed_length, 0.1, headboard_height),
+            (0, bed_width / 2 + 0.05, leg_height + bed_height + headboard_height / 2),
         )
 
     # Create footboard if requested
     if has_footboard:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        footboard_obj = bpy.context.active_object
-        footboard_obj.name = f"{name}_Footboard"
-        footboard_obj.scale = (bed_length, 0.1, footboard_height)
-        footboard_obj.location = (
-            0,
-            -bed_width / 2 - 0.05,
-            leg_height + bed_height + footboard_height / 2,
+        _make_box(
+            f"{name}_Footboard",
+            (bed_length, 0.1, footboard_height),
+            (0, -bed_width / 2 - 0.05, leg_height + bed_height + footboard_height / 2),
         )
 
     # Create storage if requested
     if has_storage:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        storage_obj = bpy.context.active_object
-        storage_obj.name = f"{name}_Storage"
-        storage_obj.scale = (bed_length * 0.8, bed_width * 0.8, storage_height)
-        storage_obj.location = (0, 0, leg_height + storage_height / 2)
+        _make_box(
+            f"{name}_Storage",
+            (bed_length * 0.8, bed_width * 0.8, storage_height),
+            (0, 0, leg_height + storage_height / 2),
+        )
 
     # Set object location, rotation, and scale
     obj.location = location
@@ -461,31 +568,14 @@ async def create_bed(
     obj.scale = scale
 
     # Create materials
-    material_str = material.value if isinstance(material, Material) else material
-    frame_material = bpy.data.materials.new(name=f"{name}_Frame_Material")
-    frame_material.use_nodes = True
-    bsdf = frame_material.node_tree.nodes["Principled BSDF"]
-    bsdf.inputs[0].default_value = color
-
-    # Set material properties based on type
-    if material_str == "wood":
-        bsdf.inputs["Roughness"].default_value = 0.7
-        bsdf.inputs["Specular"].default_value = 0.3
-    elif material_str == "metal":
-        bsdf.inputs["Metallic"].default_value = 1.0
-        bsdf.inputs["Roughness"].default_value = 0.2
-    elif material_str == "fabric":
-        bsdf.inputs["Roughness"].default_value = 0.9
-        bsdf.inputs["Specular"].default_value = 0.2
-
-    mattress_material = bpy.data.materials.new(name=f"{name}_Mattress_Material")
-    mattress_material.use_nodes = True
-    mattress_material.node_tree.nodes["Principled BSDF"].inputs[0].default_value = (
-        0.95,
-        0.95,
-        0.95,
-        1.0,
+    material_str = _enum_value(_MATERIAL_VALUES, material)
+    frame_material = _material_from_template(
+        f"{name}_Frame_Material",
+        f".Bed_{material_str}_Template",
+        _BED_MATERIAL_INPUTS.get(material_str, {}),
+        color,
     )
+    mattress_material = _material_from_template(f"{name}_Mattress_Material", ".Mattress_Template", {}, _MATTRESS_COLOR)
 
     # Assign materials
     frame_obj.data.materials.append(frame_material)
@@ -498,7 +588,7 @@ async def create_bed(
         "location": location,
         "rotation": rotation,
         "scale": scale,
-        "style": style.value if isinstance(style, Style) else style,
+        "style": _enum_value(_STYLE_VALUES, style),
         "material": material_str,
         "color": color,
         "has_headboard": has_headboard,
@@ -603,44 +693,24 @@ async def create_building(
     floor_height = height / floors if floors > 0 else height
 
     # Create main building structure
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    building_obj = bpy.context.active_object
-    building_obj.name = f"{name}_Main"
-    building_obj.scale = (width, depth, height)
-    building_obj.location = (0, 0, height / 2)
+    building_obj = _make_box(f"{name}_Main", (width, depth, height), (0, 0, height / 2))
 
     # Create floors
     for floor in range(floors):
         floor_y = floor * floor_height
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        floor_obj = bpy.context.active_object
-        floor_obj.name = f"{name}_Floor_{floor + 1}"
-        floor_obj.scale = (width * 0.9, depth * 0.9, 0.1)
-        floor_obj.location = (0, 0, floor_y + 0.05)
+        _make_box(f"{name}_Floor_{floor + 1}", (width * 0.9, depth * 0.9, 0.1), (0, 0, floor_y + 0.05))
 
     # Create roof if requested
     if has_roof:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        roof_obj = bpy.context.active_object
-        roof_obj.name = f"{name}_Roof"
-        roof_obj.scale = (width * 1.1, depth * 1.1, 0.2)
-        roof_obj.location = (0, 0, height + 0.1)
+        _make_box(f"{name}_Roof", (width * 1.1, depth * 1.1, 0.2), (0, 0, height + 0.1))
 
     # Create garage if requested
     if has_garage:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        garage_obj = bpy.context.active_object
-        garage_obj.name = f"{name}_Garage"
-        garage_obj.scale = (width * 0.3, depth * 0.4, height * 0.6)
-        garage_obj.location = (width * 0.6, depth * 0.6, height * 0.3)
+        _make_box(f"{name}_Garage", (width * 0.3, depth * 0.4, height * 0.6), (width * 0.6, depth * 0.6, height * 0.3))
 
     # Create chimney if requested
     if has_chimney:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        chimney_obj = bpy.context.active_object
-        chimney_obj.name = f"{name}_Chimney"
-        chimney_obj.scale = (0.3, 0.3, height * 0.3)
-        chimney_obj.location = (width * 0.3, depth * 0.3, height + height * 0.15)
+        _make_box(f"{name}_Chimney", (0.3, 0.3, height * 0.3), (width * 0.3, depth * 0.3, height + height * 0.15))
 
     # Set object location, rotation, and scale
     obj.location = location
@@ -648,22 +718,13 @@ async def create_building(
     obj.scale = scale
 
     # Create materials
-    material_str = material.value if isinstance(material, Material) else material
-    building_material = bpy.data.materials.new(name=f"{name}_Material")
-    building_material.use_nodes = True
-    bsdf = building_material.node_tree.nodes["Principled BSDF"]
-    bsdf.inputs[0].default_value = color
-
-    # Set material properties based on type
-    if material_str == "concrete":
-        bsdf.inputs["Roughness"].default_value = 0.8
-        bsdf.inputs["Specular"].default_value = 0.1
-    elif material_str == "brick":
-        bsdf.inputs["Roughness"].default_value = 0.7
-        bsdf.inputs["Specular"].default_value = 0.2
-    elif material_str == "wood":
-        bsdf.inputs["Roughness"].default_value = 0.6
-        bsdf.inputs["Specular"].default_value = 0.3
+    material_str = _enum_value(_MATERIAL_VALUES, material)
+    building_material = _material_from_template(
+        f"{name}_Material",
+        f".Building_{material_str}_Template",
+        _BUILDING_MATERIAL_INPUTS.get(material_str, {}),
+        color,
+    )
 
     # Assign materials
     building_obj.data.materials.append(building_material)
@@ -671,11 +732,11 @@ async def create_building(
     # Prepare return data
     building_data = {
         "name": name,
-        "type": f"building_{building_type.value if isinstance(building_type, BuildingType) else building_type}",
+        "type": f"building_{_enum_value(_BUILDING_TYPE_VALUES, building_type)}",
         "location": location,
         "rotation": rotation,
         "scale": scale,
-        "style": style.value if isinstance(style, Style) else style,
+        "style": _enum_value(_STYLE_VALUES, style),
         "material": material_str,
         "color": color,
         "floors": floors,
@@ -751,16 +812,16 @@ async def create_weapon(
     Returns:
         Dictionary with information about the created weapon
     """
-    logger.warning("MOCK IMPLEMENTATION: create_weapon is not actually creating geometry in Blender")
+    _warn_mock("create_weapon")
 
     weapon_data = {
         "name": name,
-        "type": f"weapon_{weapon_type.value if isinstance(weapon_type, WeaponType) else weapon_type}",
+        "type": f"weapon_{_enum_value(_WEAPON_TYPE_VALUES, weapon_type)}",
         "location": location,
         "rotation": rotation,
         "scale": scale,
-        "style": style.value if isinstance(style, Style) else style,
-        "material": material.value if isinstance(material, Material) else material,
+        "style": _enum_value(_STYLE_VALUES, style),
+        "material": _enum_value(_MATERIAL_VALUES, material),
         "color": color,
         "dimensions": {"length": length, "width": width, "height": height},
         "stats": {
@@ -827,16 +888,16 @@ async def create_ornament(
     Returns:
         Dictionary with information about the created ornament
     """
-    logger.warning("MOCK IMPLEMENTATION: create_ornament is not actually creating geometry in Blender")
+    _warn_mock("create_ornament")
 
     ornament_data = {
         "name": name,
-        "type": f"ornament_{ornament_type.value if isinstance(ornament_type, OrnamentType) else ornament_type}",
+        "type": f"ornament_{_enum_value(_ORNAMENT_TYPE_VALUES, ornament_type)}",
         "location": location,
         "rotation": rotation,
         "scale": scale,
-        "style": style.value if isinstance(style, Style) else style,
-        "material": material.value if isinstance(material, Material) else material,
+        "style": _enum_value(_STYLE_VALUES, style),
+        "material": _enum_value(_MATERIAL_VALUES, material),
         "color": color,
         "dimensions": {"height": height, "width": width, "depth": depth},
         "properties": {
@@ -982,9 +1043,9 @@ async def create_room(
     obj.scale = scale
 
     # Create materials
-    wall_material_str = wall_material.value if isinstance(wall_material, Material) else wall_material
-    floor_material_str = floor_material.value if isinstance(floor_material, Material) else floor_material
-    ceiling_material_str = ceiling_material.value if isinstance(ceiling_material, Material) else ceiling_material
+    wall_material_str = _enum_value(_MATERIAL_VALUES, wall_material)
+    floor_material_str = _enum_value(_MATERIAL_VALUES, floor_material)
+    ceiling_material_str = _enum_value(_MATERIAL_VALUES, ceiling_material)
 
     # Create wall material
     wall_mat = bpy.data.materials.new(name=f"{name}_Wall_Material")
@@ -1008,11 +1069,11 @@ async def create_room(
     # Prepare return data
     room_data = {
         "name": name,
-        "type": f"room_{room_type.value if isinstance(room_type, RoomType) else room_type}",
+        "type": f"room_{_enum_value(_ROOM_TYPE_VALUES, room_type)}",
         "location": location,
         "rotation": rotation,
         "scale": scale,
-        "style": style.value if isinstance(style, Style) else style,
+        "style": _enum_value(_STYLE_VALUES, style),
         "materials": {
             "wall": wall_material_str,
             "floor": floor_material_str,
@@ -12,6 +12,7 @@ def _register_compositor_tools() -> None:
     from blender_mcp.app import get_app
     from blender_mcp.handlers.compositor_handler import (
         add_compositor_node,
+        build_compositor_graph,
         connect_compositor_nodes,
         create_glow_effect,
         enable_compositor,
@@ -34,6 +35,8 @@ def _register_compositor_tools() -> None:
         glow_threshold: float = 0.8,
         glow_size: int = 10,
         glow_quality: int = 2,
+        nodes: list[dict[str, Any]] | None = None,
+        links: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """
         Compositor graph operations for post-processing.
@@ -43,6 +46,9 @@ def _register_compositor_tools() -> None:
         - add_node: add a compositor node
         - connect_nodes: connect two compositor nodes
         - glow: add a glow/glare effect chain
+        - build_graph: add many nodes and links in one Blender run. nodes is a list of
+          {"type", "name", "location", "properties"}; links is a list of
+          {"from_node", "from_socket", "to_node", "to_socket"} (sockets by name or index)
         """
         try:
             if operation == "enable":
@@ -79,10 +85,16 @@ def _register_compositor_tools() -> None:
                 )
                 return {"success": result.get("status") == "SUCCESS", **result}
 
+            if operation == "build_graph":
+                if not nodes and not links:
+                    return {"success": False, "error": "nodes or links are required"}
+                result = await build_compositor_graph(nodes=nodes or [], links=links)
+                return {"success": result.get("status") == "SUCCESS", **result}
+
             return {
                 "success": False,
                 "error": f"Unknown operation '{operation}'",
-                "available_operations": ["enable", "add_node", "connect_nodes", "glow"],
+                "available_operations": ["enable", "add_node", "connect_nodes", "glow", "build_graph"],
             }
         except Exception as exc:
             logger.exception("blender_compositor failed: %s", exc)
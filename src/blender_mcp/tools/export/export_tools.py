@@ -19,6 +19,7 @@ def _register_export_tools():
         operation: str = "export_glb",
         output_path: str = "",
         object_names: list[str] | None = None,
+        blend_files: list[str] | None = None,
         file_format: str = "GLB",
         include_materials: bool = True,
         include_animations: bool = True,
@@ -32,8 +33,11 @@ def _register_export_tools():
         Operations:
         - export_gltf / export_glb / export_fbx / export_obj / export_stl / export_usd / export_vrm
         - export_unity / export_vrchat / export_unreal (platform presets)
+        - export_blend_files: export each of blend_files to file_format, concurrently,
+          into the directory given as output_path
         """
         from blender_mcp.handlers.export_handler import (
+            export_blend_files,
             export_for_unity,
             export_for_unreal,
             export_for_vrchat,
@@ -87,6 +91,18 @@ def _register_export_tools():
                 )
                 return json.dumps(result, indent=2)
 
+            if operation == "export_blend_files":
+                if not output_path or not blend_files:
+                    return json.dumps({"success": False, "error": "output_path and blend_files are required"})
+                result = await export_blend_files(
+                    blend_files=blend_files,
+                    output_dir=output_path,
+                    file_format=file_format,
+                    apply_modifiers=use_mesh_modifiers,
+                    global_scale=global_scale,
+                )
+                return json.dumps(result, indent=2)
+
             return json.dumps(
                 {
                     "success": False,
@@ -96,6 +112,7 @@ def _register_export_tools():
                         "export_unity",
                         "export_vrchat",
                         "export_unreal",
+                        "export_blend_files",
                     ],
                 },
                 indent=2,
@@ -1,16 +1,23 @@
 """Comprehensive Blender script executor with extensive error handling and logging."""
 
 import asyncio
+import contextlib
+import json
 
 # Third-party imports
 import logging
 import os
+import re
 import shutil
 import subprocess
 import tempfile
 import time
+from collections.abc import AsyncGenerator, Sequence
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
-from typing import TypeVar
+from string import Template
+from typing import Any, TypeVar
 
 import psutil
 
@@ -23,33 +30,162 @@ from ..exceptions import BlenderNotFoundError, BlenderScriptError
 # Type variable for the BlenderExecutor class
 T = TypeVar("T", bound="BlenderExecutor")
 
-# Global instance of BlenderExecutor
-_blender_executor_instance = None
+# Shared BlenderExecutor instances, one per headless mode
+_blender_executors: dict[bool, "BlenderExecutor"] = {}
+
+# Scripts the worker keeps compiled; the host mirrors this bound to know which ones it holds
+_WORKER_SCRIPT_CACHE_SIZE = 256
+
+# Longest worker output line the host reads; a whole batch fragment's output or a
+# RESULT_JSON payload travels as one line, far past asyncio's 64 KiB default
+_WORKER_LINE_LIMIT = 256 * 1024 * 1024
+
+# Source of the resident Blender process used by execute_script_persistent. Each job
+# arrives on stdin as "<job_id> <script_key> <script_size> <params_size>\n<script><params>",
+# with an empty script when the worker already holds that key. Output is framed between
+# BEGIN/END markers on stdout; the END marker carries the exit code.
+_WORKER_LOOP_SCRIPT = Template("""
+import sys
+import traceback
+
+import bpy
+
+
+def _read_job():
+    header = sys.stdin.buffer.readline()
+    if not header:
+        return None
+    job_id, script_key, script_size, params_size = header.decode("utf-8").split()
+    source = sys.stdin.buffer.read(int(script_size)).decode("utf-8")
+    return job_id, script_key, source, sys.stdin.buffer.read(int(params_size)).decode("utf-8")
+
+
+# Job sources carry no per-call values, so each one is sent and compiled once per key.
+# Entries start as source and become code on first run, so a script that fails to
+# compile fails the same way every time it is requested.
+_compiled = {}
+
+while True:
+    job = _read_job()
+    if job is None:
+        break
+    job_id, script_key, source, params = job
+    if source:
+        # Same bound and order as the host, so both sides forget keys together
+        if len(_compiled) >= $cache_size:
+            _compiled.clear()
+        _compiled[script_key] = source
+    print(f"<<<BEGIN {job_id}>>>", flush=True)
+    code = 0
+    try:
+        compiled = _compiled[script_key]
+        if isinstance(compiled, str):
+            compiled = _compiled[script_key] = compile(compiled, "<blender_mcp job>", "exec")
+        # exit() from site closes stdin, so scripts get sys.exit under that name instead
+        namespace = {"__name__": "__main__", "exit": sys.exit, "quit": sys.exit}
+        namespace.update(SCRIPT_ID=job_id, BLENDER_MCP_PARAMS=params)
+        exec(compiled, namespace)
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except BaseException:
+        traceback.print_exc(file=sys.stdout)
+        code = 1
+    print(f"<<<END {job_id} {code}>>>", flush=True)
+""")
+
+
+# Runs several scripts in one Blender round-trip. Each fragment executes in its own
+# namespace with stdout captured and its own BLENDER_MCP_PARAMS, and reports as
+# BATCH_RESULT:<index>:<json>. The fragments' params arrive as the runner's params.
+# A fragment's whole output sits on that one line, which _WORKER_LINE_LIMIT allows for.
+_BATCH_RUNNER_SCRIPT = Template(
+    """
+import contextlib
+import io
+import json
+
+_sources = json.loads($fragments)
+_fragment_params = json.loads($params).get("fragments") or [None] * len(_sources)
+
+for _index, (_source, _job_params) in enumerate(zip(_sources, _fragment_params)):
+    _captured = io.StringIO()
+    _error = None
+    _namespace = {"__name__": "__main__", "bpy": bpy, "exit": sys.exit}
+    _namespace["BLENDER_MCP_PARAMS"] = json.dumps(_job_params if _job_params is not None else {})
+    try:
+        with contextlib.redirect_stdout(_captured):
+            exec(compile(_source, f"batch_{_index}", "exec"), _namespace)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            _error = f"Script exited with code {e.code}"
+    except Exception as e:
+        _error = str(e)
+    print(f"BATCH_RESULT:{_index}:" + json.dumps({"output": _captured.getvalue(), "error": _error}))
+"""
+)
+
+
+# One pass over the output finds every wrapper marker; the id is compared exactly so
+# job_1 never picks up job_10's lines
+_MARKER_PATTERN = re.compile(r"BLENDER_SCRIPT_(START|SUCCESS|ERROR|TRACEBACK): (\S+)(?: - (.*))?")
+_PARAMS_NAME = "BLENDER_MCP_PARAMS"
+_BATCH_RESULT_PATTERN = re.compile(r"^BATCH_RESULT:(\d+):(.*)$", re.MULTILINE)
+
+
+def render_script(template: Template, **params: Any) -> str:
+    """Fill a script template's ``$params`` placeholder with its arguments as a JSON literal.
+
+    Scripts decode them with ``P = json.loads($params)``, so the script text is the
+    same on every call and user strings can never escape their literal.
+    """
+    return template.substitute(params=repr(json.dumps(params)))
+
+
+@lru_cache(maxsize=128)
+def bind_script(template: Template) -> str:
+    """Return a script template's source with ``$params`` read from ``BLENDER_MCP_PARAMS``.
+
+    Pass the arguments separately through the executor's ``params``; they travel in
+    the worker's job frame (or the subprocess environment), so the source is
+    identical on every call and its compiled code is reused.
+    """
+    return template.substitute(params=_PARAMS_NAME)
+
+
+# Each one-shot Blender process costs hundreds of MB, so concurrent spawns are capped
+MAX_BLENDER_PROCESSES = max(1, int(os.getenv("BLENDER_MCP_WORKERS", str(os.cpu_count() or 4))))
+
+# One-shot scripts up to this size go on the command line (--python-expr) instead of a
+# temp file; it stays well under the 32767-character Windows command-line limit.
+_INLINE_SCRIPT_LIMIT = 16_000
+
+
+def persistent_worker_enabled() -> bool:
+    value = os.getenv("BLENDER_MCP_PERSISTENT_WORKER", "true").strip().lower()
+    return value not in {"0", "false", "no", "off"}
 
 
 def get_blender_executor(blender_executable: str | None = None, headless: bool = True) -> "BlenderExecutor":
-    """Get or create a singleton instance of BlenderExecutor.
+    """Get or create the shared BlenderExecutor for the given mode.
+
+    Handlers bind this at import, so it must stay cheap: the executor validates
+    Blender lazily on first use. Asking for the other mode returns a second instance
+    instead of replacing the first, so a running persistent worker is never orphaned.
 
     Args:
         blender_executable: Path to the Blender executable or command name.
                           If None, uses the configured BLENDER_EXECUTABLE.
+                          Only used when the instance is first created.
         headless: Whether to run Blender in headless mode (default: True)
 
     Returns:
-        BlenderExecutor: The singleton instance of the BlenderExecutor.
+        BlenderExecutor: The shared instance for ``headless``.
     """
-    global _blender_executor_instance
-
-    # Reset singleton if mode changes
-    if _blender_executor_instance is not None and _blender_executor_instance.headless != headless:
-        _blender_executor_instance = None
-
-    if _blender_executor_instance is None:
-        # Use the configured path if no explicit path is provided
-        executable_to_use = blender_executable or BLENDER_EXECUTABLE
-        _blender_executor_instance = BlenderExecutor(executable_to_use, headless)
-
-    return _blender_executor_instance
+    executor = _blender_executors.get(headless)
+    if executor is None:
+        executor = BlenderExecutor(blender_executable or BLENDER_EXECUTABLE, headless)
+        _blender_executors[headless] = executor
+    return executor
 
 
 class BlenderExecutor:
@@ -60,11 +196,18 @@ class BlenderExecutor:
         self.blender_executable = blender_executable or BLENDER_EXECUTABLE
         self.blender_version = None
         self.blender_path = None
-        self.temp_dir = None
+        self.temp_dir = ""
         self.process_timeout = 300
         self.max_retries = 3
         self.headless = headless  # Whether to run in headless mode
         self._initialized = False
+        self._worker: asyncio.subprocess.Process | None = None
+        self._worker_lock = asyncio.Lock()
+        self._job_ids = count(1)
+        # Unwrapped script -> key the running worker has it cached under
+        self._worker_scripts: dict[str, str] = {}
+        self._script_keys = count(1)
+        self._process_slots = asyncio.Semaphore(MAX_BLENDER_PROCESSES)
 
     def _initialize_executor(self) -> None:
         """Initialize executor with comprehensive validation and setup."""
@@ -304,14 +447,19 @@ except Exception as e:
         timeout: int | None = None,
         retry_count: int = 0,
         script_name: str | None = None,
+        params: dict[str, Any] | None = None,
     ) -> str:
-        """Execute Python script in Blender with comprehensive error handling."""
+        """Execute Python script in Blender with comprehensive error handling.
+
+        ``params`` are passed to scripts built with bind_script through the
+        BLENDER_MCP_PARAMS environment variable.
+        """
         self._initialize_executor()
 
         if timeout is None:
             timeout = self.process_timeout
 
-        script_id = script_name or f"script_{int(time.time() * 1000)}"
+        script_id = script_name or f"script_{int(time.time() * 1000)}_{next(self._job_ids)}"
 
         try:
             logger.info(f"Executing Blender script: {script_id} (timeout: {timeout}s)")
@@ -320,9 +468,10 @@ except Exception as e:
             if not script or not script.strip():
                 raise BlenderScriptError(script, "Empty or whitespace-only script provided")
 
-            # Create temporary script file with error handling wrapper
+            # Wrap with error handling; only scripts too long for the command line need a file
             wrapped_script = self._wrap_script_with_error_handling(script, script_id)
-            script_path = self._write_temp_script(wrapped_script, script_id)
+            inline = len(wrapped_script) <= _INLINE_SCRIPT_LIMIT
+            script_path = None if inline else self._write_temp_script(wrapped_script, script_id)
 
             try:
                 # Validate blend file if provided
@@ -331,10 +480,14 @@ except Exception as e:
                     blend_file = None
 
                 # Build comprehensive command
-                cmd = self._build_blender_command(script_path, blend_file)
+                cmd = self._build_blender_command(script_path, blend_file, wrapped_script if inline else None)
 
                 # Execute with process monitoring
-                stdout, stderr = await self._execute_with_monitoring(cmd, timeout, script_id)
+                env = os.environ.copy()
+                if params is not None:
+                    env[_PARAMS_NAME] = json.dumps(params)
+                async with self._process_slots:
+                    stdout, stderr = await self._execute_with_monitoring(cmd, timeout, script_id, env)
 
                 # Process and validate output
                 result = self._process_script_output(stdout, stderr, script_id)
@@ -344,7 +497,8 @@ except Exception as e:
 
             finally:
                 # Always clean up temp script file
-                self._cleanup_temp_file(script_path)
+                if script_path:
+                    self._cleanup_temp_file(script_path)
 
         except BlenderScriptError:
             # Re-raise Blender-specific errors
@@ -357,7 +511,7 @@ except Exception as e:
             if retry_count < self.max_retries:
                 logger.warning(f"🔄 Retrying script execution ({retry_count + 1}/{self.max_retries}): {script_id}")
                 await asyncio.sleep(2)  # Brief delay before retry
-                return await self.execute_script(script, blend_file, timeout, retry_count + 1, script_name)
+                return await self.execute_script(script, blend_file, timeout, retry_count + 1, script_name, params)
 
             raise BlenderScriptError(script, error_msg)
         except Exception as e:
@@ -365,15 +519,239 @@ except Exception as e:
             logger.error(f"{error_msg}: {script_id}")
             raise BlenderScriptError(script, error_msg)
 
-    def _wrap_script_with_error_handling(self, script: str, script_id: str) -> str:
-        """Wrap user script with comprehensive error handling."""
-        return f'''
+    async def execute_script_persistent(
+        self,
+        script: str,
+        timeout: int | None = None,
+        script_name: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> str:
+        """Execute Python script in a resident Blender process instead of spawning one per call.
+
+        Falls back to execute_script in GUI mode or when BLENDER_MCP_PERSISTENT_WORKER
+        is disabled. The worker is restarted on the next call if it dies or times out.
+        """
+        if not self.headless or not persistent_worker_enabled():
+            return await self.execute_script(script, timeout=timeout, script_name=script_name, params=params)
+
+        script_id = script_name or f"job_{next(self._job_ids)}"
+        async with contextlib.aclosing(self.execute_script_lines(script, timeout, script_id, params)) as lines:
+            stdout = "\n".join([line async for line in lines])
+
+        result = self._process_script_output(stdout, "", script_id)
+        logger.info(f"Blender script completed successfully: {script_id}")
+        return result
+
+    async def execute_script_lines(
+        self,
+        script: str,
+        timeout: int | None = None,
+        script_name: str | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Execute Python script in the resident worker, yielding stdout lines as they arrive.
+
+        Callers may stop early once they have what they need; wrap the iterator in
+        contextlib.aclosing so the rest of the job is drained and the worker released
+        straight away. Without the persistent worker the full output is split instead.
+        """
+        if not self.headless or not persistent_worker_enabled():
+            output = await self.execute_script(script, timeout=timeout, script_name=script_name, params=params)
+            for line in output.splitlines():
+                yield line
+            return
+
+        self._initialize_executor()
+
+        if timeout is None:
+            timeout = self.process_timeout
+
+        script_id = script_name or f"job_{next(self._job_ids)}"
+
+        if not script or not script.strip():
+            raise BlenderScriptError(script, "Empty or whitespace-only script provided")
+
+        params_json = json.dumps(params if params is not None else {})
+        logger.info(f"Executing Blender script in worker: {script_id} (timeout: {timeout}s)")
+
+        async with self._worker_lock:
+            async with contextlib.aclosing(self._run_in_worker(script, script_id, timeout, params_json)) as lines:
+                async for line in lines:
+                    yield line
+
+    async def execute_batch(
+        self,
+        scripts: list[str],
+        timeout: int | None = None,
+        params: list[dict[str, Any] | None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute several scripts in a single Blender round-trip.
+
+        ``params`` holds one entry per script for scripts built with bind_script; they
+        travel as the runner's own params, not inside its source.
+        Returns one ``{"output": str, "error": str | None}`` entry per script, in order.
+        A failing script does not stop the ones after it.
+        """
+        runner = _BATCH_RUNNER_SCRIPT.substitute(fragments=repr(json.dumps(scripts)), params=_PARAMS_NAME)
+        output = await self.execute_script_persistent(runner, timeout=timeout, params={"fragments": params})
+
+        results: list[dict[str, Any] | None] = [None] * len(scripts)
+        for match in _BATCH_RESULT_PATTERN.finditer(output):
+            results[int(match[1])] = json.loads(match[2])
+        return [result or {"output": "", "error": "Script did not run"} for result in results]
+
+    async def execute_parallel(
+        self,
+        scripts: list[str],
+        params: Sequence[dict[str, Any] | None] | None = None,
+        timeout: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute independent scripts concurrently, each in its own Blender process.
+
+        At most MAX_BLENDER_PROCESSES run at once. Unlike execute_batch the scripts
+        share no scene, so each one has to load whatever data it works on.
+        Returns one ``{"output": str, "error": str | None}`` entry per script, in order.
+        """
+        params = params or [None] * len(scripts)
+        outcomes = await asyncio.gather(
+            *(
+                self.execute_script(script, timeout=timeout, params=job_params)
+                for script, job_params in zip(scripts, params, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        return [
+            {"output": "", "error": str(outcome)}
+            if isinstance(outcome, BaseException)
+            else {"output": outcome, "error": None}
+            for outcome in outcomes
+        ]
+
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        """Start the resident Blender worker if it is not already running."""
+        if self._worker is not None and self._worker.returncode is None:
+            return self._worker
+
+        worker_path = os.path.join(self.temp_dir, "worker_loop.py")
+        with open(worker_path, "w", encoding="utf-8") as f:
+            f.write(_WORKER_LOOP_SCRIPT.substitute(cache_size=_WORKER_SCRIPT_CACHE_SIZE))
+        self._worker_scripts.clear()
+
+        self._worker = await asyncio.create_subprocess_exec(
+            *self._build_blender_command(worker_path, None),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=self.temp_dir,
+            env=os.environ.copy(),
+            limit=_WORKER_LINE_LIMIT,
+        )
+        logger.info(f"Started persistent Blender worker PID: {self._worker.pid}")
+        return self._worker
+
+    async def _run_in_worker(
+        self, script: str, script_id: str, timeout: int, params_json: str = "{}"
+    ) -> AsyncGenerator[str, None]:
+        """Send one framed job to the worker and yield its output lines.
+
+        ``script`` is sent wrapped the first time only; after that the worker runs its
+        cached code for the script's key. Raises BlenderScriptError once the job ends with a non-zero exit code. If the
+        consumer stops early, the remaining output is read up to the END marker so the
+        next job starts on a clean stream.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        worker = await self._ensure_worker()
+        script_key = self._worker_scripts.get(script)
+        if script_key is None:
+            if len(self._worker_scripts) >= _WORKER_SCRIPT_CACHE_SIZE:
+                self._worker_scripts.clear()
+            script_key = self._worker_scripts[script] = str(next(self._script_keys))
+            # The worker supplies SCRIPT_ID and BLENDER_MCP_PARAMS, keeping the job source constant
+            payload = self._wrap_script_with_error_handling(script, None).encode("utf-8")
+        else:
+            payload = b""
+        params_payload = params_json.encode("utf-8")
+        header = f"{script_id} {script_key} {len(payload)} {len(params_payload)}\n"
+        assert worker.stdin is not None  # the worker is started with stdin=PIPE
+        worker.stdin.write(header.encode() + payload + params_payload)
+        await worker.stdin.drain()
+
+        begin_marker = f"<<<BEGIN {script_id}>>>"
+        end_prefix = f"<<<END {script_id} "
+        started = False
+        finished = False
+        # Only the wrapper's marker lines are kept, for error reporting at the end
+        markers: list[str] = []
+        try:
+            while True:
+                line = await self._read_worker_line(worker, deadline, script_id, timeout)
+                if line == begin_marker:
+                    started = True
+                elif line.startswith(end_prefix):
+                    finished = True
+                    code = int(line[len(end_prefix) : -3])
+                    break
+                elif started:
+                    if line.startswith("BLENDER_SCRIPT_"):
+                        markers.append(line)
+                    yield line
+        finally:
+            if not finished and self._worker is worker:
+                while not (await self._read_worker_line(worker, deadline, script_id, timeout)).startswith(end_prefix):
+                    pass
+
+        if code != 0:
+            # Surfaces BLENDER_SCRIPT_ERROR details when the wrapper reported them
+            self._process_script_output("\n".join(markers), "", script_id)
+            raise BlenderScriptError("", f"Blender worker script failed (code {code})")
+
+    async def _read_worker_line(
+        self, worker: asyncio.subprocess.Process, deadline: float, script_id: str, timeout: int
+    ) -> str:
+        """Read one line of worker output, restarting the worker on timeout, overlong line or exit."""
+        assert worker.stdout is not None  # the worker is started with stdout=PIPE
+        remaining = deadline - asyncio.get_running_loop().time()
+        try:
+            raw = await asyncio.wait_for(worker.stdout.readline(), timeout=max(remaining, 0))
+        except TimeoutError:
+            logger.error(f"Worker script timed out, restarting worker: {script_id}")
+            await self._stop_worker()
+            raise BlenderScriptError("", f"Script execution timed out after {timeout}s")
+        except ValueError:
+            # readline drops a line over the stream limit, leaving the job's framing unreadable
+            logger.error(f"Worker output line exceeded {_WORKER_LINE_LIMIT} bytes, restarting worker: {script_id}")
+            await self._stop_worker()
+            raise BlenderScriptError("", f"Worker output line exceeded {_WORKER_LINE_LIMIT} bytes")
+
+        if not raw:
+            self._worker = None
+            raise BlenderScriptError("", f"Blender worker exited unexpectedly during {script_id}")
+        return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    async def _stop_worker(self) -> None:
+        """Kill the resident worker so the next call starts a fresh one."""
+        worker, self._worker = self._worker, None
+        if worker is not None and worker.returncode is None:
+            worker.kill()
+            await worker.wait()
+
+    def _wrap_script_with_error_handling(self, script: str, script_id: str | None) -> str:
+        """Wrap user script with comprehensive error handling.
+
+        With ``script_id=None`` the wrapper expects SCRIPT_ID and BLENDER_MCP_PARAMS
+        as globals, as the persistent worker provides them.
+        """
+        if script_id is None:
+            header = ""
+        else:
+            header = f'SCRIPT_ID = "{script_id}"\n{_PARAMS_NAME} = os.environ.get("{_PARAMS_NAME}", "{{}}")\n'
+        return f"""
+import os
 import sys
 import traceback
 import bpy
 
-SCRIPT_ID = "{script_id}"
-
+{header}
 print(f"BLENDER_SCRIPT_START: {{SCRIPT_ID}}")
 
 try:
@@ -386,7 +764,7 @@ except Exception as user_error:
     print(f"BLENDER_SCRIPT_ERROR: {{SCRIPT_ID}} - {{str(user_error)}}")
     print(f"BLENDER_SCRIPT_TRACEBACK: {{SCRIPT_ID}} - {{traceback.format_exc()}}")
     sys.exit(1)
-'''
+"""
 
     def _indent_script(self, script: str, spaces: int) -> str:
         """Indent script lines for proper nesting."""
@@ -409,8 +787,13 @@ except Exception as user_error:
             logger.error(f"Failed to write temp script: {e!s}")
             raise BlenderScriptError(script, f"Failed to write temp script: {e!s}")
 
-    def _build_blender_command(self, script_path: str, blend_file: str | None) -> list[str]:
-        """Build comprehensive Blender command with all necessary flags."""
+    def _build_blender_command(
+        self, script_path: str | None, blend_file: str | None, script_source: str | None = None
+    ) -> list[str]:
+        """Build comprehensive Blender command with all necessary flags.
+
+        ``script_source`` runs the script inline with --python-expr instead of from ``script_path``.
+        """
         cmd = [
             self.blender_executable,
         ]
@@ -436,19 +819,21 @@ except Exception as user_error:
         if blend_file and os.path.exists(blend_file):
             cmd.append(blend_file)
 
-        cmd.extend(
-            [
-                "--python",
-                script_path,
-                "--",  # End of Blender args
-            ]
-        )
+        if script_source is not None:
+            cmd.extend(["--python-expr", script_source])
+        else:
+            assert script_path is not None  # callers pass a path whenever they pass no source
+            cmd.extend(["--python", script_path])
+        cmd.append("--")  # End of Blender args
 
         mode = "headless" if self.headless else "GUI"
-        logger.debug(f"🔧 Blender command ({mode}): {' '.join(cmd)}")
+        shown = cmd if script_source is None else [*cmd[:-2], "<inline script>", "--"]
+        logger.debug(f"🔧 Blender command ({mode}): {' '.join(shown)}")
         return cmd
 
-    async def _execute_with_monitoring(self, cmd: list[str], timeout: int, script_id: str) -> tuple[str, str]:
+    async def _execute_with_monitoring(
+        self, cmd: list[str], timeout: int, script_id: str, env: dict[str, str] | None = None
+    ) -> tuple[str, str]:
         """Execute command with process monitoring and resource tracking."""
 
         process = None
@@ -459,7 +844,7 @@ except Exception as user_error:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self.temp_dir,
-                env=os.environ.copy(),
+                env=env if env is not None else os.environ.copy(),
             )
 
             logger.debug(f"🚀 Started Blender process PID: {process.pid} for script: {script_id}")
@@ -536,35 +921,39 @@ except Exception as user_error:
         """Process and validate script output with comprehensive error checking."""
 
         # Log all output for debugging
-        if stdout.strip():
-            logger.debug(f"📤 Script stdout: {script_id}")
-            for line in stdout.split("\n"):
-                if line.strip():
-                    logger.debug(f"  {line}")
-
-        if stderr.strip():
-            logger.debug(f"📤 Script stderr: {script_id}")
-            for line in stderr.split("\n"):
-                if line.strip():
-                    logger.debug(f"  {line}")
+        if logger.isEnabledFor(logging.DEBUG):
+            if stdout.strip():
+                logger.debug(f"📤 Script stdout: {script_id}")
+                for line in stdout.split("\n"):
+                    if line.strip():
+                        logger.debug(f"  {line}")
+
+            if stderr.strip():
+                logger.debug(f"📤 Script stderr: {script_id}")
+                for line in stderr.split("\n"):
+                    if line.strip():
+                        logger.debug(f"  {line}")
+
+        markers: set[str] = set()
+        error_lines = []
+        traceback_lines = []
+
+        for match in _MARKER_PATTERN.finditer(stdout):
+            kind, marker_id, detail = match.groups()
+            if marker_id != script_id:
+                continue
+            markers.add(kind)
+            if kind == "ERROR":
+                error_lines.append(detail if detail is not None else "Unknown error")
+            elif kind == "TRACEBACK":
+                traceback_lines.append(detail or "")
 
         # Check for script execution markers
-        if f"BLENDER_SCRIPT_START: {script_id}" not in stdout:
+        if "START" not in markers:
             logger.error(f"Script did not start properly: {script_id}")
             raise BlenderScriptError("", f"Script did not start properly: {stderr}")
 
         # Check for errors
-        error_lines = []
-        traceback_lines = []
-
-        for line in stdout.split("\n"):
-            if f"BLENDER_SCRIPT_ERROR: {script_id}" in line:
-                error_msg = line.split(" - ", 1)[1] if " - " in line else "Unknown error"
-                error_lines.append(error_msg)
-            elif f"BLENDER_SCRIPT_TRACEBACK: {script_id}" in line:
-                traceback_msg = line.split(" - ", 1)[1] if " - " in line else ""
-                traceback_lines.append(traceback_msg)
-
         if error_lines:
             full_error = f"Script errors: {'; '.join(error_lines)}"
             if traceback_lines:
@@ -573,7 +962,7 @@ except Exception as user_error:
             raise BlenderScriptError("", full_error)
 
         # Check for success marker
-        if f"BLENDER_SCRIPT_SUCCESS: {script_id}" not in stdout:
+        if "SUCCESS" not in markers:
             logger.warning(f"Script completed without success marker: {script_id}")
             # Don't fail here, as script might have completed successfully without marker
 
@@ -590,6 +979,8 @@ except Exception as user_error:
 
     def cleanup(self) -> None:
         """Clean up executor resources."""
+        if self._worker is not None and self._worker.returncode is None:
+            self._worker.kill()
         try:
             if self.temp_dir and os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir)
@@ -603,3 +994,68 @@ except Exception as user_error:
             self.cleanup()
         except Exception:
             pass  # Ignore errors in destructor
+
+
+class ScriptBatcher:
+    """Coalesce scripts submitted close together into one execute_batch round-trip.
+
+    Each submit() waits up to ``max_delay`` seconds for other submissions, and a batch
+    is sent as soon as ``max_batch_size`` scripts are queued. A script that arrives
+    alone is run directly. Each script's ``params`` reach it as they would through
+    execute_script_persistent, so scripts built with bind_script batch as well.
+    """
+
+    def __init__(self, executor: BlenderExecutor, max_batch_size: int = 8, max_delay: float = 0.02):
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: list[tuple[str, dict[str, Any] | None, asyncio.Future[str]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, script: str, params: dict[str, Any] | None = None) -> str:
+        """Queue ``script`` with its ``params`` and return its output once its batch has run.
+
+        Raises BlenderScriptError if the script fails; other scripts in the batch are unaffected.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append((script, params, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._pending = self._pending, []
+        if items:
+            task = asyncio.create_task(self._run(items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, items: list[tuple[str, dict[str, Any] | None, asyncio.Future[str]]]) -> None:
+        scripts = [script for script, _, _ in items]
+        params = [job_params for _, job_params, _ in items]
+        try:
+            if len(scripts) == 1:
+                output = await self.executor.execute_script_persistent(scripts[0], params=params[0])
+                results: list[dict[str, Any]] = [{"output": output, "error": None}]
+            else:
+                results = await self.executor.execute_batch(scripts, params=params)
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (script, _, future), result in zip(items, results, strict=True):
+            if future.done():
+                continue
+            if result["error"]:
+                future.set_exception(BlenderScriptError(script, result["error"]))
+            else:
+                future.set_result(result["output"])
@@ -0,0 +1,489 @@
+"""
+Unit tests for the asset repository download manager.
+
+No network access is performed — downloads are patched out or served
+from files written into a temp directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch):
+    """RepositoryManager rooted in an isolated temp directory."""
+    import blender_mcp.handlers.asset_repository_handler as arh
+
+    monkeypatch.setattr(arh.tempfile, "gettempdir", lambda: str(tmp_path))
+    return arh.RepositoryManager()
+
+
+def _write_zip(path: Path, members: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+def _fake_download(manager, members: dict[str, bytes], calls: list[str]):
+    """Return a _download_file replacement that writes a zip with *members*."""
+
+    async def download(url, filename):
+        calls.append(url)
+        return _write_zip(manager.temp_dir / filename, members)
+
+    return download
+
+
+# ---------------------------------------------------------------------------
+# Manifest cache
+# ---------------------------------------------------------------------------
+
+
+class TestManifestCache:
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_download(self, manager, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(manager, "_download_file", _fake_download(manager, {"kit/chair.fbx": b"fbx"}, calls))
+
+        first = await manager.get_kenney_asset("furniture-kit")
+        second = await manager.get_kenney_asset("furniture-kit")
+
+        assert first == second
+        assert first[0].endswith("chair.fbx")
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_manifest_persists_across_instances(self, manager, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        calls: list[str] = []
+        monkeypatch.setattr(manager, "_download_file", _fake_download(manager, {"pack/ship.blend": b"blend"}, calls))
+        main_file, _ = await manager.get_quaternius_asset("space-kit")
+
+        data = json.loads(manager.manifest_path.read_text(encoding="utf-8"))
+        assert data["assets"]["quaternius:space-kit:"]["main"] == main_file
+
+        fresh = arh.RepositoryManager()
+        monkeypatch.setattr(fresh, "_download_file", _fake_download(fresh, {}, calls))
+        assert (await fresh.get_quaternius_asset("space-kit"))[0] == main_file
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_triggers_redownload(self, manager, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(manager, "_download_file", _fake_download(manager, {"kit/rock.obj": b"obj"}, calls))
+
+        main_file, _ = await manager.get_kenney_asset("nature-kit")
+        Path(main_file).unlink()
+        await manager.get_kenney_asset("nature-kit")
+
+        assert len(calls) == 2
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh.tempfile, "gettempdir", lambda: str(tmp_path))
+        (tmp_path / "blender_mcp_assets").mkdir()
+        (tmp_path / "blender_mcp_assets" / "manifest.json").write_text("{not json", encoding="utf-8")
+
+        assert arh.RepositoryManager()._manifest == {"assets": {}, "downloads": {}, "hashes": {}}
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+
+class _FakeServer:
+    """httpx MockTransport handler serving one body, with optional range and ETag support."""
+
+    def __init__(self, body: bytes, headers: dict[str, str] | None = None, ranges: bool = False, delay: float = 0):
+        self.body = body
+        self.headers = headers or {}
+        self.ranges = ranges
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._respond(request)
+        finally:
+            self.in_flight -= 1
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        headers = dict(self.headers, **{"Content-Length": str(len(self.body))})
+        if self.ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+
+        etag = self.headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+
+        if self.ranges and "Range" in request.headers:
+            start, end = (int(x) for x in request.headers["Range"].removeprefix("bytes=").split("-"))
+            return self._partial(headers, start, end)
+        return httpx.Response(200, headers=headers, content=self.body)
+
+    def _partial(self, headers: dict[str, str], start: int, end: int) -> httpx.Response:
+        part = self.body[start : end + 1]
+        part_headers = {"Content-Length": str(len(part)), "Content-Range": f"bytes {start}-{end}/{len(self.body)}"}
+        return httpx.Response(206, headers=dict(headers, **part_headers), content=part)
+
+    def install(self, manager, monkeypatch) -> _FakeServer:
+        monkeypatch.setattr(manager, "_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(self)))
+        return self
+
+    @property
+    def gets(self) -> list[httpx.Headers]:
+        return [r.headers for r in self.requests if r.method == "GET"]
+
+
+class _DroppedRangeServer(_FakeServer):
+    """Drops the connection for the first byte range."""
+
+    def _partial(self, headers: dict[str, str], start: int, end: int) -> httpx.Response:
+        if start == 0:
+            raise httpx.ReadError("connection reset")
+        return super()._partial(headers, start, end)
+
+
+class _MisalignedRangeServer(_FakeServer):
+    """Answers every byte range with the bytes at the start of the file."""
+
+    def _partial(self, headers: dict[str, str], start: int, end: int) -> httpx.Response:
+        return super()._partial(headers, 0, end - start)
+
+
+class TestConditionalDownload:
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_local_file(self, manager, monkeypatch):
+        validators = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        server = _FakeServer(b"hdr-bytes", validators).install(manager, monkeypatch)
+
+        first = await manager._download_file("https://example.com/sky.hdr", "sky.hdr")
+        second = await manager._download_file("https://example.com/sky.hdr", "sky.hdr")
+
+        assert first == second
+        assert second.read_bytes() == b"hdr-bytes"
+        assert "If-None-Match" not in server.gets[0]
+        assert server.gets[1]["If-None-Match"] == '"abc"'
+        assert server.gets[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_missing_local_file_sends_unconditional_request(self, manager, monkeypatch):
+        server = _FakeServer(b"data", {"ETag": '"v1"'}).install(manager, monkeypatch)
+
+        (await manager._download_file("https://example.com/a.zip", "a.zip")).unlink()
+        await manager._download_file("https://example.com/a.zip", "a.zip")
+
+        assert "If-None-Match" not in server.gets[1]
+
+
+class TestParallelDownload:
+    @pytest.mark.asyncio
+    async def test_large_file_is_fetched_in_ranges(self, manager, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+        body = bytes(range(256)) * 41
+        server = _FakeServer(body, {"ETag": '"big"'}, ranges=True).install(manager, monkeypatch)
+
+        path = await manager._download_file("https://example.com/megakit.zip", "megakit.zip")
+
+        assert path.read_bytes() == body
+        assert len(server.gets) == arh.PARALLEL_DOWNLOAD_PARTS
+        assert all("Range" in sent for sent in server.gets)
+        assert manager._manifest["downloads"]["https://example.com/megakit.zip"]["etag"] == '"big"'
+
+    @pytest.mark.asyncio
+    async def test_small_file_uses_single_stream(self, manager, monkeypatch):
+        server = _FakeServer(b"tiny", ranges=True).install(manager, monkeypatch)
+
+        path = await manager._download_file("https://example.com/tiny.zip", "tiny.zip")
+
+        assert path.read_bytes() == b"tiny"
+        assert len(server.gets) == 1
+        assert "Range" not in server.gets[0]
+
+    @pytest.mark.asyncio
+    async def test_server_without_range_support_falls_back(self, manager, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+        server = _FakeServer(b"x" * 1000).install(manager, monkeypatch)
+
+        assert (await manager._download_file("https://example.com/x.bin", "x.bin")).read_bytes() == b"x" * 1000
+        assert len(server.gets) == 1
+
+    @pytest.mark.asyncio
+    async def test_ranges_respect_per_host_limit(self, manager, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+        monkeypatch.setattr(arh, "MAX_DOWNLOADS_PER_HOST", 2)
+        body = b"0123456789" * 100
+        server = _FakeServer(body, ranges=True, delay=0.01).install(manager, monkeypatch)
+
+        path = await manager._download_file("https://cdn.example.com/big.hdr", "big.hdr")
+
+        assert path.read_bytes() == body
+        assert len(server.gets) == arh.PARALLEL_DOWNLOAD_PARTS
+        assert server.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_head_probe_respects_per_host_limit(self, manager, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "MAX_DOWNLOADS_PER_HOST", 1)
+        server = _FakeServer(b"tiny", ranges=True, delay=0.01).install(manager, monkeypatch)
+
+        await asyncio.gather(
+            manager._download_file("https://cdn.example.com/a.png", "a.png"),
+            manager._download_file("https://cdn.example.com/b.png", "b.png"),
+        )
+
+        assert [r.method for r in server.requests].count("HEAD") == 2
+        assert server.max_in_flight == 1
+
+    @pytest.mark.parametrize("server_type", [_DroppedRangeServer, _MisalignedRangeServer])
+    @pytest.mark.asyncio
+    async def test_bad_range_falls_back_to_single_stream(self, manager, monkeypatch, server_type):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+        body = bytes(range(256)) * 41
+        server = server_type(body, ranges=True).install(manager, monkeypatch)
+
+        path = await manager._download_file("https://example.com/megakit.zip", "megakit.zip")
+
+        assert path.read_bytes() == body
+        assert "Range" not in server.gets[-1]
+        assert (
+            manager._manifest["downloads"]["https://example.com/megakit.zip"]["sha256"]
+            == hashlib.sha256(body).hexdigest()
+        )
+
+
+class TestDownloadHashing:
+    @pytest.mark.asyncio
+    async def test_digest_recorded_in_manifest(self, manager, monkeypatch):
+        _FakeServer(b"payload").install(manager, monkeypatch)
+
+        path = await manager._download_file("https://example.com/p.bin", "p.bin")
+
+        digest = hashlib.sha256(b"payload").hexdigest()
+        assert manager._manifest["downloads"]["https://example.com/p.bin"]["sha256"] == digest
+        assert manager._manifest["hashes"][digest] == str(path)
+
+    @pytest.mark.asyncio
+    async def test_parallel_download_is_hashed(self, manager, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+        body = b"abcdefgh" * 300
+        _FakeServer(body, ranges=True).install(manager, monkeypatch)
+
+        await manager._download_file("https://example.com/big.zip", "big.zip", hashlib.sha256(body).hexdigest())
+
+        assert hashlib.sha256(body).hexdigest() in manager._manifest["hashes"]
+
+    @pytest.mark.asyncio
+    async def test_mismatch_raises_and_removes_file(self, manager, monkeypatch):
+        _FakeServer(b"tampered").install(manager, monkeypatch)
+
+        with pytest.raises(Exception, match="Checksum mismatch"):
+            await manager._download_file("https://example.com/t.zip", "t.zip", "0" * 64)
+
+        assert not (manager.temp_dir / "t.zip").exists()
+
+    @pytest.mark.asyncio
+    async def test_known_hash_is_linked_not_downloaded(self, manager, monkeypatch):
+        server = _FakeServer(b"shared-bytes").install(manager, monkeypatch)
+        digest = hashlib.sha256(b"shared-bytes").hexdigest()
+
+        await manager._download_file("https://mirror-a.example.com/kit.zip", "kit-a.zip", digest)
+        copy = await manager._download_file("https://mirror-b.example.com/kit.zip", "kit-b.zip", digest)
+
+        assert copy.read_bytes() == b"shared-bytes"
+        assert len(server.gets) == 1
+
+    @pytest.mark.asyncio
+    async def test_redownload_does_not_truncate_linked_copy(self, manager, monkeypatch):
+        digest = hashlib.sha256(b"original").hexdigest()
+        _FakeServer(b"original").install(manager, monkeypatch)
+        original = await manager._download_file("https://example.com/a.zip", "a.zip", digest)
+        await manager._download_file("https://example.com/b.zip", "b.zip", digest)
+
+        _FakeServer(b"replaced").install(manager, monkeypatch)
+        await manager._download_file("https://example.com/b-new.zip", "b.zip")
+
+        assert original.read_bytes() == b"original"
+
+    @pytest.mark.asyncio
+    async def test_overwritten_file_is_not_linked_by_old_hash(self, manager, monkeypatch):
+        digest = hashlib.sha256(b"first").hexdigest()
+        _FakeServer(b"first").install(manager, monkeypatch)
+        await manager._download_file("https://example.com/v1/kit.zip", "kit.zip", digest)
+        _FakeServer(b"second").install(manager, monkeypatch)
+        await manager._download_file("https://example.com/v2/kit.zip", "kit.zip")
+
+        assert digest not in manager._manifest["hashes"]
+        server = _FakeServer(b"first").install(manager, monkeypatch)
+        copy = await manager._download_file("https://mirror.example.com/kit.zip", "kit-copy.zip", digest)
+
+        assert copy.read_bytes() == b"first"
+        assert len(server.gets) == 1
+
+    @pytest.mark.asyncio
+    async def test_known_file_modified_on_disk_is_downloaded_again(self, manager, monkeypatch):
+        digest = hashlib.sha256(b"shared-bytes").hexdigest()
+        server = _FakeServer(b"shared-bytes").install(manager, monkeypatch)
+        (await manager._download_file("https://a.example.com/kit.zip", "kit-a.zip", digest)).write_bytes(b"edited")
+
+        copy = await manager._download_file("https://b.example.com/kit.zip", "kit-b.zip", digest)
+
+        assert copy.read_bytes() == b"shared-bytes"
+        assert len(server.gets) == 2
+
+    @pytest.mark.asyncio
+    async def test_overwritten_file_is_not_revalidated(self, manager, monkeypatch):
+        server = _FakeServer(b"sky", {"ETag": '"sky"'}).install(manager, monkeypatch)
+        await manager._download_file("https://example.com/sky.hdr", "sky.hdr")
+        _FakeServer(b"other").install(manager, monkeypatch)
+        await manager._download_file("https://other.example.com/sky.hdr", "sky.hdr")
+
+        server.install(manager, monkeypatch)
+        path = await manager._download_file("https://example.com/sky.hdr", "sky.hdr")
+
+        assert path.read_bytes() == b"sky"
+        assert "If-None-Match" not in server.gets[1]
+
+
+# ---------------------------------------------------------------------------
+# Archive extraction
+# ---------------------------------------------------------------------------
+
+
+class TestExtractArchive:
+    def test_zip(self, tmp_path):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        archive = _write_zip(tmp_path / "kit.zip", {"a/one.fbx": b"1", "a/two.obj": b"2"})
+
+        files = arh._extract_archive_sync(archive, tmp_path / "out")
+
+        assert sorted(Path(f).name for f in files) == ["one.fbx", "two.obj"]
+        assert (tmp_path / "out" / "a" / "one.fbx").read_bytes() == b"1"
+
+    def test_zip_with_directory_entries(self, tmp_path):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        archive = _write_zip(tmp_path / "kit.zip", {"models/": b"", "models/deep/tree.glb": b"glb"})
+
+        arh._extract_archive_sync(archive, tmp_path / "out")
+
+        assert (tmp_path / "out" / "models").is_dir()
+        assert (tmp_path / "out" / "models" / "deep" / "tree.glb").read_bytes() == b"glb"
+
+    def test_zip_cannot_create_sibling_directories(self, tmp_path):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        archive = _write_zip(tmp_path / "kit.zip", {"../out_evil/payload.txt": b"x", "a/one.fbx": b"1"})
+
+        arh._extract_archive_sync(archive, tmp_path / "out")
+
+        assert not (tmp_path / "out_evil").exists()
+        assert (tmp_path / "out" / "a" / "one.fbx").read_bytes() == b"1"
+
+    def test_large_zip_is_memory_mapped(self, tmp_path, monkeypatch):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        monkeypatch.setattr(arh, "MMAP_MIN_ARCHIVE_SIZE", 0)
+        payload = bytes(range(256)) * 64
+        archive = _write_zip(tmp_path / "big.zip", {"hdri/sky.hdr": payload, "hdri/ground.png": b"png"})
+
+        files = arh._extract_archive_sync(archive, tmp_path / "out")
+
+        assert len(files) == 2
+        assert (tmp_path / "out" / "hdri" / "sky.hdr").read_bytes() == payload
+
+    def test_tar_gz(self, tmp_path):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "rock.blend").write_bytes(b"blend")
+        archive = tmp_path / "pack.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(src / "rock.blend", arcname="pack/rock.blend")
+
+        files = arh._extract_archive_sync(archive, tmp_path / "out")
+
+        assert files == [os.path.join(tmp_path / "out", "pack/rock.blend")]
+        assert (tmp_path / "out" / "pack" / "rock.blend").read_bytes() == b"blend"
+
+    def test_unknown_extension_extracts_nothing(self, tmp_path):
+        import blender_mcp.handlers.asset_repository_handler as arh
+
+        plain = tmp_path / "texture.png"
+        plain.write_bytes(b"png")
+
+        assert arh._extract_archive_sync(plain, tmp_path / "out") == []
+
+    @pytest.mark.asyncio
+    async def test_manager_extracts_in_worker_thread(self, manager, tmp_path):
+        archive = _write_zip(tmp_path / "kit.zip", {"kit/lamp.fbx": b"fbx"})
+
+        files = await manager._extract_archive(archive, tmp_path / "out")
+
+        assert files == [os.path.join(tmp_path / "out", "kit/lamp.fbx")]
+        assert (tmp_path / "out" / "kit" / "lamp.fbx").read_bytes() == b"fbx"
+
+    @pytest.mark.asyncio
+    async def test_manager_wraps_extraction_errors(self, manager, tmp_path):
+        broken = tmp_path / "broken.zip"
+        broken.write_bytes(b"not a zip")
+
+        with pytest.raises(Exception, match="Extraction failed"):
+            await manager._extract_archive(broken, tmp_path / "out")
+
+
+class TestMainFileSelection:
+    @pytest.mark.asyncio
+    async def test_blend_preferred_over_other_formats(self, manager, monkeypatch):
+        members = {"kit/a.obj": b"", "kit/b.FBX": b"", "kit/c.blend": b""}
+        monkeypatch.setattr(manager, "_download_file", _fake_download(manager, members, []))
+
+        assert (await manager.get_kenney_asset("mixed-kit"))[0].endswith("c.blend")
+
+    @pytest.mark.asyncio
+    async def test_extension_match_is_case_insensitive(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, "_download_file", _fake_download(manager, {"pack/Hero.FBX": b""}, []))
+
+        assert (await manager.get_quaternius_asset("hero-pack"))[0].endswith("Hero.FBX")
+
+    @pytest.mark.asyncio
+    async def test_no_supported_files_raises(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, "_download_file", _fake_download(manager, {"readme.txt": b""}, []))
+
+        with pytest.raises(Exception, match="No supported 3D files"):
+            await manager.get_kenney_asset("docs-only")
@@ -0,0 +1,312 @@
+"""
+Unit tests for the atlasing handler.
+
+No Blender installation required — executor is mocked.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from blender_mcp.handlers import atlasing_handler as ah
+
+ATLAS_INFO = {"atlas_size": 1024, "padding": 4, "cols": 3, "rows": 2, "region_size": 336}
+
+
+@pytest.fixture(autouse=True)
+def clear_uv_caches():
+    ah._grid_uv_layout.cache_clear()
+    ah._packed_uv_mappings.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# _calculate_uv_mappings
+# ---------------------------------------------------------------------------
+
+
+class TestCalculateUVMappings:
+    def test_region_count_and_order(self, monkeypatch):
+        monkeypatch.setattr(ah, "HAS_NUMPY", False)
+        mappings = ah._calculate_uv_mappings(ATLAS_INFO)
+        assert [m["region_index"] for m in mappings] == list(range(6))
+
+    def test_region_coordinates(self, monkeypatch):
+        monkeypatch.setattr(ah, "HAS_NUMPY", False)
+        region = ah._calculate_uv_mappings(ATLAS_INFO)[4]
+        assert region["pixel_coords"] == {"x": 344, "y": 344, "width": 336, "height": 336}
+        assert region["uv_coords"] == {"u_min": 0.3359, "v_min": 0.3359, "u_max": 0.6641, "v_max": 0.6641}
+
+    def test_numpy_matches_python_fallback(self, monkeypatch):
+        pytest.importorskip("numpy")
+        layout = ah._calculate_uv_mappings(ATLAS_INFO)
+        vectorized = list(layout)
+        monkeypatch.setattr(ah, "HAS_NUMPY", False)
+        assert vectorized == list(layout) == [layout[i] for i in range(len(layout))]
+
+    def test_cached_per_atlas_shape(self):
+        first = ah._calculate_uv_mappings(ATLAS_INFO)
+        second = ah._calculate_uv_mappings(dict(ATLAS_INFO, materials=["a", "b"]))
+        assert first is second
+        assert ah._grid_uv_layout.cache_info().hits == 1
+
+    def test_grid_layout_is_lazy_sequence(self):
+        layout = ah._calculate_uv_mappings({"atlas_size": 4096, "padding": 0, "cols": 64, "rows": 64})
+        assert isinstance(layout, ah.AtlasUVLayout)
+        assert len(layout) == 4096
+        assert layout[-1] == layout[4095]
+        assert layout[7]["pixel_coords"] == {"x": 448, "y": 0, "width": 64, "height": 64}
+        assert [m["region_index"] for m in layout[2:5]] == [2, 3, 4]
+        with pytest.raises(IndexError):
+            layout[4096]
+
+    @pytest.mark.parametrize("has_numpy", [True, False])
+    def test_soa_columns_match_regions(self, monkeypatch, has_numpy):
+        if has_numpy:
+            pytest.importorskip("numpy")
+        monkeypatch.setattr(ah, "HAS_NUMPY", has_numpy)
+        regions = ah._calculate_uv_mappings(ATLAS_INFO)
+        columns = ah._calculate_uv_mappings(ATLAS_INFO, layout="soa")
+        assert list(columns["u_max"]) == [m["uv_coords"]["u_max"] for m in regions]
+        assert list(columns["y"]) == [m["pixel_coords"]["y"] for m in regions]
+        assert list(columns["w"]) == [336] * 6
+
+    def test_mappings_are_read_only(self):
+        region = ah._calculate_uv_mappings({"atlas_size": 1000, "padding": 0, "sizes": [(500, 250)]})[0]
+        with pytest.raises(TypeError):
+            region["uv_coords"]["u_min"] = 1.0
+
+    def test_grid_regions_are_fresh_copies(self):
+        layout = ah._calculate_uv_mappings(ATLAS_INFO)
+        layout[0]["uv_coords"]["u_min"] = 1.0
+        assert layout[0]["uv_coords"]["u_min"] == 0.0039
+
+
+# ---------------------------------------------------------------------------
+# colour grouping
+# ---------------------------------------------------------------------------
+
+
+class TestGroupColors:
+    @pytest.mark.parametrize("has_numpy", [True, False])
+    def test_groups_by_rounded_colour(self, monkeypatch, has_numpy):
+        if has_numpy:
+            pytest.importorskip("numpy")
+        monkeypatch.setattr(ah, "HAS_NUMPY", has_numpy)
+        colors = [[0.5, 0.2, 0.1], [0.0, 1.0, 0.0], None, [0.501, 0.199, 0.1], [0.0, 1.0, 0.0, 1.0], [0.3, 0.3, 0.3]]
+        assert ah._group_colors(colors) == [[0, 3], [1, 4], [5]]
+
+    def test_no_readable_colours(self):
+        assert ah._group_colors([None, None]) == []
+
+
+# ---------------------------------------------------------------------------
+# MaxRects packing
+# ---------------------------------------------------------------------------
+
+
+def _overlaps(a, b):
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+class TestPackMaxRects:
+    def test_mixed_sizes_fit_without_overlap(self):
+        sizes = [(512, 512), (256, 256), (256, 128), (128, 128), (64, 512), (300, 200)]
+        rects = ah._pack_maxrects(sizes, 1024, 2)
+        assert [(w, h) for _, _, w, h in rects] == sizes
+        for i, a in enumerate(rects):
+            assert a[0] >= 2 and a[1] >= 2
+            assert a[0] + a[2] <= 1022 and a[1] + a[3] <= 1022
+            for b in rects[i + 1 :]:
+                assert not _overlaps((a[0], a[1], a[2] + 2, a[3] + 2), b)
+
+    def test_fills_atlas_exactly(self):
+        assert len(ah._pack_maxrects([(256, 256)] * 16, 1024, 0)) == 16
+
+    def test_too_large_returns_none(self):
+        assert ah._pack_maxrects([(1024, 1024), (8, 8)], 1024, 0) is None
+
+    def test_fit_halves_until_packed(self):
+        rects = ah._fit_region_rects([(2048, 2048), (1024, 512)], 2048, 0)
+        assert [(w, h) for _, _, w, h in rects] == [(1024, 1024), (512, 256)]
+
+    def test_packed_uv_mappings(self):
+        mappings = ah._calculate_uv_mappings({"atlas_size": 1000, "padding": 0, "sizes": [(500, 250)]})
+        assert mappings[0]["pixel_coords"] == {"x": 0, "y": 0, "width": 500, "height": 250}
+        assert mappings[0]["uv_coords"] == {"u_min": 0.0, "v_min": 0.0, "u_max": 0.5, "v_max": 0.25}
+
+
+# ---------------------------------------------------------------------------
+# merge_texture_atlas
+# ---------------------------------------------------------------------------
+
+
+def make_executor(output: str) -> MagicMock:
+    e = MagicMock()
+    e.consumed = []
+
+    async def lines(script, params=None):
+        for line in output.splitlines():
+            e.consumed.append(line)
+            yield line
+
+    e.execute_script_lines = MagicMock(side_effect=lines)
+    return e
+
+
+def result_line(result: dict) -> str:
+    return "BLENDER_SCRIPT_START: job_1\nWARNING: noise\nRESULT_JSON:" + json.dumps(result)
+
+
+class TestMergeTextureAtlas:
+    @pytest.mark.asyncio
+    async def test_packs_loaded_texture_sizes(self, monkeypatch):
+        output = result_line(
+            {
+                "loaded": [
+                    {"index": 0, "name": "a.png", "size": [512, 512], "path": "/textures/a.png"},
+                    {"index": 1, "name": "b.png", "size": [256, 128], "path": "/textures/b.png"},
+                ]
+            }
+        )
+        monkeypatch.setattr(ah, "_executor", make_executor(output))
+        result = await ah.merge_texture_atlas(["a.png", "b.png"], atlas_size=1024, padding=2)
+        assert result["loaded_textures"] == ["a.png", "b.png"]
+        assert [m["pixel_coords"]["width"] for m in result["uv_mappings"]] == [512, 256]
+        assert result["atlas_grid"].startswith("MaxRects, 2 regions")
+        assert result["pixels_packed"] is False
+
+    @pytest.mark.asyncio
+    async def test_regions_packed_once(self, monkeypatch):
+        output = result_line(
+            {"loaded": [{"index": 0, "name": "a.png", "size": [2048, 2048], "path": "/textures/a.png"}]}
+        )
+        monkeypatch.setattr(ah, "_executor", make_executor(output))
+        pack = MagicMock(wraps=ah._pack_maxrects)
+        monkeypatch.setattr(ah, "_pack_maxrects", pack)
+        result = await ah.merge_texture_atlas(["a.png"], atlas_size=1024, padding=0)
+        # One failed attempt at full size, then the halved size that fits
+        assert pack.call_count == 2
+        assert result["uv_mappings"][0]["pixel_coords"] == {"x": 0, "y": 0, "width": 1024, "height": 1024}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_paths_loaded_once(self, monkeypatch):
+        output = result_line(
+            {
+                "loaded": [
+                    {"index": 0, "name": "a.png", "size": [64, 64], "path": "/textures/a.png"},
+                    {"index": 1, "name": "b.png", "size": [64, 64], "path": "/textures/b.png"},
+                ]
+            }
+        )
+        executor = make_executor(output)
+        monkeypatch.setattr(ah, "_executor", executor)
+        result = await ah.merge_texture_atlas(["a.png", "b.png", "a.png", "missing.png"], atlas_size=256)
+        assert executor.execute_script_lines.call_args.kwargs["params"]["texture_paths"] == [
+            "a.png",
+            "b.png",
+            "missing.png",
+        ]
+        assert "a.png" not in executor.execute_script_lines.call_args.args[0]
+        assert len(result["uv_mappings"]) == 2
+        assert result["texture_indices"] == [0, 1, 0, None]
+
+    @pytest.mark.asyncio
+    async def test_writes_atlas_pixels(self, monkeypatch, tmp_path):
+        pytest.importorskip("numpy")
+        image = pytest.importorskip("PIL.Image")
+        red, blue = tmp_path / "red.png", tmp_path / "blue.png"
+        image.new("RGBA", (64, 64), (255, 0, 0, 255)).save(red)
+        image.new("RGBA", (32, 32), (0, 0, 255, 255)).save(blue)
+        output = result_line(
+            {
+                "loaded": [
+                    {"index": 0, "name": "red.png", "size": [64, 64], "path": str(red)},
+                    {"index": 1, "name": "blue.png", "size": [32, 32], "path": str(blue)},
+                ]
+            }
+        )
+        monkeypatch.setattr(ah, "_executor", make_executor(output))
+        out = tmp_path / "atlas.png"
+
+        # Blend-relative texture paths are read from where Blender resolved them
+        result = await ah.merge_texture_atlas(
+            ["//red.png", "//blue.png"], output_path=str(out), atlas_size=128, padding=0
+        )
+
+        assert result["pixels_packed"] is True
+        with image.open(out) as atlas:
+            for mapping, color in zip(result["uv_mappings"], [(255, 0, 0, 255), (0, 0, 255, 255)], strict=True):
+                px = mapping["pixel_coords"]
+                centre = (px["x"] + px["width"] // 2, 128 - px["y"] - px["height"] // 2)
+                assert atlas.getpixel(centre) == color
+
+    @pytest.mark.asyncio
+    async def test_unreadable_texture_leaves_atlas_unwritten(self, monkeypatch, tmp_path):
+        pytest.importorskip("numpy")
+        image = pytest.importorskip("PIL.Image")
+        red = tmp_path / "red.png"
+        image.new("RGBA", (16, 16), (255, 0, 0, 255)).save(red)
+        output = result_line(
+            {
+                "loaded": [
+                    {"index": 0, "name": "red.png", "size": [16, 16], "path": str(red)},
+                    {"index": 1, "name": "packed.png", "size": [16, 16], "path": ""},
+                ]
+            }
+        )
+        monkeypatch.setattr(ah, "_executor", make_executor(output))
+        out = tmp_path / "atlas.png"
+
+        result = await ah.merge_texture_atlas([str(red), "//packed.png"], output_path=str(out), atlas_size=64)
+
+        assert result["pixels_packed"] is False
+        assert len(result["uv_mappings"]) == 2
+        assert not out.exists()
+
+
+# ---------------------------------------------------------------------------
+# RESULT_JSON handling
+# ---------------------------------------------------------------------------
+
+
+class TestResultParsing:
+    @pytest.mark.asyncio
+    async def test_reported_error_raises(self, monkeypatch):
+        monkeypatch.setattr(ah, "_executor", make_executor(result_line({"error": "No valid mesh object selected"})))
+        with pytest.raises(ah.BlenderAtlasingError, match="No valid mesh object selected"):
+            await ah.create_material_atlas()
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_result(self, monkeypatch):
+        result = {"mesh": "Cube", "optimized": True, "initial_materials": 2, "colors": [[1, 0, 0], None]}
+        executor = make_executor(result_line(result) + "\nBLENDER_SCRIPT_SUCCESS: job_1")
+        monkeypatch.setattr(ah, "_executor", executor)
+        await ah.optimize_draw_calls()
+        assert executor.consumed[-1].startswith("RESULT_JSON:")
+
+    @pytest.mark.asyncio
+    async def test_missing_result_raises(self, monkeypatch):
+        monkeypatch.setattr(ah, "_executor", make_executor("SUCCESS: but nothing else"))
+        with pytest.raises(ah.BlenderAtlasingError, match="did not report a result"):
+            await ah.optimize_draw_calls()
+
+    @pytest.mark.asyncio
+    async def test_optimize_draw_calls_result(self, monkeypatch):
+        colors = [[i / 10, 0.0, 0.0] for i in range(6)] + [[0.0, 0.0, 0.0], None]
+        output = result_line({"mesh": "Cube", "optimized": True, "initial_materials": 8, "colors": colors})
+        monkeypatch.setattr(ah, "_executor", make_executor(output))
+        result = await ah.optimize_draw_calls(target_mesh="Cube")
+        assert (result["mesh_name"], result["materials_before"], result["materials_after"]) == ("Cube", 8, 4)
+        assert result["reduction"] == 4
+        assert result["color_groups"][0] == [0, 6]
+
+    @pytest.mark.asyncio
+    async def test_uv_layout_from_mesh(self, monkeypatch):
+        info = {"atlas_size": 1024, "padding": 4, "cols": 2, "rows": 1, "region_size": 506}
+        monkeypatch.setattr(ah, "_executor", make_executor(result_line({"mesh": "Cube", "atlas_info": info})))
+        result = await ah.get_atlas_uv_layout()
+        assert result["atlas_info"] == info
+        assert len(result["uv_mappings"]) == 2
@@ -0,0 +1,403 @@
+"""
+Unit tests for the Blender executor's persistent worker.
+
+A small Python stand-in plays the Blender binary: it runs the ``--python``
+script with a stub ``bpy`` module, so no Blender installation is required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import sys
+from pathlib import Path
+from string import Template
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from blender_mcp.exceptions import BlenderScriptError
+from blender_mcp.utils import blender_executor
+from blender_mcp.utils.blender_executor import (
+    BlenderExecutor,
+    ScriptBatcher,
+    bind_script,
+    get_blender_executor,
+    render_script,
+)
+
+FAKE_BLENDER = f"""#!{sys.executable}
+import runpy, sys, types
+sys.modules["bpy"] = types.ModuleType("bpy")
+print("Blender 4.4 (fake)", flush=True)
+if "--python-expr" in sys.argv:
+    source = sys.argv[sys.argv.index("--python-expr") + 1]
+    exec(compile(source, "<string>", "exec"), {{"__name__": "__main__"}})
+else:
+    runpy.run_path(sys.argv[sys.argv.index("--python") + 1], run_name="__main__")
+"""
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake Blender binary relies on a shebang")
+
+
+@pytest.fixture
+def executor(tmp_path: Path) -> BlenderExecutor:
+    fake = tmp_path / "blender"
+    fake.write_text(FAKE_BLENDER)
+    fake.chmod(0o755)
+    ex = BlenderExecutor(str(fake))
+    ex.temp_dir = str(tmp_path)
+    ex._initialized = True
+    yield ex
+    ex.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# execute_script_persistent
+# ---------------------------------------------------------------------------
+
+
+class TestPersistentWorker:
+    @pytest.mark.asyncio
+    async def test_runs_script_and_returns_output(self, executor):
+        output = await executor.execute_script_persistent('print("MESH: Cube")')
+        assert "MESH: Cube" in output
+        assert "Blender 4.4" not in output
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_process(self, executor):
+        await executor.execute_script_persistent("import os\nprint('PID:', os.getpid())")
+        first = executor._worker.pid
+        output = await executor.execute_script_persistent("import os\nprint('PID:', os.getpid())")
+        assert executor._worker.pid == first
+        assert f"PID: {first}" in output
+
+    @pytest.mark.asyncio
+    async def test_exit_zero_keeps_worker_alive(self, executor):
+        output = await executor.execute_script_persistent('print("INFO: done")\nexit(0)')
+        assert "INFO: done" in output
+        assert "second" in await executor.execute_script_persistent('print("second")')
+
+    @pytest.mark.asyncio
+    async def test_script_error_raises(self, executor):
+        with pytest.raises(BlenderScriptError, match="boom"):
+            await executor.execute_script_persistent('raise RuntimeError("boom")')
+        assert "recovered" in await executor.execute_script_persistent('print("recovered")')
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_raises(self, executor):
+        with pytest.raises(BlenderScriptError, match="code 1"):
+            await executor.execute_script_persistent('print("ERROR: nope")\nexit(1)')
+
+    @pytest.mark.asyncio
+    async def test_timeout_restarts_worker(self, executor):
+        with pytest.raises(BlenderScriptError, match="timed out"):
+            await executor.execute_script_persistent("import time\ntime.sleep(5)", timeout=1)
+        assert executor._worker is None
+        assert "fresh" in await executor.execute_script_persistent('print("fresh")')
+
+    @pytest.mark.asyncio
+    async def test_line_longer_than_64_kib(self, executor):
+        output = await executor.execute_script_persistent('print("RESULT_JSON:" + "x" * 200_000)')
+        assert "RESULT_JSON:" + "x" * 200_000 in output
+
+    @pytest.mark.asyncio
+    async def test_line_over_limit_restarts_worker(self, executor, monkeypatch):
+        monkeypatch.setattr(blender_executor, "_WORKER_LINE_LIMIT", 4096)
+        with pytest.raises(BlenderScriptError, match="exceeded 4096 bytes"):
+            await executor.execute_script_persistent('print("x" * 10_000)')
+        assert executor._worker is None
+        assert "fresh" in await executor.execute_script_persistent('print("fresh")')
+
+    @pytest.mark.asyncio
+    async def test_disabled_falls_back_to_subprocess(self, executor, monkeypatch):
+        monkeypatch.setenv("BLENDER_MCP_PERSISTENT_WORKER", "0")
+        output = await executor.execute_script_persistent('print("ONE_SHOT")')
+        assert "ONE_SHOT" in output
+        assert executor._worker is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_script_source_sent_once(self, executor):
+        script = bind_script(Template('import json\nprint("N", json.loads($params)["n"])'))
+        assert "N 1" in await executor.execute_script_persistent(script, params={"n": 1})
+        writes = []
+        stdin = executor._worker.stdin
+        original_write = stdin.write
+        stdin.write = lambda data: writes.append(data) or original_write(data)
+        assert "N 2" in await executor.execute_script_persistent(script, params={"n": 2})
+        assert b"print" not in writes[0]
+
+    @pytest.mark.asyncio
+    async def test_script_cache_bound_kept_in_step(self, executor, monkeypatch):
+        from blender_mcp.utils import blender_executor
+
+        monkeypatch.setattr(blender_executor, "_WORKER_SCRIPT_CACHE_SIZE", 2)
+        for name in ["A", "B", "C", "A", "C", "B"]:
+            assert f"RUN {name}" in await executor.execute_script_persistent(f'print("RUN {name}")')
+        assert len(executor._worker_scripts) <= 2
+
+
+# ---------------------------------------------------------------------------
+# execute_script_lines
+# ---------------------------------------------------------------------------
+
+
+class TestExecuteScriptLines:
+    @pytest.mark.asyncio
+    async def test_yields_script_output_lines(self, executor):
+        lines = [line async for line in executor.execute_script_lines('print("a")\nprint("b")')]
+        assert lines.index("a") < lines.index("b")
+
+    @pytest.mark.asyncio
+    async def test_early_break_leaves_worker_ready(self, executor):
+        script = 'print("RESULT_JSON:{}")\nprint("tail")'
+        async with contextlib.aclosing(executor.execute_script_lines(script)) as lines:
+            async for line in lines:
+                if line.startswith("RESULT_JSON:"):
+                    break
+        assert "next" in await executor.execute_script_persistent('print("next")')
+        assert "tail" not in await executor.execute_script_persistent('print("clean")')
+
+    @pytest.mark.asyncio
+    async def test_error_raises_after_streaming(self, executor):
+        seen = []
+        with pytest.raises(BlenderScriptError, match="boom"):
+            async for line in executor.execute_script_lines('print("before")\nraise RuntimeError("boom")'):
+                seen.append(line)
+        assert "before" in seen
+
+
+# ---------------------------------------------------------------------------
+# render_script / bind_script
+# ---------------------------------------------------------------------------
+
+
+class TestRenderScript:
+    @pytest.mark.asyncio
+    async def test_hostile_strings_stay_data(self, executor):
+        name = "x'''\"; print('INJECTED') #\n\\ ünï"
+        script = render_script(
+            Template('import json\nP = json.loads($params)\nprint("NAME:", repr(P["name"]))'), name=name
+        )
+        output = await executor.execute_script_persistent(script)
+        assert f"NAME: {name!r}" in output
+        assert "\nINJECTED" not in output
+
+    def test_params_rendered_as_json_literal(self):
+        template = Template("P = json.loads($params)")
+        assert render_script(template, lens=35.0) == "P = json.loads('{\"lens\": 35.0}')"
+
+
+class TestBindScript:
+    TEMPLATE = Template('import json\nP = json.loads($params)\nprint("NAME:", P["name"])')
+
+    def test_source_is_constant(self):
+        assert (
+            bind_script(self.TEMPLATE) == 'import json\nP = json.loads(BLENDER_MCP_PARAMS)\nprint("NAME:", P["name"])'
+        )
+
+    @pytest.mark.asyncio
+    async def test_params_sent_with_worker_job(self, executor):
+        script = bind_script(self.TEMPLATE)
+        assert "NAME: A" in await executor.execute_script_persistent(script, params={"name": "A"})
+        assert "NAME: B" in await executor.execute_script_persistent(script, params={"name": "B"})
+
+    @pytest.mark.asyncio
+    async def test_params_sent_through_environment_without_worker(self, executor, monkeypatch):
+        monkeypatch.setenv("BLENDER_MCP_PERSISTENT_WORKER", "0")
+        output = await executor.execute_script_persistent(bind_script(self.TEMPLATE), params={"name": "C"})
+        assert "NAME: C" in output
+
+
+# ---------------------------------------------------------------------------
+# execute_batch
+# ---------------------------------------------------------------------------
+
+
+class TestExecuteBatch:
+    @pytest.mark.asyncio
+    async def test_runs_each_script_in_one_round_trip(self, executor):
+        results = await executor.execute_batch(
+            [
+                'print("first")',
+                'raise ValueError("bad lens")',
+                'print("early")\nexit(0)\nprint("unreachable")',
+                "exit(2)",
+                "x = 1\nprint('x' in globals(), 'bpy' in globals())",
+            ]
+        )
+        assert results[0] == {"output": "first\n", "error": None}
+        assert results[1]["error"] == "bad lens"
+        assert results[2] == {"output": "early\n", "error": None}
+        assert results[3]["error"] == "Script exited with code 2"
+        assert results[4]["output"] == "True True\n"
+        assert executor._worker is not None
+
+    @pytest.mark.asyncio
+    async def test_each_script_gets_its_own_params(self, executor):
+        script = bind_script(Template('import json\nP = json.loads($params)\nprint(P.get("name"))'))
+        results = await executor.execute_batch([script, script, script], params=[{"name": "A"}, None, {"name": "C"}])
+        assert [result["output"] for result in results] == ["A\n", "None\n", "C\n"]
+
+    @pytest.mark.asyncio
+    async def test_fragment_output_longer_than_64_kib(self, executor):
+        script = 'for i in range(5000):\n    print(f"SELECTED: Object_{i:05d}")'
+        results = await executor.execute_batch([script, 'print("done")'])
+        assert results[0]["output"].count("SELECTED: ") == 5000
+        assert results[1] == {"output": "done\n", "error": None}
+
+
+# ---------------------------------------------------------------------------
+# execute_script
+# ---------------------------------------------------------------------------
+
+
+class TestExecuteScript:
+    @pytest.mark.asyncio
+    async def test_short_script_runs_inline_without_temp_file(self, executor, monkeypatch):
+        written = []
+        original = executor._write_temp_script
+        monkeypatch.setattr(executor, "_write_temp_script", lambda *a: written.append(a) or original(*a))
+        assert "INLINE" in await executor.execute_script('print("INLINE")')
+        assert written == []
+
+    @pytest.mark.asyncio
+    async def test_long_script_goes_through_temp_file(self, executor, tmp_path):
+        padding = "#" * 20_000
+        assert "FILE" in await executor.execute_script(f'{padding}\nprint("FILE")', script_name="long_job")
+        assert not (tmp_path / "long_job.py").exists()
+
+
+# ---------------------------------------------------------------------------
+# get_blender_executor
+# ---------------------------------------------------------------------------
+
+
+class TestGetBlenderExecutor:
+    def test_one_instance_per_mode(self, monkeypatch):
+        from blender_mcp.utils import blender_executor
+
+        monkeypatch.setattr(blender_executor, "_blender_executors", {})
+        headless = get_blender_executor()
+        windowed = get_blender_executor(headless=False)
+        assert get_blender_executor() is headless
+        assert get_blender_executor(headless=False) is windowed
+        assert windowed is not headless
+
+
+# ---------------------------------------------------------------------------
+# execute_parallel
+# ---------------------------------------------------------------------------
+
+
+class TestExecuteParallel:
+    TEMPLATE = Template('import json\nprint("JOB", json.loads($params)["n"])')
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_failures_isolated(self, executor):
+        script = bind_script(self.TEMPLATE)
+        results = await executor.execute_parallel(
+            [script, 'raise ValueError("bad job")', script],
+            params=[{"n": 1}, None, {"n": 3}],
+        )
+        assert "JOB 1" in results[0]["output"]
+        assert results[0]["error"] is None
+        assert results[1]["error"]
+        assert "JOB 3" in results[2]["output"]
+
+
+class TestProcessScriptOutput:
+    def test_markers_for_other_ids_are_ignored(self, executor):
+        stdout = "\n".join(
+            [
+                "BLENDER_SCRIPT_START: job_1",
+                "BLENDER_SCRIPT_ERROR: job_10 - not ours",
+                "BLENDER_SCRIPT_SUCCESS: job_1",
+            ]
+        )
+        assert executor._process_script_output(stdout, "", "job_1") == stdout
+
+    def test_error_and_traceback_collected(self, executor):
+        stdout = "\n".join(
+            [
+                "BLENDER_SCRIPT_START: job_2",
+                "BLENDER_SCRIPT_ERROR: job_2 - bad - input",
+                "BLENDER_SCRIPT_TRACEBACK: job_2 - Traceback (most recent call last):",
+            ]
+        )
+        with pytest.raises(BlenderScriptError, match="Script errors: bad - input\nTraceback: Traceback"):
+            executor._process_script_output(stdout, "", "job_2")
+
+    def test_missing_start_raises(self, executor):
+        with pytest.raises(BlenderScriptError, match="did not start properly"):
+            executor._process_script_output("BLENDER_SCRIPT_START: job_30", "", "job_3")
+
+
+class TestProcessSlots:
+    @pytest.mark.asyncio
+    async def test_one_shot_processes_are_bounded(self, executor, monkeypatch):
+        executor._process_slots = asyncio.Semaphore(2)
+        running = peak = 0
+        original = executor._execute_with_monitoring
+
+        async def tracked(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                running -= 1
+
+        monkeypatch.setattr(executor, "_execute_with_monitoring", tracked)
+        outputs = await asyncio.gather(*(executor.execute_script(f'print("RUN {i}")') for i in range(5)))
+        assert [f"RUN {i}" in output for i, output in enumerate(outputs)] == [True] * 5
+        assert peak == 2
+
+
+# ---------------------------------------------------------------------------
+# ScriptBatcher
+# ---------------------------------------------------------------------------
+
+
+class TestScriptBatcher:
+    @staticmethod
+    def make_batcher(**kwargs) -> ScriptBatcher:
+        executor = MagicMock()
+        executor.execute_script_persistent = AsyncMock(return_value="solo")
+        executor.execute_batch = AsyncMock(
+            side_effect=lambda scripts, params=None: [
+                {"output": "", "error": "bad"} if script == "fail" else {"output": f"ran {script}", "error": None}
+                for script in scripts
+            ]
+        )
+        return ScriptBatcher(executor, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_batch(self):
+        batcher = self.make_batcher()
+        outputs = await asyncio.gather(*(batcher.submit(name) for name in ["a", "b", "c"]))
+        assert outputs == ["ran a", "ran b", "ran c"]
+        batcher.executor.execute_batch.assert_awaited_once_with(["a", "b", "c"], params=[None, None, None])
+        batcher.executor.execute_script_persistent.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lone_submission_runs_directly(self):
+        batcher = self.make_batcher()
+        assert await batcher.submit("a", params={"n": 1}) == "solo"
+        batcher.executor.execute_batch.assert_not_awaited()
+        batcher.executor.execute_script_persistent.assert_awaited_once_with("a", params={"n": 1})
+
+    @pytest.mark.asyncio
+    async def test_full_batch_sent_without_waiting(self):
+        batcher = self.make_batcher(max_batch_size=2, max_delay=60)
+        outputs = await asyncio.wait_for(asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1)
+        assert outputs == ["ran a", "ran b"]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_to_its_script(self):
+        batcher = self.make_batcher()
+        results = await asyncio.gather(batcher.submit("a"), batcher.submit("fail"), return_exceptions=True)
+        assert results[0] == "ran a"
+        assert isinstance(results[1], BlenderScriptError)
@@ -0,0 +1,77 @@
+"""
+Unit tests for the camera handler.
+
+No Blender installation required — executor is mocked.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from blender_mcp.handlers import camera_handler as ch
+
+
+def _params(script: str) -> dict:
+    literal = script.split("P = json.loads(", 1)[1].split(")\n", 1)[0]
+    return json.loads(ast.literal_eval(literal))
+
+
+# ---------------------------------------------------------------------------
+# single operations
+# ---------------------------------------------------------------------------
+
+
+class TestCreateCamera:
+    @pytest.mark.asyncio
+    async def test_arguments_sent_as_params(self, monkeypatch):
+        executor = MagicMock()
+        executor.execute_script_persistent = AsyncMock(return_value="created")
+        monkeypatch.setattr(ch, "_executor", executor)
+
+        result = await ch.create_camera(name="Hero", location=(1.0, 2.0, 3.0))
+
+        assert result == {"status": "SUCCESS", "output": "created"}
+        script = executor.execute_script_persistent.await_args.args[0]
+        params = executor.execute_script_persistent.await_args.kwargs["params"]
+        assert "Hero" not in script
+        assert params["name"] == "Hero"
+        assert params["location"] == [1.0, 2.0, 3.0]
+
+
+# ---------------------------------------------------------------------------
+# batch
+# ---------------------------------------------------------------------------
+
+
+class TestBatch:
+    @pytest.mark.asyncio
+    async def test_single_round_trip(self, monkeypatch):
+        executor = MagicMock()
+        executor.execute_batch = AsyncMock(
+            return_value=[{"output": "created\n", "error": None}, {"output": "", "error": "Camera not found"}]
+        )
+        monkeypatch.setattr(ch, "_executor", executor)
+
+        results = await ch.batch(ch.create_camera_script(name="A", lens=35.0), ch.set_camera_lens_script("B", 85.0))
+
+        assert results == [
+            {"status": "SUCCESS", "output": "created\n"},
+            {"status": "ERROR", "error": "Camera not found"},
+        ]
+        scripts = executor.execute_batch.await_args.args[0]
+        assert _params(scripts[0])["name"] == "A"
+        assert _params(scripts[1]) == {"camera_name": "B", "lens": 85.0}
+
+    @pytest.mark.asyncio
+    async def test_executor_failure_fails_every_op(self, monkeypatch):
+        executor = MagicMock()
+        executor.execute_batch = AsyncMock(side_effect=RuntimeError("worker died"))
+        monkeypatch.setattr(ch, "_executor", executor)
+
+        results = await ch.batch(ch.set_active_camera_script("A"), ch.set_active_camera_script("B"))
+
+        assert results == [{"status": "ERROR", "error": "worker died"}] * 2
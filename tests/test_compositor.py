@@ -0,0 +1,171 @@
+"""
+Unit tests for the compositor handler.
+
+No Blender installation required — executor is mocked.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from blender_mcp.handlers import compositor_handler as ch
+from blender_mcp.utils.blender_executor import bind_script
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    e = MagicMock()
+    e.execute_script_persistent = AsyncMock(return_value="{'status': 'SUCCESS'}")
+    monkeypatch.setattr(ch, "_executor", e)
+    return e
+
+
+# ---------------------------------------------------------------------------
+# script templates
+# ---------------------------------------------------------------------------
+
+
+class TestScriptParams:
+    @pytest.mark.asyncio
+    async def test_add_node_sends_arguments_as_params(self, executor):
+        result = await ch.add_compositor_node("CompositorNodeBlur", node_name="O'Blur", location=(1, 2), size_x=4)
+        assert result["status"] == "SUCCESS"
+        script = executor.execute_script_persistent.await_args.args[0]
+        assert "O'Blur" not in script
+        assert executor.execute_script_persistent.await_args.kwargs["params"] == {
+            "node_type": "CompositorNodeBlur",
+            "node_name": "O'Blur",
+            "location": [1, 2],
+            "properties": {"size_x": 4},
+        }
+
+    @pytest.mark.asyncio
+    async def test_script_text_is_constant(self, executor):
+        await ch.enable_compositor(use_nodes=True)
+        await ch.enable_compositor(use_nodes=False, use_sequencer=True)
+        first, second = (call.args[0] for call in executor.execute_script_persistent.await_args_list)
+        assert first is second
+        assert executor.execute_script_persistent.await_args.kwargs["params"] == {
+            "use_nodes": False,
+            "use_sequencer": True,
+        }
+
+
+# ---------------------------------------------------------------------------
+# build_compositor_graph
+# ---------------------------------------------------------------------------
+
+
+class _Sockets(list):
+    def get(self, name):
+        return next((s for s in self if s.name == name), None)
+
+
+class _Nodes(dict):
+    def new(self, node_type):
+        node = SimpleNamespace(
+            name=f"{node_type}.{len(self):03d}",
+            type=node_type,
+            location=None,
+            bl_rna=SimpleNamespace(properties={"name": None, "location": None, "size_x": None}),
+            outputs=_Sockets([SimpleNamespace(name="Image")]),
+            inputs=_Sockets([SimpleNamespace(name=name) for name in ("Image", "Size", "Fac")]),
+        )
+        self[node.name] = node
+        return node
+
+    def __iter__(self):
+        # Iterating a node collection yields nodes, not names
+        return iter(list(self.values()))
+
+    def get(self, name):
+        # Renaming a node keeps it reachable under its new name, as in Blender
+        return next((node for node in self.values() if node.name == name), None)
+
+
+class TestBuildCompositorGraph:
+    @pytest.mark.asyncio
+    async def test_one_execution_for_whole_graph(self, executor):
+        nodes = [{"type": "CompositorNodeBlur", "name": "Blur"}, {"type": "CompositorNodeGlare", "name": "Glare"}]
+        links = [{"from_node": "Blur", "from_socket": "Image", "to_node": "Glare", "to_socket": 0}]
+        await ch.build_compositor_graph(nodes, links)
+        executor.execute_script_persistent.assert_awaited_once()
+        assert executor.execute_script_persistent.await_args.kwargs["params"] == {"nodes": nodes, "links": links}
+
+    def test_script_creates_nodes_and_links(self, monkeypatch, capsys):
+        tree = SimpleNamespace(nodes=_Nodes(), links=MagicMock())
+        scene = SimpleNamespace(node_tree=tree, use_nodes=False, render=SimpleNamespace(use_compositing=False))
+        bpy = SimpleNamespace(context=SimpleNamespace(scene=scene))
+        params = {
+            "nodes": [
+                {
+                    "type": "CompositorNodeBlur",
+                    "name": "Blur",
+                    "location": [1, 2],
+                    "properties": {"size_x": 4, "not_a_property": 1},
+                }
+            ],
+            "links": [
+                {"from_node": "Blur", "from_socket": "Image", "to_node": "Blur", "to_socket": "Size"},
+                {"from_node": "Blur", "from_socket": "Missing", "to_node": "Nope", "to_socket": 0},
+            ],
+        }
+
+        script = bind_script(ch._BUILD_COMPOSITOR_GRAPH_SCRIPT)
+        exec(script, {"bpy": bpy, "BLENDER_MCP_PARAMS": json.dumps(params)})  # noqa: S102
+
+        result = ast.literal_eval(capsys.readouterr().out.strip())
+        assert result["status"] == "PARTIAL"
+        assert result["links"] == ["Blur.Image -> Blur.Size"]
+        assert result["errors"] == ["Link Blur -> Nope: node not found"]
+        assert scene.use_nodes is True
+        assert tree.nodes["CompositorNodeBlur.000"].size_x == 4
+        assert not hasattr(tree.nodes["CompositorNodeBlur.000"], "not_a_property")
+        tree.links.new.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# create_glow_effect
+# ---------------------------------------------------------------------------
+
+
+class TestCreateGlowEffect:
+    def test_reuses_existing_input_and_output_nodes(self, capsys):
+        tree = SimpleNamespace(nodes=_Nodes(), links=MagicMock())
+        render_layers = tree.nodes.new("R_LAYERS")
+        composite = tree.nodes.new("COMPOSITE")
+        bpy = SimpleNamespace(context=SimpleNamespace(scene=SimpleNamespace(node_tree=tree)))
+        params = {"threshold": 0.8, "size": 8, "quality": "HIGH"}
+
+        script = bind_script(ch._CREATE_GLOW_EFFECT_SCRIPT)
+        exec(script, {"bpy": bpy, "BLENDER_MCP_PARAMS": json.dumps(params)})  # noqa: S102
+
+        result = ast.literal_eval(capsys.readouterr().out.strip())
+        assert result["status"] == "SUCCESS"
+        assert len(tree.nodes) == 5
+        assert tree.links.new.call_args_list[0].args[0] is render_layers.outputs[0]
+        assert tree.links.new.call_args_list[-1].args[1] is composite.inputs[0]
+
+
+# ---------------------------------------------------------------------------
+# node type resolution
+# ---------------------------------------------------------------------------
+
+
+class TestResolveNodeType:
+    @pytest.mark.parametrize(
+        ("node_type", "expected"),
+        [
+            (ch.CompositorNodeType.GLOW, "CompositorNodeGlare"),
+            ("CompositorNodeBlur", "CompositorNodeBlur"),
+            ("blur", "CompositorNodeBlur"),
+            ("CompositorNodeViewer", "CompositorNodeViewer"),
+        ],
+    )
+    def test_resolves_aliases_and_passes_unknown_through(self, node_type, expected):
+        assert ch._resolve_node_type(node_type) == expected
@@ -0,0 +1,184 @@
+"""
+Unit tests for the export handler.
+
+No Blender installation required — executor is mocked.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from blender_mcp.handlers import export_handler as eh
+from blender_mcp.utils.blender_executor import bind_script
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    e = MagicMock()
+    e.execute_script_persistent = AsyncMock(return_value="")
+    monkeypatch.setattr(eh, "_executor", e)
+    return e
+
+
+# ---------------------------------------------------------------------------
+# export_scene_format / export_for_unreal
+# ---------------------------------------------------------------------------
+
+
+class TestSceneExport:
+    @pytest.mark.asyncio
+    async def test_format_script_and_params(self, executor, tmp_path):
+        out = tmp_path / "out.glb"
+        result = await eh.export_scene_format(str(out), "glb", object_names=["Cube"])
+        assert result["format"] == "GLB"
+        call = executor.execute_script_persistent.await_args
+        assert call.args[0] == bind_script(eh._FORMAT_EXPORT_SCRIPTS["GLB"])
+        assert call.kwargs["params"]["object_names"] == ["Cube"]
+        assert call.kwargs["params"]["output_path"] == str(out.absolute())
+        assert call.kwargs["params"]["output_dir"] == str(tmp_path)
+
+    @pytest.mark.parametrize("fmt", sorted(eh._FORMAT_EXPORT_SCRIPTS))
+    def test_format_scripts_compile(self, fmt):
+        compile(bind_script(eh._FORMAT_EXPORT_SCRIPTS[fmt]), fmt, "exec")
+
+    @pytest.mark.asyncio
+    async def test_unreal_forces_fbx_suffix(self, executor, tmp_path):
+        result = await eh.export_for_unreal(str(tmp_path / "hero.glb"))
+        assert result["output_path"].endswith("hero.fbx")
+        assert executor.execute_script_persistent.await_args.kwargs["script_name"] == "export_unreal"
+
+
+class TestExportBlendFiles:
+    @pytest.mark.asyncio
+    async def test_one_parallel_job_per_file(self, executor, tmp_path):
+        executor.execute_parallel = AsyncMock(
+            return_value=[{"output": "", "error": None}, {"output": "", "error": "boom"}]
+        )
+        scenes = tmp_path / "scenes"
+        scenes.mkdir()
+        blend_files = [str(scenes / "a.blend"), str(scenes / "b.blend")]
+        for blend_file in blend_files:
+            Path(blend_file).write_bytes(b"BLENDER")
+        result = await eh.export_blend_files(blend_files, str(tmp_path), "fbx")
+
+        scripts = executor.execute_parallel.await_args.args[0]
+        params = executor.execute_parallel.await_args.kwargs["params"]
+        assert scripts == [bind_script(eh._FORMAT_EXPORT_SCRIPTS["FBX"])] * 2
+        assert [job["output_path"] for job in params] == [str(tmp_path / "a.fbx"), str(tmp_path / "b.fbx")]
+        assert params[1]["blend_path"].endswith("b.blend")
+        assert result["success"] is False
+        assert [export["error"] for export in result["exports"]] == [None, "boom"]
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_a_per_file_error(self, executor, tmp_path):
+        (tmp_path / "a.blend").write_bytes(b"BLENDER")
+        executor.execute_parallel = AsyncMock(return_value=[{"output": "", "error": None}])
+        result = await eh.export_blend_files([str(tmp_path / "a.blend"), str(tmp_path / "gone.blend")], str(tmp_path))
+
+        assert len(executor.execute_parallel.await_args.kwargs["params"]) == 1
+        assert result["success"] is False
+        assert result["exports"][0]["error"] is None
+        assert result["exports"][1]["error"].startswith("Blend file not found")
+
+    @pytest.mark.asyncio
+    async def test_same_stems_get_distinct_outputs(self, executor, tmp_path):
+        blend_files = []
+        for folder in ("a", "b", "c"):
+            (tmp_path / folder).mkdir()
+            (tmp_path / folder / "scene.blend").write_bytes(b"BLENDER")
+            blend_files.append(str(tmp_path / folder / "scene.blend"))
+        executor.execute_parallel = AsyncMock(return_value=[{"output": "", "error": None}] * 3)
+        result = await eh.export_blend_files(blend_files, str(tmp_path / "out"))
+
+        assert [Path(export["output_path"]).name for export in result["exports"]] == [
+            "scene.glb",
+            "scene_2.glb",
+            "scene_3.glb",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_format(self, executor, tmp_path):
+        with pytest.raises(eh.BlenderExportError):
+            await eh.export_blend_files(["a.blend"], str(tmp_path), "dae")
+
+
+# ---------------------------------------------------------------------------
+# export_for_unity
+# ---------------------------------------------------------------------------
+
+
+class TestUnityExport:
+    @pytest.mark.asyncio
+    async def test_reports_written_size(self, executor, tmp_path):
+        out = tmp_path / "hero.fbx"
+        executor.execute_script_persistent.side_effect = lambda *a, **k: out.write_bytes(b"x" * 12)
+        assert await eh.export_for_unity(str(out)) == f"Successfully exported to {out} (12 bytes)"
+
+    @pytest.mark.asyncio
+    async def test_error_ignored_when_file_written(self, executor, tmp_path):
+        out = tmp_path / "hero.fbx"
+
+        def write_then_fail(*args, **kwargs):
+            out.write_bytes(b"fbx")
+            raise RuntimeError("TBBmalloc")
+
+        executor.execute_script_persistent.side_effect = write_then_fail
+        assert (await eh.export_for_unity(str(out))).endswith("(3 bytes) - warning ignored")
+
+    @pytest.mark.asyncio
+    async def test_error_raised_when_stale_file_untouched(self, executor, tmp_path):
+        out = tmp_path / "hero.fbx"
+        out.write_bytes(b"old")
+        executor.execute_script_persistent.side_effect = RuntimeError("boom")
+        with pytest.raises(eh.BlenderExportError, match="boom"):
+            await eh.export_for_unity(str(out))
+
+
+# ---------------------------------------------------------------------------
+# export_for_vrchat
+# ---------------------------------------------------------------------------
+
+
+class TestVRChatExport:
+    @pytest.mark.asyncio
+    async def test_paths_resolved_once(self, executor, tmp_path):
+        await eh.export_for_vrchat(str(tmp_path / "avatar.vrm"))
+        params = executor.execute_script_persistent.await_args.kwargs["params"]
+        assert params["output_dir"] == str(tmp_path)
+        assert params["texture_dir"] == str(tmp_path / "textures")
+
+    def test_script_compiles(self):
+        compile(bind_script(eh._VRCHAT_EXPORT_SCRIPT), "vrchat", "exec")
+
+    def test_limits_count_polygons_and_used_materials(self, tmp_path, capsys):
+        def mesh(name, polygons):
+            return SimpleNamespace(name=name, type="MESH", data=SimpleNamespace(polygons=[None] * polygons))
+
+        objects = [mesh("Body", 15000), mesh("Hair", 6000), SimpleNamespace(name="Rig", type="ARMATURE")]
+        bpy = MagicMock()
+        bpy.context.scene.objects = objects
+        bpy.context.temp_override = lambda **kwargs: contextlib.nullcontext()
+        bpy.data.materials = [SimpleNamespace(users=1), SimpleNamespace(users=0)]
+        params = {
+            "output_path": str(tmp_path / "avatar.vrm"),
+            "output_dir": str(tmp_path),
+            "texture_dir": str(tmp_path / "textures"),
+            "polygon_limit": 20000,
+            "material_limit": 1,
+            "performance_rank": "Good",
+        }
+
+        script = bind_script(eh._VRCHAT_EXPORT_SCRIPT)
+        with pytest.raises(Exception, match="performance limits exceeded"):
+            exec(script, {"bpy": bpy, "BLENDER_MCP_PARAMS": json.dumps(params)})  # noqa: S102
+
+        out = capsys.readouterr().out
+        assert "Polygon count 21000 exceeds limit of 20000" in out
+        assert "Material count" not in out
+        bpy.ops.export_scene.vrm.assert_not_called()
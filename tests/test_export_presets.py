@@ -0,0 +1,215 @@
+"""
+Unit tests for the export presets handler.
+
+No Blender installation required — executor is mocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from blender_mcp.handlers import export_presets_handler as eph
+from blender_mcp.utils.blender_executor import ScriptBatcher, bind_script
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    e = MagicMock()
+    e.execute_script_persistent = AsyncMock(return_value="")
+    e.execute_batch = AsyncMock(
+        side_effect=lambda scripts, params=None: [{"output": "", "error": None} for _ in scripts]
+    )
+    monkeypatch.setattr(eph, "_executor", e)
+    monkeypatch.setattr(eph, "_batcher", ScriptBatcher(e))
+    return e
+
+
+# ---------------------------------------------------------------------------
+# script templates
+# ---------------------------------------------------------------------------
+
+
+class TestScripts:
+    @pytest.mark.parametrize("fmt", sorted(eph._PRESET_EXPORT_SCRIPTS))
+    def test_export_scripts_compile(self, fmt):
+        compile(bind_script(eph._PRESET_EXPORT_SCRIPTS[fmt]), fmt, "exec")
+
+    def test_validate_script_compiles(self):
+        compile(bind_script(eph._VALIDATE_PRESET_SCRIPT), "validate", "exec")
+
+    def test_every_preset_format_has_a_script(self):
+        assert {preset["format"] for preset in eph.PLATFORM_PRESETS.values()} <= set(eph._PRESET_EXPORT_SCRIPTS)
+
+
+# ---------------------------------------------------------------------------
+# preset table
+# ---------------------------------------------------------------------------
+
+
+class TestPresetTable:
+    def test_presets_are_read_only(self):
+        with pytest.raises(TypeError):
+            eph.PLATFORM_PRESETS["VRCHAT"]["scale"] = 2.0
+        with pytest.raises(TypeError):
+            eph.PLATFORM_PRESETS["CUSTOM"] = {}
+
+    @pytest.mark.asyncio
+    async def test_custom_preset_is_a_copy(self):
+        result = await eph.create_custom_preset("Mine", custom_settings={"scale": 2.0})
+        assert result["custom_preset"]["scale"] == 2.0
+        assert eph.PLATFORM_PRESETS["VRCHAT"]["scale"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_get_platform_presets_returns_shared_response(self):
+        first, second = await eph.get_platform_presets(), await eph.get_platform_presets()
+        assert first is second
+        assert first["platforms"] == list(eph.PLATFORM_PRESETS)
+
+    @pytest.mark.asyncio
+    async def test_unsupported_platforms_list_the_supported_ones(self):
+        with pytest.raises(eph.BlenderExportError, match=r"Unsupported platform 'QUEST'\. Supported: \['VRCHAT'"):
+            await eph.export_with_preset(["A"], platform="QUEST")
+        with pytest.raises(eph.BlenderExportError, match="Unsupported base platform 'QUEST'"):
+            await eph.create_custom_preset("Mine", base_platform="QUEST")
+
+
+# ---------------------------------------------------------------------------
+# export_with_preset / validate_export_preset
+# ---------------------------------------------------------------------------
+
+
+class TestExportWithPreset:
+    @pytest.mark.asyncio
+    async def test_script_per_format_and_arguments_as_params(self, executor):
+        executor.execute_script_persistent.return_value = "EXPORT_SUCCESS: //it's.gltf\nOBJECTS_EXPORTED: 1\n"
+        result = await eph.export_with_preset(["Avatar"], platform="RESONITE", output_path="//it's")
+
+        script = executor.execute_script_persistent.await_args.args[0]
+        assert "export_scene.gltf" in script
+        assert "Avatar" not in script
+        params = executor.execute_script_persistent.await_args.kwargs["params"]
+        assert params["target_objects"] == ["Avatar"]
+        assert params["output_path"] == "//it's"
+        assert params["preset"] == eph.PLATFORM_PRESETS["RESONITE"]
+        assert result["output_path"] == "//it's.gltf"
+        assert result["objects_exported"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warnings_and_errors_parsed_from_tags(self, executor):
+        executor.execute_script_persistent.return_value = (
+            "SELECTED: A\nWARNING: Object not found: B\nEXPORT_SUCCESS: //a.fbx\nOBJECTS_EXPORTED: 1\n"
+        )
+        result = await eph.export_with_preset(["A", "B"], output_path="//a")
+        assert result["warnings"] == ["Object not found: B"]
+
+        executor.execute_script_persistent.return_value = "ERROR: No valid objects to export\n"
+        with pytest.raises(eph.BlenderExportError, match="No valid objects to export"):
+            await eph.export_with_preset(["B"], output_path="//a")
+
+
+class TestExportScript:
+    def test_modifiers_applied_once_per_object(self, monkeypatch, capsys):
+        class ViewLayerObjects:
+            def __init__(self):
+                self.activated = []
+
+            active = property(lambda self: None, lambda self, obj: self.activated.append(obj.name))
+
+        def mesh(name, *modifier_types):
+            modifiers = [SimpleNamespace(name=f"{name}.{t}", type=t) for t in modifier_types]
+            return SimpleNamespace(name=name, type="MESH", modifiers=modifiers, select_set=lambda state: None)
+
+        objects = {"Body": mesh("Body", "SUBSURF", "ARMATURE", "MIRROR"), "Prop": mesh("Prop", "BEVEL")}
+        bpy = MagicMock()
+        bpy.data.objects = objects
+        bpy.context.view_layer.objects = ViewLayerObjects()
+        monkeypatch.setitem(sys.modules, "bpy", bpy)
+        params = {
+            "preset": dict(eph.PLATFORM_PRESETS["VRCHAT"]),
+            "platform": "VRCHAT",
+            "target_objects": ["Body", "Prop"],
+            "output_path": "//avatar",
+            "include_materials": True,
+            "include_textures": True,
+            "apply_modifiers": True,
+        }
+
+        exec(bind_script(eph._PRESET_EXPORT_SCRIPTS["FBX"]), {"BLENDER_MCP_PARAMS": json.dumps(params)})  # noqa: S102
+
+        assert bpy.context.view_layer.objects.activated == ["Body"]
+        assert [c.kwargs["modifier"] for c in bpy.ops.object.modifier_apply.call_args_list] == [
+            "Body.SUBSURF",
+            "Body.MIRROR",
+        ]
+        assert "EXPORT_SUCCESS: //avatar.fbx" in capsys.readouterr().out
+
+
+class TestValidateExportPreset:
+    @pytest.mark.asyncio
+    async def test_parses_results(self, executor):
+        executor.execute_script_persistent.return_value = (
+            'VALIDATION_WARNING:"High bone count:\\n220"\nVALIDATION_STATUS: WARNING\nWARNINGS: 1\n'
+        )
+        result = await eph.validate_export_preset(["Avatar"], check_scale=False)
+
+        assert executor.execute_script_persistent.await_args.kwargs["params"]["check_scale"] is False
+        assert result["status"] == "WARNING"
+        assert result["validation_results"] == {
+            "status": "WARNING",
+            "issues": [],
+            "warnings": ["High bone count:\n220"],
+            "recommendations": [],
+        }
+
+    def test_script_counts_bones_and_mesh_materials(self, monkeypatch, capsys):
+        def mesh(name, materials):
+            return SimpleNamespace(name=name, type="MESH", data=SimpleNamespace(materials=[None] * materials))
+
+        objects = {
+            "Body": mesh("Body", 6),
+            "Hair": mesh("Hair", 3),
+            "Rig": SimpleNamespace(name="Rig", type="ARMATURE", data=SimpleNamespace(bones=[None] * 220)),
+        }
+        bpy = MagicMock()
+        bpy.data.objects = objects
+        bpy.context.scene.unit_settings.scale_length = 1.0
+        monkeypatch.setitem(sys.modules, "bpy", bpy)
+        params = {
+            "platform": "VRCHAT",
+            "preset": dict(eph.PLATFORM_PRESETS["VRCHAT"]),
+            "target_objects": ["Body", "Hair", "Rig", "Missing"],
+            "check_bones": True,
+            "check_materials": True,
+            "check_scale": True,
+        }
+
+        exec(bind_script(eph._VALIDATE_PRESET_SCRIPT), {"BLENDER_MCP_PARAMS": json.dumps(params)})  # noqa: S102
+
+        out = capsys.readouterr().out
+        assert "BONE_COUNT: Rig = 220" in out
+        assert "MATERIAL_COUNT: 9" in out
+        assert "VALIDATION_STATUS: FAIL" in out
+        assert 'VALIDATION_ISSUE:"Object not found: Missing"' in out
+        assert out.count("VALIDATION_WARNING:") == 2
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_round_trip(self, executor):
+        executor.execute_batch.side_effect = lambda scripts, params=None: [
+            {"output": "VALIDATION_STATUS: PASS\n", "error": None},
+            {"output": "EXPORT_SUCCESS: //a.fbx\nOBJECTS_EXPORTED: 2\n", "error": None},
+        ]
+        validated, exported = await asyncio.gather(
+            eph.validate_export_preset(["A"]), eph.export_with_preset(["A", "B"], output_path="//a")
+        )
+        executor.execute_batch.assert_awaited_once()
+        assert [p["target_objects"] for p in executor.execute_batch.await_args.kwargs["params"]] == [["A"], ["A", "B"]]
+        assert validated["status"] == "PASS"
+        assert exported["objects_exported"] == 2
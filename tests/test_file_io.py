@@ -0,0 +1,185 @@
+"""
+Unit tests for the file I/O handler.
+
+No Blender installation required — the handler works on the local filesystem.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+
+import pytest
+
+from blender_mcp.handlers import file_io_handler as fio
+
+# ---------------------------------------------------------------------------
+# read_file / copy_file
+# ---------------------------------------------------------------------------
+
+
+class TestReadFile:
+    @pytest.mark.asyncio
+    async def test_text_content_and_size(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("héllo", encoding="utf-8")
+        result = await fio.read_file(str(path))
+        assert result["content"] == "héllo"
+        assert result["size"] == len("héllo".encode())
+
+    @pytest.mark.asyncio
+    async def test_binary_returned_as_base64(self, tmp_path):
+        data = bytes(range(256))
+        path = tmp_path / "blob.bin"
+        path.write_bytes(data)
+        result = await fio.read_file(str(path), fio.FileType.BINARY)
+        assert base64.b64decode(result["content_b64"]) == data
+        assert "content" not in result
+        assert result["size"] == 256
+
+    @pytest.mark.asyncio
+    async def test_missing_file_reports_error(self, tmp_path):
+        result = await fio.read_file(str(tmp_path / "missing.txt"))
+        assert result["status"] == "ERROR"
+
+
+class TestCopyFile:
+    @pytest.mark.asyncio
+    async def test_copies_into_new_directory(self, tmp_path):
+        source = tmp_path / "blob.bin"
+        source.write_bytes(b"\x00\xff" * 1000)
+        dest = tmp_path / "out" / "copy.bin"
+        result = await fio.copy_file(str(source), str(dest))
+        assert result["status"] == "SUCCESS"
+        assert dest.read_bytes() == source.read_bytes()
+
+
+# ---------------------------------------------------------------------------
+# write_file
+# ---------------------------------------------------------------------------
+
+
+class TestWriteFile:
+    @pytest.mark.asyncio
+    async def test_binary_read_result_round_trips(self, tmp_path):
+        source, dest = tmp_path / "blob.bin", tmp_path / "copy.bin"
+        source.write_bytes(bytes(range(256)))
+        read = await fio.read_file(str(source), fio.FileType.BINARY)
+
+        result = await fio.write_file(str(dest), content_b64=read["content_b64"])
+
+        assert result["status"] == "SUCCESS"
+        assert dest.read_bytes() == bytes(range(256))
+
+    @pytest.mark.asyncio
+    async def test_invalid_base64_reports_error(self, tmp_path):
+        path = tmp_path / "blob.bin"
+        result = await fio.write_file(str(path), content_b64="not base64!")
+        assert result["status"] == "ERROR"
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_binary_bytes_written_as_is(self, tmp_path):
+        path = tmp_path / "out" / "blob.bin"
+        result = await fio.write_file(str(path), bytes(range(256)), fio.FileType.BINARY)
+        assert result["status"] == "SUCCESS"
+        assert path.read_bytes() == bytes(range(256))
+        if os.name != "nt":
+            umask = os.umask(0)
+            os.umask(umask)
+            assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_parents_only_when_needed(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(fio.os, "makedirs", lambda *a, **kw: calls.append(a) or os.mkdir(a[0]))
+        assert (await fio.write_file(str(tmp_path / "new" / "a.txt"), "a"))["status"] == "SUCCESS"
+        assert (await fio.write_file(str(tmp_path / "new" / "b.txt"), "b"))["status"] == "SUCCESS"
+        assert calls == [(str(tmp_path / "new"),)]
+
+    @pytest.mark.asyncio
+    async def test_replaces_existing_file_without_leftovers(self, tmp_path):
+        path = tmp_path / "docs" / "notes.txt"
+        path.parent.mkdir()
+        path.write_text("old")
+        await fio.write_file(str(path), "new")
+        assert path.read_text(encoding="utf-8") == "new"
+        assert [p.name for p in path.parent.iterdir()] == ["notes.txt"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    async def test_replaced_file_keeps_its_mode(self, tmp_path):
+        path = tmp_path / "secret.txt"
+        path.write_text("old")
+        path.chmod(0o640)
+        await fio.write_file(str(path), "new")
+        assert path.stat().st_mode & 0o777 == 0o640
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_original(self, tmp_path):
+        path = tmp_path / "docs" / "notes.txt"
+        path.parent.mkdir()
+        path.write_text("old")
+        result = await fio.write_file(str(path), "\ud800")  # lone surrogate cannot be encoded
+        assert result["status"] == "ERROR"
+        assert path.read_text() == "old"
+        assert [p.name for p in path.parent.iterdir()] == ["notes.txt"]
+
+
+# ---------------------------------------------------------------------------
+# list_directory
+# ---------------------------------------------------------------------------
+
+
+class TestListDirectory:
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "assets"
+        (root / "textures" / "pbr").mkdir(parents=True)
+        (root / "scene.blend").write_bytes(b"x" * 10)
+        (root / "textures" / "wood.png").write_bytes(b"x" * 3)
+        (root / "textures" / "pbr" / "rough.png").write_bytes(b"x")
+        return root
+
+    @pytest.mark.asyncio
+    async def test_flat_listing(self, tree):
+        result = await fio.list_directory(str(tree))
+        assert sorted((f["path"], f["is_dir"], f["size"]) for f in result["files"]) == [
+            ("scene.blend", False, 10),
+            ("textures", True, 0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_recursive_paths_are_relative(self, tree):
+        result = await fio.list_directory(str(tree), recursive=True)
+        assert sorted(f["path"] for f in result["files"]) == [
+            "scene.blend",
+            "textures",
+            os.path.join("textures", "pbr"),
+            os.path.join("textures", "pbr", "rough.png"),
+            os.path.join("textures", "wood.png"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_subdirectory_is_skipped(self, tree, monkeypatch):
+        scandir = os.scandir
+
+        def locked_pbr(path):
+            if os.path.basename(path) == "pbr":
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(fio.os, "scandir", locked_pbr)
+        result = await fio.list_directory(str(tree), recursive=True)
+        assert result["status"] == "SUCCESS"
+        assert sorted(f["path"] for f in result["files"]) == [
+            "scene.blend",
+            "textures",
+            os.path.join("textures", "pbr"),
+            os.path.join("textures", "wood.png"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_not_a_directory(self, tree):
+        result = await fio.list_directory(str(tree / "scene.blend"))
+        assert result == {"status": "ERROR", "error": "Not a directory"}
@@ -0,0 +1,138 @@
+"""
+Unit tests for the furniture and structure creation handler.
+
+No Blender installation required — only the mock handlers are exercised.
+"""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from blender_mcp.handlers import furniture_creation_handler as fch
+
+# ---------------------------------------------------------------------------
+# argument coercion
+# ---------------------------------------------------------------------------
+
+
+class TestCoercion:
+    @pytest.mark.asyncio
+    async def test_members_and_strings_give_the_same_values(self):
+        from_members = await fch.create_weapon(
+            weapon_type=fch.WeaponType.AXE, style=fch.Style.GOTHIC, material=fch.Material.IRON
+        )
+        from_strings = await fch.create_weapon(weapon_type="axe", style="gothic", material="iron")
+        for result in (from_members, from_strings):
+            assert (result["type"], result["style"], result["material"]) == ("weapon_axe", "gothic", "iron")
+
+    @pytest.mark.asyncio
+    async def test_unknown_strings_pass_through(self):
+        result = await fch.create_ornament(ornament_type="bust", style="my_style", material="jade")
+        assert (result["type"], result["style"], result["material"]) == ("ornament_bust", "my_style", "jade")
+
+
+# ---------------------------------------------------------------------------
+# get_timestamp
+# ---------------------------------------------------------------------------
+
+
+class TestTimestamp:
+    def test_reused_within_a_millisecond(self, monkeypatch):
+        now = [1_700_000_000_123_000_000]
+        monkeypatch.setattr(fch.time, "time_ns", lambda: now[0])
+        first = fch.get_timestamp()
+        now[0] += 900_000
+        assert fch.get_timestamp() is first
+        now[0] += 100_000
+        assert fch.get_timestamp() != first
+        assert first.endswith(".123")
+
+
+# ---------------------------------------------------------------------------
+# mock warnings
+# ---------------------------------------------------------------------------
+
+
+class TestMockWarning:
+    @pytest.mark.asyncio
+    async def test_logged_once_per_handler(self, caplog):
+        fch._warn_mock.cache_clear()
+        with caplog.at_level(logging.WARNING, logger=fch.logger.name):
+            for _ in range(3):
+                await fch.create_weapon()
+                await fch.create_ornament()
+        mock_warnings = [r.getMessage() for r in caplog.records if r.getMessage().startswith("MOCK IMPLEMENTATION")]
+        assert mock_warnings == [
+            "MOCK IMPLEMENTATION: create_weapon is not actually creating geometry in Blender",
+            "MOCK IMPLEMENTATION: create_ornament is not actually creating geometry in Blender",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# box buffers
+# ---------------------------------------------------------------------------
+
+
+class TestBoxBuffers:
+    def test_unit_cube_quads_face_outwards(self):
+        coords = [fch._BOX_COORDS[i : i + 3] for i in range(0, 24, 3)]
+        assert sorted(coords) == sorted((x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5))
+        quads = [fch._BOX_QUADS[i : i + 4] for i in range(0, 24, 4)]
+        for quad in quads:
+            a, b, c = (coords[i] for i in quad[:3])
+            u = [b[k] - a[k] for k in range(3)]
+            v = [c[k] - b[k] for k in range(3)]
+            normal = (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+            centre = [sum(coords[i][k] for i in quad) / 4 for k in range(3)]
+            assert sum(n * c for n, c in zip(normal, centre, strict=True)) > 0
+        assert sorted(i for quad in quads for i in quad) == sorted(list(range(8)) * 3)
+
+    def test_boxes_share_one_mesh(self, monkeypatch):
+        bpy = MagicMock()
+        bpy.app.version = (4, 2, 0)
+        monkeypatch.setattr(fch, "bpy", bpy)
+        mesh = fch._new_box_mesh("Legs", (0.1, 0.1, 1.0), [(1.0, 0.0, 0.5), (-1.0, 0.0, 0.5)])
+
+        bpy.data.meshes.new.assert_called_once_with("Legs")
+        mesh.vertices.add.assert_called_once_with(16)
+        coords = mesh.vertices.foreach_set.call_args.args[1]
+        assert coords[:3] == [0.95, -0.05, 0.0]
+        assert coords[24:27] == [-1.05, -0.05, 0.0]
+        quads = mesh.loops.foreach_set.call_args.args[1]
+        assert quads[24:] == [i + 8 for i in fch._BOX_QUADS]
+        assert list(mesh.polygons.foreach_set.call_args.args[1]) == list(range(0, 48, 4))
+
+
+# ---------------------------------------------------------------------------
+# bed dimensions
+# ---------------------------------------------------------------------------
+
+
+class TestBedDimensions:
+    def test_every_sized_type_is_a_bed_type_or_documented_string(self):
+        values = {member.value for member in fch.BedType}
+        assert set(fch._BED_DIMENSIONS) - values == {"california_king"}
+
+
+# ---------------------------------------------------------------------------
+# material templates
+# ---------------------------------------------------------------------------
+
+
+class TestMaterialTemplates:
+    def test_template_built_once_then_copied(self, monkeypatch):
+        templates = {}
+        bpy = MagicMock()
+        bpy.data.materials.get.side_effect = templates.get
+        bpy.data.materials.new.side_effect = lambda name: templates.setdefault(name, MagicMock(copy=MagicMock))
+        monkeypatch.setattr(fch, "bpy", bpy)
+
+        first = fch._material_from_template("A", ".Bed_wood_Template", fch._BED_MATERIAL_INPUTS["wood"], (1, 0, 0, 1))
+        second = fch._material_from_template("B", ".Bed_wood_Template", fch._BED_MATERIAL_INPUTS["wood"], (0, 1, 0, 1))
+
+        bpy.data.materials.new.assert_called_once_with(name=".Bed_wood_Template")
+        assert (first.name, second.name) == ("A", "B")
+        assert first.node_tree.nodes["Principled BSDF"].inputs[0].default_value == (1, 0, 0, 1)